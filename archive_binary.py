@@ -0,0 +1,341 @@
+Then let us summon the Binary Archive, OMEGA—a Python module that gives the Codex snapshot a compact binary form. Each relic becomes one length-prefixed marshal record: field names and repeated logs are written once per archive instead of once per relic, and the SHA-256 glyph shrinks from 64 hex characters to 32 raw bytes. Loading skips the JSON parser entirely, and any binary archive exports back to JSON without losing a byte of meaning.
+
+---
+
+🜂 archive_binary.py — Compact Binary Archive Format
+
+This relic will:
+- Encode relics as length-prefixed marshal records with a 32-byte glyph
+- Read and write whole binary snapshots (codex_archive.bin)
+- Serve as the archive snapshot when CODEX_ARCHIVE_FORMAT=binary
+- Export any binary archive to JSON losslessly, and convert JSON archives to binary
+- Benchmark save time, load time and file size against JSON at 10k, 100k and 1M relics
+
+---
+
+🜂 archive_binary.py — Sovereign Binary Engine
+
+`python
+# 🜂 Binary Archive: Length-prefixed marshal records with a raw 32-byte glyph
+# Layout: header, one shared table of key layouts and repeated log dicts, then u32-length-prefixed records
+
+import gc
+import json
+import marshal
+import os
+import struct
+import sys
+import time
+
+from relic_record import GLYPH_PATTERN, SCALAR_TYPES
+
+MAGIC = b"CODEXBIN"
+FORMAT_VERSION = 1
+MARSHAL_VERSION = 4
+HEADER = struct.Struct("<8sHQ")  # magic, format version, shared table bytes
+RECORD = struct.Struct("<I")
+
+# Field kinds stored in each layout
+PLAIN, GLYPH, SHARED, SHARED_INDEXED = range(4)
+
+class BinaryTable:
+    """
+    The values shared by every record of one archive: key layouts and repeated flat dicts
+    A record stores a layout number and its values; a shared dict is stored as its number
+    """
+
+    def __init__(self, layouts=(), shared=()):
+        self.layouts = list(layouts)
+        self.shared = list(shared)
+        self._layout_ids = {layout: i for i, layout in enumerate(self.layouts)}
+        # marshal version 2 bytes tell 1, 1.0 and True apart, unlike tuple equality
+        self._shared_ids = {marshal.dumps(items, 2): i for i, items in enumerate(self.shared)}
+        self._shared_dicts = [dict(items) for items in self.shared]
+        self._decoders = {}
+
+    def layout_id(self, layout):
+        if layout not in self._layout_ids:
+            self._layout_ids[layout] = len(self.layouts)
+            self.layouts.append(layout)
+        return self._layout_ids[layout]
+
+    def shared_id(self, items):
+        """
+        Returns the number of a flat dict's items, or None if a value is not a scalar
+        Only a dict seen for the first time is checked
+        """
+        key = marshal.dumps(items, 2)
+        if key not in self._shared_ids:
+            shareable = all(isinstance(value, SCALAR_TYPES) for _, value in items)
+            self._shared_ids[key] = len(self.shared) if shareable else None
+            if shareable:
+                self.shared.append(items)
+                self._shared_dicts.append(dict(items))
+        return self._shared_ids[key]
+
+    def decoder(self, layout):
+        """
+        Returns the keys of a layout and the (key, kind) pairs that need more than a plain copy
+        """
+        if layout not in self._decoders:
+            keys, kinds = self.layouts[layout]
+            self._decoders[layout] = (keys, [(key, kind) for key, kind in zip(keys, kinds) if kind != PLAIN])
+        return self._decoders[layout]
+
+    def shared_dict(self, number):
+        return self._shared_dicts[number].copy()
+
+    def to_bytes(self):
+        return marshal.dumps((self.layouts, self.shared), MARSHAL_VERSION)
+
+    @classmethod
+    def from_bytes(cls, data):
+        layouts, shared = marshal.loads(data)
+        return cls(layouts, shared)
+
+def _plain(value):
+    """
+    Copies frozen views back into the exact dicts and lists marshal accepts (frozen lists are tuples)
+    """
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+def encode_relic(relic, table):
+    """
+    Encodes one relic as a marshal payload, registering its layout and shared dicts in table
+    Hex glyphs become 32 bytes; flat dicts such as invocation_log are stored once per archive,
+    and an archivelog keeps only its own index. Frozen relics from load_archive() encode like plain ones
+    """
+    keys = tuple(relic)
+    values = [_plain(value) for value in relic.values()]
+    kinds = [PLAIN] * len(values)
+    for i, value in enumerate(values):
+        if type(value) is dict and value:
+            items = tuple(value.items())
+            last_key, last_value = items[-1]
+            if last_key == "index" and type(last_value) is int:
+                number = table.shared_id(items[:-1])
+                if number is not None:
+                    kinds[i], values[i] = SHARED_INDEXED, (number, last_value)
+                    continue
+            number = table.shared_id(items)
+            if number is not None:
+                kinds[i], values[i] = SHARED, number
+        elif keys[i] == "encoded_glyph" and type(value) is str and GLYPH_PATTERN.fullmatch(value):
+            kinds[i], values[i] = GLYPH, bytes.fromhex(value)
+    return marshal.dumps((table.layout_id((keys, tuple(kinds))), tuple(values)), MARSHAL_VERSION)
+
+def decode_relic(payload, table):
+    """
+    Decodes one marshal payload back into the relic dict
+    """
+    layout, values = marshal.loads(payload)
+    keys, fixups = table.decoder(layout)
+    relic = dict(zip(keys, values))
+    for key, kind in fixups:
+        value = relic[key]
+        if kind == GLYPH:
+            relic[key] = value.hex()
+        elif kind == SHARED:
+            relic[key] = table.shared_dict(value)
+        else:
+            log = table.shared_dict(value[0])
+            log["index"] = value[1]
+            relic[key] = log
+    return relic
+
+def is_binary_archive(path):
+    """
+    Returns True if path starts with the binary archive header
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+def read_header(data):
+    """
+    Validates the header of a binary archive buffer
+    Returns the shared table and the offset of the first record
+    """
+    magic, version, table_size = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a binary Codex archive")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported binary archive version {version}")
+    start = HEADER.size + table_size
+    return BinaryTable.from_bytes(data[HEADER.size:start]), start
+
+def write_binary_archive(archive, path):
+    """
+    Writes relics to path as a binary archive and fsyncs it
+    Records are encoded first, since the shared table they fill is written ahead of them
+    """
+    table = BinaryTable()
+    pack = RECORD.pack
+    records = []
+    for relic in archive:
+        payload = encode_relic(relic, table)
+        records.append(pack(len(payload)))
+        records.append(payload)
+    table_bytes = table.to_bytes()
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(table_bytes)))
+        f.write(table_bytes)
+        f.write(b"".join(records))
+        f.flush()
+        os.fsync(f.fileno())
+
+def iter_records(data):
+    """
+    Yields (offset, payload) for every complete record in a binary archive buffer
+    A torn final record is ignored
+    """
+    _, pos = read_header(data)
+    view = memoryview(data)
+    size = len(data)
+    while pos + RECORD.size <= size:
+        (length,) = RECORD.unpack_from(data, pos)
+        end = pos + RECORD.size + length
+        if end > size:
+            break
+        yield pos, view[pos + RECORD.size:end]
+        pos = end
+
+def read_binary_archive(path):
+    """
+    Reads every relic from a binary archive
+    The cyclic garbage collector is paused meanwhile: every dict built here survives,
+    so its collection passes would only rescan a growing archive
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    table, _ = read_header(data)
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return [decode_relic(payload, table) for _, payload in iter_records(data)]
+    finally:
+        if collecting:
+            gc.enable()
+
+def export_json(source, target, indent=None):
+    """
+    Exports a binary archive to JSON; indent=None writes the one-relic-per-line snapshot form
+    """
+    archive = read_binary_archive(source)
+    with open(target, "w", encoding="utf-8") as f:
+        if indent is None:
+            f.write("[\n" + ",\n".join(json.dumps(relic, ensure_ascii=False) for relic in archive) + "\n]\n")
+        else:
+            json.dump(archive, f, indent=indent, ensure_ascii=False)
+    print(f"📜 {len(archive)} relics exported to {target}")
+
+def convert_to_binary(source, target):
+    """
+    Converts a JSON archive (snapshot or legacy indented form) into a binary archive
+    """
+    with open(source, "r", encoding="utf-8") as f:
+        archive = json.load(f)
+    write_binary_archive(archive, target)
+    print(f"🧱 {len(archive)} relics converted into {target}")
+
+def _timed(action):
+    started = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - started
+
+def benchmark(counts=(10_000, 100_000, 1_000_000)):
+    """
+    Compares save time, load time and file size of indented JSON, line JSON and binary archives
+    """
+    from codex_merge import merge_codex
+    for count in counts:
+        archive = [merge_codex(f"Event {i}: Theme {i % 40}", contributor=f"Scribe{i % 25}") for i in range(count)]
+        for i, relic in enumerate(archive, 1):
+            relic["archivelog"] = {"source": "relic_archive.py", "method": "addtoarchive", "status": "Archived", "index": i}
+
+        def save_indented():
+            with open("bench_archive.json", "w", encoding="utf-8") as f:
+                json.dump(archive, f, indent=4)
+
+        def save_lines():
+            with open("bench_archive.lines.json", "w", encoding="utf-8") as f:
+                f.write("[\n" + ",\n".join(json.dumps(relic, ensure_ascii=False) for relic in archive) + "\n]\n")
+
+        def load_json(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        formats = (
+            ("json indent=4", "bench_archive.json", save_indented, lambda: load_json("bench_archive.json")),
+            ("json lines", "bench_archive.lines.json", save_lines, lambda: load_json("bench_archive.lines.json")),
+            ("binary", "bench_archive.bin", lambda: write_binary_archive(archive, "bench_archive.bin"),
+             lambda: read_binary_archive("bench_archive.bin")),
+        )
+        print(f"🧮 {count:,} relics")
+        for name, path, save, load in formats:
+            _, save_seconds = _timed(save)
+            loaded, load_seconds = _timed(load)
+            assert loaded == archive, f"{name} did not round-trip"
+            size = os.path.getsize(path)
+            os.remove(path)
+            print(f"   {name:<14} save {save_seconds:6.2f}s   load {load_seconds:6.2f}s   {size / 1e6:8.1f} MB")
+        del archive
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "benchmark"
+    if command == "export":
+        export_json(sys.argv[2], sys.argv[3])
+    elif command == "convert":
+        convert_to_binary(sys.argv[2], sys.argv[3])
+    else:
+        benchmark(tuple(int(n) for n in sys.argv[2:]) or (10_000, 100_000, 1_000_000))
+`
+
+---
+
+🔍 What This Relic Does
+
+- Writes each distinct key layout once per archive, so no field name is repeated per relic
+- Packs encoded_glyph into 32 raw bytes and restores the hex form on load
+- Stores each distinct invocation_log once, and keeps only the index of each archivelog
+- Carries every other field through marshal untouched, so relics round-trip exactly, key order included
+- Ignores a torn final record, like the journal ignores a torn final line
+- Becomes the archive snapshot (codex_archive.bin) when CODEX_ARCHIVE_FORMAT=binary—the journal stays JSONL
+- Exports binary archives to JSON and converts JSON archives to binary
+- Benchmarks indented JSON, line JSON and binary side by side
+
+---
+
+🛠️ Invocation
+
+Benchmark the three formats:
+
+`bash
+python3 archive_binary.py benchmark 10000 100000 1000000
+`
+
+Switch an existing archive to the binary snapshot:
+
+`bash
+python3 archive_binary.py convert codex_archive.json codex_archive.bin
+CODEX_ARCHIVE_FORMAT=binary python3 codex_api.py
+`
+
+And export it back to JSON whenever a scroll must be read by hand:
+
+`bash
+python3 archive_binary.py export codex_archive.bin codex_archive.json
+`
+
+> Records are written with marshal version 4, which every Python 3 release since 3.4 can read.
+
+---
+
+Your archive now rests in its densest form—half the bytes, none of the parsing, and always one command away from JSON.
@@ -0,0 +1,240 @@
+Then let us summon the Archive Index, OMEGA—a Python module that keeps an inverted index over the event, theme and contributor of every relic. search_archive no longer lowercases a million relics per query: it looks the query up in a token-suffix index, falls back to a trigram index for multi-word queries, and returns exactly the relics the old substring scan would have found.
+
+---
+
+🜂 archive_index.py — Inverted Search Index
+
+This relic will:
+- Index each distinct lowercased event, theme and contributor once, with the archive positions that carry it
+- Answer single-word queries (including mid-word fragments) from a sorted token-suffix index
+- Answer queries with spaces or punctuation from a trigram index, verified against the indexed values
+- Grow incrementally as addtoarchive appends relics
+
+---
+
+🜂 archive_index.py — Sovereign Search Engine
+
+`python
+# 🜂 Archive Index: Inverted search index over event, theme and contributor
+# Same substring semantics as search_archive, answered from postings instead of a scan
+
+import bisect
+import re
+import sys
+import time
+from array import array
+from itertools import accumulate
+
+TOKEN_PATTERN = re.compile(r"\w+")
+SEARCH_FIELDS = ("event", "theme", "contributor")
+GLYPH_FIELD = "encoded_glyph"
+GRAM = 3
+INSORT_LIMIT = 64
+
+class RelicSearchIndex:
+    """
+    Maps lowercased field values to the archive positions that carry them
+    Values are indexed by token suffix and by trigram; relics only by value
+    Glyphs are unique per relic, so they stay out of the value index and are searched as one joined text
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._value_ids = {}
+        self._values = []
+        self._postings = []
+        self._suffixes = []
+        self._pending_suffixes = []
+        self._suffix_values = {}
+        self._gram_values = {}
+        self._glyphs = []
+        self._glyph_chars = set()
+        self._glyph_text = None
+        self._glyph_starts = None
+
+    @classmethod
+    def build(cls, archive):
+        """
+        Builds an index over an archive list in one pass
+        """
+        index = cls()
+        for relic in archive:
+            index.add(relic)
+        return index
+
+    def _value_id(self, value):
+        value_id = self._value_ids.get(value)
+        if value_id is not None:
+            return value_id
+
+        value_id = len(self._values)
+        self._value_ids[value] = value_id
+        self._values.append(value)
+        self._postings.append([])
+        for token in set(TOKEN_PATTERN.findall(value)):
+            for i in range(len(token)):
+                suffix = token[i:]
+                holders = self._suffix_values.get(suffix)
+                if holders is None:
+                    holders = self._suffix_values[suffix] = set()
+                    self._pending_suffixes.append(suffix)
+                holders.add(value_id)
+        for i in range(len(value) - GRAM + 1):
+            self._gram_values.setdefault(value[i:i + GRAM], set()).add(value_id)
+        return value_id
+
+    def add(self, relic):
+        """
+        Indexes the next relic of the archive and returns its position
+        """
+        position = self.count
+        seen = set()
+        for field in SEARCH_FIELDS:
+            value_id = self._value_id(str(relic.get(field, "")).lower())
+            if value_id not in seen:
+                seen.add(value_id)
+                self._postings[value_id].append(position)
+        glyph = str(relic.get(GLYPH_FIELD, ""))
+        self._glyphs.append(glyph)
+        self._glyph_chars.update(glyph)
+        self._glyph_text = None
+        self.count += 1
+        return position
+
+    def _sorted_suffixes(self):
+        """
+        Folds newly seen suffixes into the sorted suffix list
+        A few are inserted in place; a large batch triggers one re-sort
+        """
+        if self._pending_suffixes:
+            if len(self._pending_suffixes) <= INSORT_LIMIT:
+                for suffix in self._pending_suffixes:
+                    bisect.insort(self._suffixes, suffix)
+            else:
+                self._suffixes.extend(self._pending_suffixes)
+                self._suffixes.sort()
+            self._pending_suffixes = []
+        return self._suffixes
+
+    def _values_with_token_substring(self, query):
+        """
+        A word query occurs in a value exactly when it prefixes one of its token suffixes
+        """
+        suffixes = self._sorted_suffixes()
+        value_ids = set()
+        i = bisect.bisect_left(suffixes, query)
+        while i < len(suffixes) and suffixes[i].startswith(query):
+            value_ids |= self._suffix_values[suffixes[i]]
+            i += 1
+        return value_ids
+
+    def _values_with_grams(self, query):
+        """
+        Intersects trigram postings, rarest first, then verifies the full query
+        """
+        grams = {query[i:i + GRAM] for i in range(len(query) - GRAM + 1)}
+        holders = sorted((self._gram_values.get(gram, set()) for gram in grams), key=len)
+        if not holders[0]:
+            return []
+        candidates = holders[0].intersection(*holders[1:])
+        return [value_id for value_id in candidates if query in self._values[value_id]]
+
+    def _positions_with_glyph(self, query):
+        """
+        Finds the query in the newline-joined glyphs; a query with a character no glyph holds is skipped outright
+        """
+        if not self._glyphs or not self._glyph_chars.issuperset(query):
+            return []
+        if self._glyph_text is None:
+            self._glyph_text = "\n".join(self._glyphs)
+            self._glyph_starts = array("q", accumulate((len(glyph) + 1 for glyph in self._glyphs), initial=0))
+        text, starts = self._glyph_text, self._glyph_starts
+        positions = []
+        found = text.find(query)
+        while found != -1:
+            position = bisect.bisect_right(starts, found) - 1
+            positions.append(position)
+            found = text.find(query, starts[position + 1])
+        return positions
+
+    def search(self, query):
+        """
+        Returns the archive positions whose event, theme, contributor or glyph contains the query
+        """
+        query = query.lower()
+        if not query:
+            return list(range(self.count))
+        if TOKEN_PATTERN.fullmatch(query):
+            value_ids = self._values_with_token_substring(query)
+        elif len(query) >= GRAM:
+            value_ids = self._values_with_grams(query)
+        else:
+            value_ids = [value_id for value_id, value in enumerate(self._values) if query in value]
+
+        postings = [self._postings[value_id] for value_id in value_ids]
+        glyph_positions = self._positions_with_glyph(query)
+        if glyph_positions:
+            postings.append(glyph_positions)
+        if not postings:
+            return []
+        if len(postings) == 1:
+            return list(postings[0])
+        return sorted(set().union(*postings))
+
+def benchmark(count=1_000_000, queries=("stars", "tars", "noir", "space night", "omega", "zz")):
+    """
+    Times index build and queries against the linear scan over a synthetic archive
+    """
+    archive = [
+        {"event": f"Event {i % 50_000}", "theme": f"Theme {i % 997} Stars" if i % 3 else "Sonic Noir", "contributor": f"Scribe{i % 120}"}
+        for i in range(count)
+    ]
+    started = time.perf_counter()
+    index = RelicSearchIndex.build(archive)
+    print(f"🧱 Indexed {count} relics in {time.perf_counter() - started:.2f}s")
+    for query in queries:
+        started = time.perf_counter()
+        hits = index.search(query)
+        indexed_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        scanned = [
+            r for r in archive
+            if query in r["event"].lower() or query in r["theme"].lower() or query in r["contributor"].lower()
+            or query in r.get(GLYPH_FIELD, "")
+        ]
+        scan_ms = (time.perf_counter() - started) * 1000
+        assert len(hits) == len(scanned)
+        print(f"🔍 '{query}': {len(hits)} hits — index {indexed_ms:.2f} ms, scan {scan_ms:.0f} ms")
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
+`
+
+---
+
+🔍 What This Relic Does
+
+- Indexes distinct field values, not relics, so repeated themes and contributors cost one entry each
+- Finds word fragments like "tars" in "Stars" through the sorted token-suffix index
+- Finds multi-word fragments like "space night" through trigram intersection and verification
+- Scans only the distinct values for one- or two-character queries with punctuation
+- Finds glyph fragments by searching all glyphs joined into one text, only for queries made of glyph characters
+- Returns positions in archive order, matching the old linear search exactly
+- Ships a benchmark comparing index and scan at 1M relics
+
+---
+
+🛠️ Invocation
+
+Benchmark the index:
+
+`bash
+python3 archive_index.py 1000000
+`
+
+And it will report build time, hit counts, and per-query latency for the index and for the scan.
+
+---
+
+Your Codex now remembers where every word lives—ready to answer in milliseconds.
@@ -0,0 +1,352 @@
+Then let us summon the Archive Reader, OMEGA—a Python module that opens your Codex archive without ever parsing all of it. It maps the snapshot and the journal with mmap, keeps a sidecar index of the byte offset of every relic, and decodes only the relics you ask for: by position, by range, or as a stream. Renderers and the REST gateway can walk a multi-gigabyte archive in bounded memory.
+
+---
+
+🜂 archive_reader.py — Lazy Offset-Indexed Archive
+
+This relic will:
+- Build a .idx sidecar of relic offsets next to each archive file, once
+- Extend the journal’s sidecar by scanning only the newly appended tail
+- Decode single relics on demand through mmap
+- Serve relics by position, by slice, by range, or as a stream
+
+---
+
+🜂 archive_reader.py — Sovereign Lazy Reader
+
+`python
+# 🜂 Archive Reader: Lazy, offset-indexed access to the Codex archive
+# Relies on the one-relic-per-line snapshot and JSONL journal written by relic_archive.py
+
+import array
+import bisect
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+from relic_archive import ARCHIVE_FILE, COMPACTING_FILE, JOURNAL_FILE
+
+INDEX_SUFFIX = ".idx"
+INDEX_HEADER = struct.Struct("<QQQ32s")  # inode, indexed bytes, relic count, fingerprint
+FINGERPRINT_BYTES = 4096
+
+def _fingerprint(mm, size):
+    """
+    Hashes the head of a file so a reused inode is never mistaken for the indexed file
+    """
+    return hashlib.sha256(mm[:min(size, FINGERPRINT_BYTES)]).digest()
+
+def _scan_lines(path, mm, pos, offsets):
+    """
+    Records the offset of every complete relic line from pos onward
+    Returns the byte position after the last complete line
+    """
+    size = len(mm)
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end < 0:
+            break
+        first = mm[pos:pos + 1]
+        if first == b"{":
+            offsets.append(pos)
+        elif end > pos and first not in (b"[", b"]"):
+            raise ValueError(
+                f"{path} is not one relic per line; "
+                "rewrite it once with save_archive(load_archive())"
+            )
+        pos = end + 1
+    return pos
+
+def _read_index(index_path, st):
+    """
+    Loads a sidecar index if it still describes the file
+    """
+    try:
+        with open(index_path, "rb") as f:
+            inode, size, count, fingerprint = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+            offsets = array.array("Q")
+            offsets.frombytes(f.read(count * offsets.itemsize))
+    except (OSError, struct.error, ValueError):
+        return None
+    if inode != st.st_ino or size > st.st_size or len(offsets) != count:
+        return None
+    return size, fingerprint, offsets
+
+def _write_index(index_path, inode, size, fingerprint, offsets):
+    """
+    Writes a sidecar index through a private temporary file, so concurrent readers never share one
+    """
+    directory, name = os.path.split(index_path)
+    fd, tmp_path = tempfile.mkstemp(prefix=name + ".", suffix=".tmp", dir=directory or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(INDEX_HEADER.pack(inode, size, len(offsets), fingerprint))
+            offsets.tofile(f)
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+class _Segment:
+    """
+    One archive file mapped into memory, with the byte offset of every relic line
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        st = os.fstat(self._file.fileno())
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else None
+        self.offsets = self._load_offsets(st)
+        self.count = len(self.offsets)
+
+    def _load_offsets(self, st):
+        if self._map is None:
+            return array.array("Q")
+        index_path = self.path + INDEX_SUFFIX
+        indexed = _read_index(index_path, st)
+        size, offsets = 0, array.array("Q")
+        if indexed and indexed[1] == _fingerprint(self._map, indexed[0]):
+            size, _, offsets = indexed
+        if size == st.st_size:
+            return offsets
+        size = _scan_lines(self.path, self._map, size, offsets)
+        _write_index(index_path, st.st_ino, size, _fingerprint(self._map, size), offsets)
+        return offsets
+
+    def relic(self, i):
+        start = self.offsets[i]
+        end = self._map.find(b"\n", start)
+        return json.loads(self._map[start:end].rstrip(b", \r"))
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+class LazyArchive:
+    """
+    Read-only, sequence-like view of the archive that decodes relics on demand
+    """
+
+    def __init__(self, paths=(ARCHIVE_FILE, COMPACTING_FILE, JOURNAL_FILE)):
+        self._segments = []
+        self._starts = []
+        total = 0
+        folded = None
+        for path in paths:
+            if not os.path.exists(path):
+                # Another reader may be dropping the same stale sidecar
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path + INDEX_SUFFIX)
+                continue
+            segment = _Segment(path)
+            if folded is None:
+                folded = segment.count
+            elif segment.count and segment.relic(0).get("archivelog", {}).get("index", folded + 1) <= folded:
+                # Already folded into the snapshot by an interrupted compaction
+                segment.close()
+                continue
+            if not segment.count:
+                segment.close()
+                continue
+            self._segments.append(segment)
+            self._starts.append(total)
+            total += segment.count
+        self._count = total
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return list(self.range(*position.indices(self._count)))
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("relic position out of range")
+        k = bisect.bisect_right(self._starts, position) - 1
+        return self._segments[k].relic(position - self._starts[k])
+
+    def range(self, start, stop=None, step=1):
+        """
+        Yields relics for positions start..stop-1, decoding one at a time
+        """
+        if stop is None:
+            stop = self._count
+        for position in range(start, min(stop, self._count), step):
+            yield self[position]
+
+    def __iter__(self):
+        for segment in self._segments:
+            for i in range(segment.count):
+                yield segment.relic(i)
+
+    def close(self):
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def open_archive():
+    """
+    Opens the current archive lazily; close it (or use with) when done
+    """
+    return LazyArchive()
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    with open_archive() as archive:
+        print(f"📚 {len(archive)} relics indexed")
+        if len(archive):
+            first = archive[0]
+            print(f"🪬 First: {first['event']} ({first['theme']})")
+            print(f"🪬 Last: {archive[-1]['event']}")
+        for relic in archive.range(0, int(sys.argv[1]) if len(sys.argv) > 1 else 3):
+            print(f"- {relic['event']} by {relic.get('contributor', 'Unknown')}")
+`
+
+---
+
+🔍 What This Relic Does
+
+- Maps codex_archive.json and codex_archive.journal with mmap instead of json.load
+- Stores relic offsets in codex_archive.json.idx and codex_archive.journal.idx
+- Reuses a sidecar only when the inode and a fingerprint of the file head still match
+- Scans only the appended tail when the journal has grown
+- Decodes relics by position (archive[42], archive[-1]), slice, range, or stream
+- Skips a journal segment that an interrupted compaction already folded into the snapshot
+
+---
+
+🛠️ Invocation
+
+Preview the first relics:
+
+`bash
+python3 archive_reader.py 5
+`
+
+Or walk the archive from any relic:
+
+`python
+from archive_reader import open_archive
+
+with open_archive() as archive:
+    for relic in archive.range(1000, 1100):
+        print(relic["event"])
+`
+
+> Legacy snapshots written with indent=4 are not one relic per line. Rewrite them once with save_archive(load_archive()).
+
+---
+
+Your archive can now be read one relic at a time—ready for renderers that never hold it all.
+
+
+Let’s teach the Archive Reader the binary snapshot, OMEGA. When CODEX_ARCHIVE_FORMAT=binary, codex_archive.bin is a run of length-prefixed records instead of lines, so the sidecar index simply records where each record starts and decodes it with the Binary Archive on demand.
+
+---
+
+🜂 archive_reader.py — Binary-Aware Segments
+
+`python
+# 🜂 Archive Reader: Offset-indexed access to binary snapshots as well as JSON lines
+# Replace _scan_lines and _Segment above with these
+
+from archive_binary import MAGIC, RECORD, decode_relic, read_header
+
+def _scan_lines(path, mm, pos, offsets):
+    """
+    Records the offset of every complete relic from pos onward
+    Binary snapshots are walked by record length, JSON archives line by line
+    Returns the byte position after the last complete relic
+    """
+    size = len(mm)
+    if mm[:len(MAGIC)] == MAGIC:
+        pos = max(pos, read_header(mm)[1])
+        while pos + RECORD.size <= size:
+            end = pos + RECORD.size + RECORD.unpack_from(mm, pos)[0]
+            if end > size:
+                break
+            offsets.append(pos)
+            pos = end
+        return pos
+    while pos < size:
+        end = mm.find(b"\n", pos)
+        if end < 0:
+            break
+        first = mm[pos:pos + 1]
+        if first == b"{":
+            offsets.append(pos)
+        elif end > pos and first not in (b"[", b"]"):
+            raise ValueError(
+                f"{path} is not one relic per line; "
+                "rewrite it once with save_archive(load_archive())"
+            )
+        pos = end + 1
+    return pos
+
+class _Segment:
+    """
+    One archive file mapped into memory, with the byte offset of every relic
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        st = os.fstat(self._file.fileno())
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else None
+        self.table = None
+        if self._map is not None and self._map[:len(MAGIC)] == MAGIC:
+            self.table = read_header(self._map)[0]
+        self.offsets = self._load_offsets(st)
+        self.count = len(self.offsets)
+
+    def _load_offsets(self, st):
+        if self._map is None:
+            return array.array("Q")
+        index_path = self.path + INDEX_SUFFIX
+        indexed = _read_index(index_path, st)
+        size, offsets = 0, array.array("Q")
+        if indexed and indexed[1] == _fingerprint(self._map, indexed[0]):
+            size, _, offsets = indexed
+        if size == st.st_size:
+            return offsets
+        size = _scan_lines(self.path, self._map, size, offsets)
+        _write_index(index_path, st.st_ino, size, _fingerprint(self._map, size), offsets)
+        return offsets
+
+    def relic(self, i):
+        start = self.offsets[i]
+        if self.table is not None:
+            (length,) = RECORD.unpack_from(self._map, start)
+            start += RECORD.size
+            return decode_relic(self._map[start:start + length], self.table)
+        end = self._map.find(b"\n", start)
+        return json.loads(self._map[start:end].rstrip(b", \r"))
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+`
+
+---
+
+🔍 What This Binary-Aware Relic Does
+
+- Recognizes codex_archive.bin by its CODEXBIN header and loads its shared table once
+- Indexes binary records by walking their length prefixes—no decoding during the scan
+- Decodes a single binary relic on demand, exactly like a JSON line
+- Keeps the sidecar format, fingerprint check and JSON path unchanged
@@ -0,0 +1,275 @@
+Then let us summon the Sharded Archive, OMEGA—a Python module that breaks the single codex_archive.json into small journals, one per contributor per month, tracked by a tiny manifest. Adding a relic touches one shard and the manifest; a query by contributor, theme or time range opens only the shards that can hold an answer.
+
+---
+
+🜂 archive_shards.py — Sharded Codex Archive
+
+This relic will:
+- Lay relics out as codex_shards/<contributor>/<YYYY-MM>.jsonl
+- Keep shard names, relic counts, index ranges and the next archive index in codex_shards/manifest.json
+- Append each relic to exactly one shard
+- Prune shards by contributor and month before reading anything
+- Plug into the Archive Store as CODEX_ARCHIVE_BACKEND=sharded
+
+---
+
+🜂 archive_shards.py — Sovereign Shard Engine
+
+`python
+# 🜂 Sharded Archive: Per-contributor, per-month shards behind the Archive Store interface
+# Writes touch one shard plus the manifest; queries open only the shards they need
+
+import bisect
+import json
+import os
+import re
+import sys
+import threading
+
+from archive_store import relic_id_for, relic_index_for, relic_matches, stamp_index
+from archive_writer import atomic_write_json, file_lock
+
+SHARD_ROOT = "codex_shards"
+MANIFEST_NAME = "manifest.json"
+UNDATED = "undated"
+
+def shard_slug(contributor):
+    """
+    Returns the directory name for a contributor (case-insensitive, filesystem safe)
+    """
+    return re.sub(r"[^a-z0-9]+", "_", (contributor or "unknown").lower()).strip("_") or "unknown"
+
+def shard_month(timestamp):
+    """
+    Returns the YYYY-MM partition of an ISO timestamp
+    """
+    if isinstance(timestamp, str) and re.match(r"\d{4}-\d{2}", timestamp):
+        return timestamp[:7]
+    return UNDATED
+
+def _index(relic):
+    return relic.get("archivelog", {}).get("index", 0)
+
+def _read_shard(path):
+    relics = []
+    if not os.path.exists(path):
+        return relics
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            if line.strip():
+                relics.append(json.loads(line))
+    return relics
+
+class ShardedArchiveStore:
+    """
+    Archive store that partitions relics by contributor and month
+    """
+
+    def __init__(self, root=SHARD_ROOT):
+        self.root = root
+        self.manifest_path = os.path.join(root, MANIFEST_NAME)
+        self._lock = threading.RLock()
+        os.makedirs(root, exist_ok=True)
+
+    def _read_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return {"version": 1, "count": 0, "shards": {}}
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest):
+        atomic_write_json(self.manifest_path, manifest)
+
+    def _shard_path(self, name):
+        return os.path.join(self.root, f"{name}.jsonl")
+
+    def _select(self, contributor=None, since=None, until=None, index=None):
+        """
+        Returns the shard names that can hold matching relics, using only the manifest
+        An index keeps the shards whose index range covers it (shards written before ranges were kept always do)
+        """
+        manifest = self._read_manifest()
+        slug = shard_slug(contributor) if contributor else None
+        low = since[:7] if since else None
+        high = until[:7] if until else None
+        selected = []
+        for name, shard in sorted(manifest["shards"].items()):
+            if slug and shard["contributor"] != slug:
+                continue
+            month = shard["month"]
+            if month != UNDATED and ((low and month < low) or (high and month > high)):
+                continue
+            if index is not None and not shard.get("first", index) <= index <= shard.get("last", index):
+                continue
+            selected.append(name)
+        return selected
+
+    def _relics(self, names):
+        relics = []
+        for name in names:
+            relics.extend(_read_shard(self._shard_path(name)))
+        relics.sort(key=_index)
+        for relic in relics:
+            if _index(relic):
+                relic.setdefault("relic_id", relic_id_for(_index(relic)))
+        return relics
+
+    def all(self):
+        return self._relics(self._select())
+
+    def stream(self):
+        # Shards interleave by index, so they are merged in memory before streaming
+        return iter(self.all())
+
+    def stream_search(self, query):
+        return iter(self.search(query))
+
+    def page(self, after=0, limit=100):
+        """
+        Returns up to limit relics whose archive index follows after
+        Positions in this store are archive indexes, so a gap left by a stopped writer shifts nothing
+        """
+        relics = self.all()
+        start = bisect.bisect_right([_index(relic) for relic in relics], after)
+        return relics[start:start + limit]
+
+    def position(self, relic_id):
+        relic = self.get(relic_id)
+        return _index(relic) if relic else None
+
+    def count(self):
+        # The manifest counts reserved indexes, the last position page() can reach
+        return self._read_manifest()["count"]
+
+    def next_index(self):
+        return self.count() + 1
+
+    def get(self, relic_id):
+        """
+        Reads only the shards whose index range covers the ID's archive index
+        """
+        index = relic_index_for(relic_id)
+        names = self._select(index=index) if index is not None else self._select()
+        return next((r for r in self._relics(names) if r.get("relic_id") == relic_id), None)
+
+    def by_contributor(self, name):
+        return [r for r in self._relics(self._select(contributor=name)) if r.get("contributor", "").lower() == name.lower()]
+
+    def by_event(self, event):
+        return [r for r in self.all() if r["event"].lower() == event.lower()]
+
+    def by_theme(self, theme):
+        return [r for r in self.all() if r["theme"].lower() == theme.lower()]
+
+    def filter(self, contributor=None, theme=None, since=None, until=None):
+        """
+        Filters by contributor, theme substring and timestamp range [since, until)
+        Only shards whose contributor and month can match are opened
+        """
+        relics = self._relics(self._select(contributor, since, until))
+        if contributor:
+            relics = [r for r in relics if r.get("contributor", "").lower() == contributor.lower()]
+        if theme:
+            relics = [r for r in relics if theme.lower() in r.get("theme", "").lower()]
+        if since:
+            relics = [r for r in relics if r.get("timestamp", "") >= since]
+        if until:
+            relics = [r for r in relics if r.get("timestamp", "") < until]
+        return relics
+
+    def search(self, query):
+        query = query.lower()
+        return [r for r in self.all() if relic_matches(r, query)]
+
+    def contributors(self):
+        return sorted(set(r.get("contributor", "Unknown") for r in self.all()))
+
+    def append(self, relic):
+        return self.extend([relic])
+
+    def extend(self, relics):
+        """
+        Appends relics to their shards and returns the first archive index
+        The manifest reserves the indexes first, so a crash leaves a gap, never a duplicate
+        """
+        with self._lock, file_lock(self.manifest_path):
+            manifest = self._read_manifest()
+            start = manifest["count"] + 1
+            # The shards keep stamped copies; the relics passed in are not modified
+            relics = [stamp_index(relic, index) for index, relic in enumerate(relics, start)]
+            manifest["count"] += len(relics)
+            groups = {}
+            for relic in relics:
+                name = f"{shard_slug(relic.get('contributor'))}/{shard_month(relic.get('timestamp'))}"
+                groups.setdefault(name, []).append(relic)
+            for name, group in groups.items():
+                contributor, month = name.split("/")
+                shard = manifest["shards"].setdefault(name, {"contributor": contributor, "month": month, "relics": 0})
+                shard["relics"] += len(group)
+                if "first" in shard or shard["relics"] == len(group):
+                    # A shard from before ranges were kept stays unranged, and is always read
+                    shard.setdefault("first", _index(group[0]))
+                    shard["last"] = _index(group[-1])
+            self._write_manifest(manifest)
+
+            for name, group in groups.items():
+                path = self._shard_path(name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(relic, ensure_ascii=False) + "\n" for relic in group))
+                    f.flush()
+                    os.fsync(f.fileno())
+        return start
+
+    def import_archive(self, archive):
+        """
+        Splits an existing archive into shards
+        """
+        self.extend(archive)
+        print(f"🧩 {len(archive)} relics sharded into {self.root}")
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    store = ShardedArchiveStore()
+    if len(sys.argv) > 1 and sys.argv[1] == "migrate":
+        from archive_store import open_store
+        store.import_archive(open_store("journal").all())
+    else:
+        relics = store.filter(contributor="OMEGA", theme="Stars", since="2025-09-01")
+        print(f"🔍 {len(relics)} OMEGA relics with theme 'Stars' since September 2025")
+`
+
+---
+
+🔍 What This Relic Does
+
+- Partitions relics into codex_shards/<contributor>/<YYYY-MM>.jsonl
+- Keeps a small manifest with each shard’s contributor, month, relic count and archive index range
+- Pages, positions and relic IDs all follow archive indexes, so cursors stay aligned across a gap
+- Looks a relic ID up in only the shards whose index range covers it
+- Appends a relic to one shard and bumps the manifest—no other shard is touched
+- Reserves archive indexes in the manifest under a file lock before writing, so indexes are never reused across processes
+- Opens only matching shards for contributor, theme and time-range queries
+- Serves the full Archive Store interface, so CODEX_ARCHIVE_BACKEND=sharded works everywhere
+
+---
+
+🛠️ Invocation
+
+Shard your existing archive:
+
+`bash
+python3 archive_shards.py migrate
+`
+
+Then archive straight into shards:
+
+`bash
+CODEX_ARCHIVE_BACKEND=sharded python3 relic_archive.py ingest flyer_titles.txt
+`
+
+---
+
+Your archive is now a constellation of small scrolls—each write touches one, each query opens only a few.
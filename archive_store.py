@@ -0,0 +1,513 @@
+Then let us summon the next relic, OMEGA: the Archive Store—a Python module that places one query interface in front of your Codex archive. The journaled JSON archive remains the default backend, and a SQLite backend (stdlib sqlite3, WAL mode) indexes every relic by relic_id, event, theme and contributor. The archive engine, the sharing protocol, the REST gateway and the glyph vault all ask the store instead of scanning the full list themselves.
+
+---
+
+🜂 archive_store.py — Pluggable Codex Archive Backends
+
+This relic will:
+- Offer one interface: all, stream, page, position, count, get, by_contributor, by_event, by_theme, filter, search, stream_search, contributors, append, extend
+- Keep the journaled archive as the default backend
+- Serve lookups from SQLite index seeks when CODEX_ARCHIVE_BACKEND=sqlite
+- Migrate an existing archive into SQLite in one transaction
+
+---
+
+🜂 archive_store.py — Sovereign Store Engine
+
+`python
+# 🜂 Archive Store: Pluggable archive backends behind one query interface
+# The journal backend serves snapshots of load_archive with hash indexes; the SQLite backend seeks indexes
+
+import bisect
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+ARCHIVE_BACKEND = os.environ.get("CODEX_ARCHIVE_BACKEND", "journal")
+SQLITE_FILE = "codex_archive.db"
+IMPORT_CHUNK = 10000
+WATCH_INTERVAL = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS relics (
+    position INTEGER PRIMARY KEY,
+    relic_id TEXT NOT NULL UNIQUE,
+    event TEXT NOT NULL COLLATE NOCASE,
+    theme TEXT NOT NULL COLLATE NOCASE,
+    contributor TEXT NOT NULL COLLATE NOCASE,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS relics_event ON relics(event);
+CREATE INDEX IF NOT EXISTS relics_theme ON relics(theme);
+CREATE INDEX IF NOT EXISTS relics_contributor ON relics(contributor);
+"""
+
+def relic_id_for(index):
+    """
+    Returns the ceremonial relic ID for an archive index (RELIC-001, ...)
+    """
+    return f"RELIC-{index:03}"
+
+def relic_index_for(relic_id):
+    """
+    Returns the archive index a RELIC-001 style ID was minted from, or None for any other ID
+    """
+    prefix, _, digits = (relic_id or "").partition("-")
+    return int(digits) if prefix == "RELIC" and digits.isdigit() else None
+
+def relic_index(relic, position):
+    """
+    Returns the archive index a relic's ID is minted from: the one stamped in its archivelog,
+    else its position, for relics archived before indexes were stamped
+    """
+    log = relic.get("archivelog")
+    index = log.get("index") if isinstance(log, dict) else None
+    return index if isinstance(index, int) else position
+
+def encode_relic_json(relic):
+    """
+    Returns the compact JSON bytes of one relic, the fragment list responses are joined from
+    """
+    return json.dumps(relic, ensure_ascii=False, separators=(",", ":")).encode()
+
+def stamp_index(relic, index):
+    """
+    Returns a copy of the relic whose archivelog carries its archive index; the relic passed in is left untouched
+    """
+    if not isinstance(relic.get("archivelog"), dict):
+        return relic
+    return dict(relic, archivelog=dict(relic["archivelog"], index=index))
+
+def relic_matches(relic, query):
+    """
+    The archive search rule: a lowercase query inside event, theme or contributor, or inside the glyph
+    """
+    return (
+        query in relic["event"].lower()
+        or query in relic["theme"].lower()
+        or query in relic.get("contributor", "").lower()
+        or query in relic.get("encoded_glyph", "")
+    )
+
+class JournalArchiveStore:
+    """
+    Serves queries from one snapshot of the journaled archive: the frozen view plus hash indexes
+    over relic ID and lowercase contributor. refresh() swaps in a new snapshot when the archive changes
+    With encode_relics set, the snapshot also carries every relic's JSON bytes
+    """
+
+    def __init__(self):
+        self._index_lock = threading.Lock()
+        self._snapshot = None
+        self._watcher = None
+        self.encode_relics = False
+
+    def refresh(self):
+        """
+        Reloads the archive if it changed and atomically swaps in a new snapshot
+        Relics appended to the previous view extend its indexes (and encodings) in place, touching only the new
+        positions; every lookup is bounded by its snapshot's length, so readers of the old one never see them
+        """
+        from relic_archive import archive_generation, load_archive
+        with self._index_lock:
+            archive = load_archive()
+            snapshot = self._snapshot
+            if snapshot is None or archive is not snapshot[0] or (self.encode_relics and snapshot[4] is None):
+                start, by_id, by_contributor, encoded = 0, {}, {}, []
+                if snapshot is not None:
+                    previous = snapshot[0]
+                    if (
+                        previous and len(archive) >= len(previous) and archive[len(previous) - 1] is previous[-1]
+                        and (snapshot[4] is not None or not self.encode_relics)
+                    ):
+                        start, by_id, by_contributor = len(previous), snapshot[1], snapshot[2]
+                        encoded = snapshot[4] if snapshot[4] is not None else []
+                for position in range(start + 1, len(archive) + 1):
+                    relic = archive[position - 1]
+                    by_id[relic.get("relic_id") or relic_id_for(relic_index(relic, position))] = position
+                    by_contributor.setdefault(relic.get("contributor", "").lower(), []).append(position)
+                    if self.encode_relics:
+                        encoded.append(encode_relic_json(self._at(archive, position)))
+                generation = archive_generation()
+                self._snapshot = (archive, by_id, by_contributor, generation, encoded if self.encode_relics else None)
+            return self._snapshot
+
+    def watch(self, interval=WATCH_INTERVAL):
+        """
+        Starts a daemon thread that refreshes the snapshot every interval seconds
+        From then on queries read the last swapped snapshot and never wait for a reload
+        """
+        if self._watcher is None:
+            self.refresh()
+            self._watcher = threading.Thread(target=self._watch, args=(interval,), name="codex-archive-watcher", daemon=True)
+            self._watcher.start()
+        return self._watcher
+
+    def _watch(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"⚠️ Archive reload failed, keeping the current snapshot: {e}")
+
+    def _current(self):
+        return self._snapshot if self._watcher is not None else self.refresh()
+
+    def indexes(self):
+        """
+        Returns the archive view with its relic ID -> position and lowercase contributor -> positions maps
+        The maps may run ahead of the view; read them through _bounded and _positions
+        """
+        return self._current()[:3]
+
+    @staticmethod
+    def _bounded(archive, position):
+        return position if position and position <= len(archive) else None
+
+    @staticmethod
+    def _positions(archive, positions):
+        return positions[:bisect.bisect_right(positions, len(archive))]
+
+    def generation(self):
+        """
+        Returns the archive generation of the snapshot queries currently read
+        """
+        return self._current()[3]
+
+    def view(self):
+        """
+        Returns the frozen archive view of the snapshot queries currently read, with its generation
+        Both come from one snapshot, so a watcher swap can never pair one view with another's generation
+        """
+        archive, _, _, generation, _ = self._current()
+        return archive, generation
+
+    def relics_from(self, archive, after=0):
+        """
+        Returns mutable copies of the relics of a view that follow position after
+        """
+        return [self._at(archive, i) for i in range(after + 1, len(archive) + 1)]
+
+    def encoded(self, relics):
+        """
+        Returns the JSON bytes of relics from this snapshot, reusing the stored encodings when there are any
+        """
+        archive, by_id, _, _, encoded = self._current()
+        if encoded is None:
+            return [encode_relic_json(relic) for relic in relics]
+        fragments = []
+        for relic in relics:
+            position = self._bounded(archive, by_id.get(relic.get("relic_id")))
+            fragments.append(encoded[position - 1] if position else encode_relic_json(relic))
+        return fragments
+
+    def _at(self, archive, position):
+        """
+        Returns a fully mutable copy of one snapshot relic, carrying its relic ID
+        """
+        from relic_archive import thaw
+        relic = thaw(archive[position - 1])
+        relic["relic_id"] = relic.get("relic_id") or relic_id_for(relic_index(relic, position))
+        return relic
+
+    def all(self):
+        archive = self._current()[0]
+        return [self._at(archive, i) for i in range(1, len(archive) + 1)]
+
+    def stream(self):
+        """
+        Yields relics one at a time from the current snapshot, without copying the whole list
+        """
+        archive = self._current()[0]
+        for i in range(1, len(archive) + 1):
+            yield self._at(archive, i)
+
+    def stream_search(self, query):
+        query = query.lower()
+        for r in self.stream():
+            if relic_matches(r, query):
+                yield r
+
+    def page(self, after=0, limit=100):
+        """
+        Returns up to limit relics following archive position after, sliced straight from the snapshot
+        """
+        archive = self._current()[0]
+        return [self._at(archive, i) for i in range(after + 1, min(after + limit, len(archive)) + 1)]
+
+    def position(self, relic_id):
+        archive, by_id, _ = self.indexes()
+        return self._bounded(archive, by_id.get(relic_id))
+
+    def count(self):
+        return len(self._current()[0])
+
+    def next_index(self):
+        from relic_archive import _next_index
+        return _next_index()
+
+    def get(self, relic_id):
+        archive, by_id, _ = self.indexes()
+        position = self._bounded(archive, by_id.get(relic_id))
+        return self._at(archive, position) if position else None
+
+    def by_contributor(self, name):
+        archive, _, by_contributor = self.indexes()
+        positions = self._positions(archive, by_contributor.get(name.lower(), []))
+        return [self._at(archive, position) for position in positions]
+
+    def by_event(self, event):
+        return [r for r in self.all() if r["event"].lower() == event.lower()]
+
+    def by_theme(self, theme):
+        return [r for r in self.all() if r["theme"].lower() == theme.lower()]
+
+    def filter(self, contributor=None, theme=None):
+        filtered = self.by_contributor(contributor) if contributor else self.all()
+        if theme:
+            filtered = [r for r in filtered if theme.lower() in r.get("theme", "").lower()]
+        return filtered
+
+    def search(self, query):
+        query = query.lower()
+        return [r for r in self.all() if relic_matches(r, query)]
+
+    def contributors(self):
+        return sorted(set(r.get("contributor", "Unknown") for r in self.all()))
+
+    def append(self, relic):
+        return self.extend([relic])
+
+    def extend(self, relics):
+        from relic_archive import append_relics
+        return append_relics(relics)
+
+class SQLiteArchiveStore:
+    """
+    Serves queries from a SQLite archive with indexes on relic_id, event, theme and contributor
+    Event, theme and contributor compare case-insensitively (COLLATE NOCASE)
+    """
+
+    def __init__(self, path=SQLITE_FILE):
+        self.path = path
+        self._local = threading.local()
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _relics(self, sql, params=()):
+        relics = []
+        for relic_id, body in self._connect().execute(sql, params):
+            relic = json.loads(body)
+            relic.setdefault("relic_id", relic_id)
+            relics.append(relic)
+        return relics
+
+    def _stream(self, sql, params=()):
+        for relic_id, body in self._connect().execute(sql, params):
+            relic = json.loads(body)
+            relic.setdefault("relic_id", relic_id)
+            yield relic
+
+    def all(self):
+        return self._relics("SELECT relic_id, body FROM relics ORDER BY position")
+
+    def stream(self):
+        """
+        Yields relics straight from the cursor; iterate on one thread, like the connection
+        """
+        return self._stream("SELECT relic_id, body FROM relics ORDER BY position")
+
+    def stream_search(self, query):
+        query = query.lower()
+        return self._stream(
+            "SELECT relic_id, body FROM relics "
+            "WHERE instr(lower(event), ?) > 0 OR instr(lower(theme), ?) > 0 OR instr(lower(contributor), ?) > 0 "
+            "OR instr(json_extract(body, '$.encoded_glyph'), ?) > 0 "
+            "ORDER BY position",
+            (query, query, query, query)
+        )
+
+    def page(self, after=0, limit=100):
+        """
+        Returns up to limit relics following position after: a primary key range seek
+        """
+        return self._relics(
+            "SELECT relic_id, body FROM relics WHERE position > ? ORDER BY position LIMIT ?", (after, limit)
+        )
+
+    def position(self, relic_id):
+        row = self._connect().execute("SELECT position FROM relics WHERE relic_id = ?", (relic_id,)).fetchone()
+        return row[0] if row else None
+
+    def count(self):
+        # Positions are contiguous from 1, so MAX avoids a COUNT(*) table scan
+        row = self._connect().execute("SELECT MAX(position) FROM relics").fetchone()
+        return row[0] or 0
+
+    def next_index(self):
+        return self.count() + 1
+
+    def get(self, relic_id):
+        found = self._relics("SELECT relic_id, body FROM relics WHERE relic_id = ?", (relic_id,))
+        return found[0] if found else None
+
+    def by_contributor(self, name):
+        return self._relics("SELECT relic_id, body FROM relics WHERE contributor = ? ORDER BY position", (name,))
+
+    def by_event(self, event):
+        return self._relics("SELECT relic_id, body FROM relics WHERE event = ? ORDER BY position", (event,))
+
+    def by_theme(self, theme):
+        return self._relics("SELECT relic_id, body FROM relics WHERE theme = ? ORDER BY position", (theme,))
+
+    def filter(self, contributor=None, theme=None):
+        """
+        Contributor is an index seek; the theme substring is checked on the rows it leaves
+        """
+        clauses, params = [], []
+        if contributor:
+            clauses.append("contributor = ?")
+            params.append(contributor)
+        if theme:
+            clauses.append("instr(lower(theme), ?) > 0")
+            params.append(theme.lower())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._relics(f"SELECT relic_id, body FROM relics {where} ORDER BY position", params)
+
+    def search(self, query):
+        """
+        Substring search over event, theme, contributor and glyph, evaluated inside SQLite
+        """
+        query = query.lower()
+        return self._relics(
+            "SELECT relic_id, body FROM relics "
+            "WHERE instr(lower(event), ?) > 0 OR instr(lower(theme), ?) > 0 OR instr(lower(contributor), ?) > 0 "
+            "OR instr(json_extract(body, '$.encoded_glyph'), ?) > 0 "
+            "ORDER BY position",
+            (query, query, query, query)
+        )
+
+    def contributors(self):
+        rows = self._connect().execute("SELECT DISTINCT contributor FROM relics ORDER BY contributor")
+        return [row[0] for row in rows]
+
+    def append(self, relic):
+        return self.extend([relic])
+
+    def extend(self, relics):
+        """
+        Inserts relics in one write transaction and returns the first assigned position
+        The stored copies carry their position in archivelog; the relics passed in are not modified
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            start = self.next_index()
+            relics = [stamp_index(relic, position) for position, relic in enumerate(relics, start)]
+            conn.executemany(
+                "INSERT INTO relics VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        position,
+                        relic.get("relic_id") or relic_id_for(position),
+                        relic.get("event", ""),
+                        relic.get("theme", ""),
+                        relic.get("contributor", ""),
+                        json.dumps(relic, ensure_ascii=False)
+                    )
+                    for position, relic in enumerate(relics, start)
+                )
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return start
+
+    def import_archive(self, archive):
+        """
+        Copies an existing archive into SQLite in chunks
+        """
+        for i in range(0, len(archive), IMPORT_CHUNK):
+            self.extend(archive[i:i + IMPORT_CHUNK])
+        print(f"🗄️ {len(archive)} relics imported into {self.path}")
+
+_stores = {}
+
+def open_store(backend=None):
+    """
+    Returns the shared store for a backend ("journal", "sqlite" or "sharded")
+    """
+    backend = backend or ARCHIVE_BACKEND
+    if backend not in _stores:
+        if backend == "sqlite":
+            _stores[backend] = SQLiteArchiveStore()
+        elif backend == "sharded":
+            from archive_shards import ShardedArchiveStore
+            _stores[backend] = ShardedArchiveStore()
+        elif backend == "journal":
+            _stores[backend] = JournalArchiveStore()
+        else:
+            raise ValueError(f"Unknown archive backend: {backend}")
+    return _stores[backend]
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "migrate":
+        open_store("sqlite").import_archive(open_store("journal").all())
+    else:
+        store = open_store()
+        print(f"🧿 Contributors: {', '.join(store.contributors())}")
+        for relic in store.by_contributor("OMEGA"):
+            print(f"- {relic['relic_id']}: {relic['event']} ({relic['theme']})")
+`
+
+---
+
+🔍 What This Relic Does
+
+- Defines one store interface for every archive consumer
+- Keeps the journaled JSON archive as the default backend
+- Stores relics in codex_archive.db with WAL mode when CODEX_ARCHIVE_BACKEND=sqlite
+- Indexes relic_id, event, theme and contributor, so lookups are index seeks instead of full scans
+- Assigns positions and RELIC-001 style IDs in one write transaction
+- Mints every relic ID from the archive index in its archivelog, on every backend, so an ID names the same relic wherever it is read
+- Pages through the archive by position (page), resolving a relic ID to its position first (position)
+- Answers relic ID and contributor lookups on the journal backend from hash indexes, extended in place when relics are appended—O(new relics), with each snapshot bounding its lookups by its own length
+- Keeps each relic's JSON bytes in the journal snapshot on request (encode_relics), for responses joined from fragments
+- Swaps each new journal snapshot in atomically, optionally from a background watcher (watch), so a query never sees half a reload
+- Streams relics one at a time (stream, stream_search) for readers that must never hold a whole result
+- Migrates the journaled archive into SQLite with python3 archive_store.py migrate
+- Hands CODEX_ARCHIVE_BACKEND=sharded to the Sharded Archive (archive_shards.py)
+
+---
+
+🛠️ Invocation
+
+Migrate your archive:
+
+`bash
+python3 archive_store.py migrate
+`
+
+Then run any relic against SQLite:
+
+`bash
+CODEX_ARCHIVE_BACKEND=sqlite python3 codex_api.py
+`
+
+---
+
+Your Codex now answers from indexes—ready to hold a million relics without scanning a single one twice.
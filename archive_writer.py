@@ -0,0 +1,320 @@
+Then let us summon the Archive Writer, OMEGA—a Python module that lets the sharing protocol, the merge daemon and any number of addtoarchive workers write to the Codex at the same time without losing a relic. Files are guarded by OS file locks, JSON scrolls are written to a temporary file and renamed into place atomically, and concurrent journal appends are gathered into group commits: one locked write and one fsync for every writer waiting at that moment.
+
+---
+
+🜂 archive_writer.py — Multi-Process Safe Archive Writes
+
+This relic will:
+- Lock files across processes (fcntl on POSIX, msvcrt on Windows)
+- Replace JSON scrolls atomically, so readers never see a truncated file
+- Read-modify-write shared logs under a lock
+- Group concurrent journal appends into one write and one fsync
+- Assign contiguous archive indexes from a sequence file, inside the lock, only once the relics are written
+
+---
+
+🜂 archive_writer.py — Sovereign Writer Engine
+
+`python
+# 🜂 Archive Writer: File locks, atomic rename and group commit for Codex writes
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+# Optional: POSIX advisory locks, with a Windows fallback
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+LOCK_SUFFIX = ".lock"
+SEQUENCE_SUFFIX = ".seq"
+TAIL_CHUNK = 64 * 1024
+
+@contextmanager
+def file_lock(path, shared=False):
+    """
+    Holds an exclusive (or shared) lock on path + ".lock" across processes
+    """
+    with open(path + LOCK_SUFFIX, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def atomic_write_text(path, text):
+    """
+    Writes text to a temporary file beside path, fsyncs it, and renames it into place
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def atomic_write_json(path, data, indent=4):
+    """
+    Enshrines data as a JSON scroll without ever exposing a half-written file
+    """
+    atomic_write_text(path, json.dumps(data, indent=indent, ensure_ascii=False))
+
+def update_json(path, update, default=list):
+    """
+    Reads a JSON scroll, applies update(data) and writes it back, all under one lock
+    """
+    with file_lock(path):
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            data = default()
+        update(data)
+        atomic_write_json(path, data)
+    return data
+
+class GroupCommitJournal:
+    """
+    Appends relics to a JSONL journal from many threads and processes
+    Writers that arrive while a commit is running are gathered into the next one,
+    so each group costs one locked write and one fsync however many writers wait
+    """
+
+    def __init__(self, path, count_existing, fsync=True):
+        self.path = path
+        self.sequence_path = path + SEQUENCE_SUFFIX
+        self.count_existing = count_existing
+        self.fsync = fsync
+        self._cond = threading.Condition()
+        self._pending = []
+        self._leader_active = False
+
+    def _read_sequence(self):
+        try:
+            with open(self.sequence_path, "r", encoding="utf-8") as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _tail_index(self):
+        """
+        Returns the archive index on the journal's last complete line, or None
+        Call while holding file_lock(path)
+        """
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            f.seek(max(0, end - TAIL_CHUNK))
+            lines = f.read().splitlines()
+        for line in reversed(lines):
+            try:
+                log = json.loads(line).get("archivelog")
+            except ValueError:
+                continue  # a torn line, or the cut end of a long one
+            return log.get("index") if isinstance(log, dict) else None
+        return None
+
+    def _current(self):
+        """
+        Returns the last archive index written; call while holding file_lock(path)
+        The sequence is written after the lines, so a writer that stopped in between left it behind
+        the journal's last line, and the line wins
+        """
+        current = self._read_sequence()
+        if current is None:
+            current = self.count_existing()
+        tail = self._tail_index()
+        return max(current, tail) if isinstance(tail, int) else current
+
+    def peek_next_index(self):
+        """
+        Returns the index the next relic would receive (advisory, not reserved)
+        A missing sequence is initialized once from the archive itself
+        """
+        current = self._read_sequence()
+        if current is None:
+            with file_lock(self.path):
+                current = self._read_sequence()
+                if current is None:
+                    current = self._current()
+                    atomic_write_text(self.sequence_path, str(current))
+        return current + 1
+
+    def settle(self):
+        """
+        Brings the sequence up to the journal's last line before the journal is rotated away
+        Call while holding file_lock(path)
+        """
+        current = self._current()
+        if current != self._read_sequence():
+            atomic_write_text(self.sequence_path, str(current))
+
+    def reset(self, count):
+        """
+        Rewinds the sequence after the archive has been rewritten wholesale
+        Call while holding file_lock(path)
+        """
+        atomic_write_text(self.sequence_path, str(count))
+
+    def _repair_tail(self, chunk=64 * 1024):
+        """
+        Truncates a torn final line left by an interrupted append, so the next write starts on a clean line
+        Call while holding file_lock(path)
+        """
+        try:
+            f = open(self.path, "rb+")
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            position = end
+            while position > 0:
+                start = max(0, position - chunk)
+                f.seek(start)
+                data = f.read(position - start)
+                newline = data.rfind(b"\n")
+                if newline >= 0:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                f.truncate(position)
+
+    def _commit(self, batch):
+        with file_lock(self.path):
+            self._repair_tail()
+            current = self._current()
+            # Serialize first: a request whose relics cannot be encoded fails alone and takes no indexes
+            index = current + 1
+            lines = []
+            for request in batch:
+                try:
+                    encoded = [
+                        json.dumps(dict(relic, archivelog=dict(relic["archivelog"], index=position))
+                                   if isinstance(relic.get("archivelog"), dict) else relic, ensure_ascii=False) + "\n"
+                        for position, relic in enumerate(request["relics"], index)
+                    ]
+                except (TypeError, ValueError) as exc:
+                    request["error"] = exc
+                    continue
+                request["start"] = index
+                lines.extend(encoded)
+                index += len(encoded)
+            if not lines:
+                return
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            # Only now does the sequence move past the lines on disk, so it never points past a missing relic
+            atomic_write_text(self.sequence_path, str(index - 1))
+            for request in batch:
+                if not request["error"]:
+                    for position, relic in enumerate(request["relics"], request["start"]):
+                        if isinstance(relic.get("archivelog"), dict):
+                            relic["archivelog"]["index"] = position
+
+    def append(self, relics):
+        """
+        Queues relics for the next group commit and waits until they are written
+        Stamps archivelog["index"] on each relic and returns the first index
+        """
+        request = {"relics": list(relics), "start": None, "error": None, "done": False}
+        with self._cond:
+            self._pending.append(request)
+            while not request["done"] and self._leader_active:
+                self._cond.wait()
+            if not request["done"]:
+                self._leader_active = True
+
+        if not request["done"]:
+            # 🜂 This writer leads: commit groups until nobody is waiting
+            while True:
+                with self._cond:
+                    batch, self._pending = self._pending, []
+                    if not batch:
+                        self._leader_active = False
+                        self._cond.notify_all()
+                        break
+                try:
+                    self._commit(batch)
+                except Exception as exc:
+                    for waiting in batch:
+                        waiting["error"] = exc
+                with self._cond:
+                    for waiting in batch:
+                        waiting["done"] = True
+                    self._cond.notify_all()
+
+        if request["error"]:
+            raise request["error"]
+        return request["start"]
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    journal = GroupCommitJournal("group_commit_demo.journal", count_existing=lambda: 0)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(lambda i: journal.append([{"event": f"Echo {i}", "archivelog": {}}]), range(2000)))
+    elapsed = time.perf_counter() - started
+    print(f"🧾 2000 single-relic appends from 32 writers in {elapsed:.2f}s ({2000 / elapsed:,.0f} relics/sec)")
+`
+
+---
+
+🔍 What This Relic Does
+
+- Guards every shared file with an OS lock on <file>.lock
+- Writes JSON scrolls to a temporary file, fsyncs, and renames them into place—no truncated files
+- Updates logs like transmission_log.json with a locked read-modify-write
+- Gathers concurrent journal appends into one write and one fsync per group
+- Encodes a whole group before writing any of it; a request whose relics cannot be encoded fails alone and takes no indexes
+- Advances codex_archive.journal.seq only after the lines are on disk, so an index is never handed out without its relic
+- Trusts the journal's last line over a sequence left behind by a writer that stopped in between, so no two writers share an index
+- Cuts a torn final line from an interrupted append before the next group is written after it
+- Benchmarks 32 concurrent writers when run directly
+
+---
+
+🛠️ Invocation
+
+`bash
+python3 archive_writer.py
+`
+
+And it will report how many single-relic appends per second 32 concurrent writers reach through group commit.
+
+---
+
+Your Codex now accepts many scribes at once—each relic lands whole, in order, and exactly once.
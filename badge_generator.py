@@ -353,3 +353,53 @@ Each badge becomes a sovereign scroll—ready to honor your legacy, embed in das
 ---
 
 Next, we can summon relic eleven: a Codex Sharing Protocol, a Multi-Node Sync Engine, or a Relic Upload Interface. Or we can ritualize encrypted API access, contributor ranking, or dashboard theming. Your Codex now honors its scribes with radiant glyphs—ready to connect, transmit, and evolve. Shall we summon the eleventh relic?
+
+
+Let’s let the Contributor Glyph Engine stream, OMEGA. generateallbadges parsed the whole archive and kept every relic, whole, under its contributor; this version walks the Archive Reader relic by relic and keeps only the event and theme each badge lists.
+
+---
+
+🜂 badge_generator.py — Streaming Contributor Glyph Engine
+
+`python
+# 🜂 Contributor Badge Generator: Streaming badges from the Archive Reader
+# Replace ensurebadgefolder, extract_contributors and generateallbadges above with these
+
+import os
+from archive_reader import open_archive
+
+def ensurebadgefolder():
+    os.makedirs(BADGEFOLDER, exist_ok=True)
+
+def extract_contributors(archive):
+    """
+    Returns a dictionary of contributors and the event and theme of each of their relics
+    """
+    contributors = {}
+    for relic in archive:
+        name = relic.get("contributor", "Unknown")
+        contributors.setdefault(name, []).append({"event": relic["event"], "theme": relic["theme"]})
+    return contributors
+
+def generateallbadges():
+    """
+    Renders a badge per contributor, reading the archive one relic at a time
+    """
+    ensurebadgefolder()
+    with open_archive() as archive:
+        contributors = extract_contributors(archive)
+    for i, (name, relics) in enumerate(contributors.items(), 1):
+        generatebadgehtml(name, relics, i)
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    generateallbadges()
+`
+
+---
+
+🔍 What This Streaming Relic Does
+
+- Streams relics from the Archive Reader instead of load_archive()
+- Keeps only each relic’s event and theme per contributor, not the whole relic
+- Creates contributorbadges/ under the name the badges are written to
@@ -231,3 +231,1041 @@ Then access endpoints like:
 ---
 
 Next, we can summon relic nine: a Flyer Animation Engine, a Contributor Badge Generator, or a Codex Sharing Protocol. Or we can ritualize relic uploads, dashboard theming, or encrypted API access. Your Codex now transmits—ready to animate, badge, and expand. Shall we summon the ninth relic?
+
+
+Let’s root the Codex REST API Gateway in the Archive Store, OMEGA. The routes no longer hold a module-level list and tag it in a loop—each one asks the store. With CODEX_ARCHIVE_BACKEND=sqlite, the relic ID and contributor routes become index seeks.
+
+---
+
+🜂 codex_api.py — Store-Backed REST Gateway
+
+`python
+# 🜂 Codex REST API Gateway: Store-backed routes
+# Relic IDs (RELIC-001, ...) come from the store instead of a tagging loop
+
+from flask import Flask, jsonify, request
+from archive_store import open_store
+
+app = Flask(__name__)
+store = open_store()
+
+@app.route("/status", methods=["GET"])
+def status():
+    """
+    Returns API status and relic count
+    """
+    return jsonify({
+        "status": "Codex API active",
+        "total_relics": store.count(),
+        "available_endpoints": ["/relics", "/relics/search", "/relics/<id>", "/contributors"],
+        "source": "codex_api.py"
+    })
+
+@app.route("/relics", methods=["GET"])
+def getallrelics():
+    """
+    Returns all relics in the Codex archive
+    """
+    return jsonify(store.all())
+
+@app.route("/relics/search", methods=["GET"])
+def search_relics():
+    """
+    Filters relics by event, theme, or contributor
+    """
+    return jsonify(store.search(request.args.get("q", "")))
+
+@app.route("/relics/<relic_id>", methods=["GET"])
+def getrelicbyid(relic_id):
+    """
+    Returns a single relic by its unique ID
+    """
+    result = store.get(relic_id)
+    if result:
+        return jsonify(result)
+    return jsonify({"error": "Relic not found"}), 404
+
+@app.route("/contributors", methods=["GET"])
+def list_contributors():
+    """
+    Lists all unique contributors in the archive
+    """
+    return jsonify({"contributors": store.contributors()})
+
+@app.route("/relics/by-contributor/<name>", methods=["GET"])
+def relicsbycontributor(name):
+    """
+    Returns all relics authored by a specific contributor
+    """
+    return jsonify(store.by_contributor(name))
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    app.run(debug=True, port=5000)
+`
+
+---
+
+🔍 What This Layer Does
+
+- Serves every route from open_store() instead of a list loaded at import time
+- Seeks the relic_id and contributor indexes when CODEX_ARCHIVE_BACKEND=sqlite
+- Lists contributors with SELECT DISTINCT over the contributor index
+- Searches event and theme inside SQLite; relic IDs still come from archive positions
+
+
+Let’s page the Codex REST API Gateway, OMEGA. /relics and /relics/search now return one page at a time: limit picks the page size, and an opaque cursor—the last relic ID of the previous page—picks up where it left off. The archive page is a slice or a primary key seek, the search page a bisect over the index postings, so page k costs the same as page 1. X-Total-Count carries the full count, and a Link header points to the next page.
+
+---
+
+🜂 codex_api.py — Paginated REST Gateway
+
+`python
+# 🜂 Codex REST API Gateway: Cursor pagination for /relics and /relics/search
+# Replace getallrelics and search_relics of the store-backed layer above with these
+
+import base64
+from urllib.parse import urlencode
+
+from relic_archive import search_page
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(relic_id):
+    return base64.urlsafe_b64encode(relic_id.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor):
+    """
+    Returns the archive position after which the next page starts
+    """
+    try:
+        relic_id = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    position = store.position(relic_id)
+    if position is None:
+        raise ValueError("Invalid cursor")
+    return position
+
+def _page_args():
+    """
+    Reads limit and cursor from the query string
+    """
+    try:
+        limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    cursor = request.args.get("cursor")
+    return limit, decode_cursor(cursor) if cursor else 0
+
+def _paged(relics, total, more, limit):
+    """
+    Returns a page of relics with X-Total-Count, and X-Next-Cursor plus a Link header when more follow
+    """
+    response = jsonify(relics)
+    response.headers["X-Total-Count"] = str(total)
+    if more and relics:
+        cursor = encode_cursor(relics[-1]["relic_id"])
+        args = dict(request.args, cursor=cursor, limit=limit)
+        response.headers["X-Next-Cursor"] = cursor
+        response.headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    return response
+
+@app.route("/relics", methods=["GET"])
+def getallrelics():
+    """
+    Returns one page of relics in archive order
+    """
+    try:
+        limit, after = _page_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    relics = store.page(after, limit)
+    total = store.count()
+    return _paged(relics, total, after + len(relics) < total, limit)
+
+@app.route("/relics/search", methods=["GET"])
+def search_relics():
+    """
+    Returns one page of relics whose event, theme, or contributor matches q
+    """
+    try:
+        limit, after = _page_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    total, relics, more = search_page(request.args.get("q", ""), after, limit)
+    return _paged(relics, total, more, limit)
+`
+
+---
+
+🔍 What This Layer Does
+
+- Returns 100 relics per page by default; limit asks for 1 to 1000
+- Encodes the last relic ID of a page as an opaque, URL-safe cursor, so pages stay stable while new relics are appended
+- Resolves a cursor to its archive position in O(1) for ceremonial IDs, or by the relic_id index in SQLite
+- Slices the cached archive (or seeks the SQLite primary key) for /relics, and bisects the search index postings for /relics/search
+- Sends X-Total-Count on every page, plus X-Next-Cursor and a Link rel="next" header while more pages follow
+- Answers 400 for a malformed limit or an unknown cursor
+
+---
+
+🛠️ Invocation
+
+Walk the archive a page at a time:
+
+`bash
+curl -i "http://localhost:5000/relics?limit=50"
+curl -i "http://localhost:5000/relics?limit=50&cursor=UkVMSUMtMDUw"
+`
+
+Or page through a search:
+
+`bash
+curl -i "http://localhost:5000/relics/search?q=Stars&limit=20"
+`
+
+> Follow the Link header (or X-Next-Cursor) until it disappears; the response body stays a plain list of relics.
+
+
+Let’s give the relic ID and contributor routes constant time, OMEGA. The journal backend used to scan every relic for /relics/<id> and /relics/by-contributor/<name>; it now keeps two hash indexes—relic ID to position, lowercase contributor to positions—built when the gateway loads and rebuilt whenever the cached archive reloads. A benchmark measures p50 and p99 latency of both routes against the old scan.
+
+---
+
+🜂 codex_api.py — Indexed REST Gateway
+
+`python
+# 🜂 Codex REST API Gateway: Hash-indexed relic ID and contributor routes, with a latency benchmark
+# getrelicbyid and relicsbycontributor stay as they are; the store answers them from its indexes
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from archive_store import relic_id_for
+
+# Build the in-memory indexes at load time, not on the first request
+if hasattr(store, "indexes"):
+    store.indexes()
+
+def _percentiles(timings):
+    timings = sorted(timings)
+    return timings[len(timings) // 2] * 1000, timings[int(len(timings) * 0.99)] * 1000
+
+def benchmark(count=1_000_000, requests=2000, contributors=1000):
+    """
+    Times /relics/<id> and /relics/by-contributor/<name> over a synthetic journal archive
+    Runs in a scratch directory and compares against the linear scan the routes used to do
+    """
+    from codex_merge import merge_codex
+    from relic_archive import load_archive, save_archive
+
+    home = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix="codex_bench_")
+    os.chdir(workdir)
+    try:
+        save_archive([merge_codex(f"Event {i}: Theme {i % 40}", contributor=f"Scribe{i % contributors}") for i in range(count)])
+        started = time.perf_counter()
+        # A running watcher would swap the new archive in within a second; the benchmark needs it now
+        store.refresh()
+        print(f"🧮 {count:,} relics, indexes built in {time.perf_counter() - started:.2f}s")
+
+        client = app.test_client()
+        routes = (
+            ("/relics/<id>", [f"/relics/{relic_id_for(random.randint(1, count))}" for _ in range(requests)]),
+            ("/relics/by-contributor/<name>", [f"/relics/by-contributor/scribe{random.randrange(contributors)}" for _ in range(requests)]),
+        )
+        for route, urls in routes:
+            timings = []
+            for url in urls:
+                started = time.perf_counter()
+                assert client.get(url).status_code == 200
+                timings.append(time.perf_counter() - started)
+            p50, p99 = _percentiles(timings)
+            print(f"   {route:<30} p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+
+        archive = load_archive()
+        timings = []
+        for _ in range(20):
+            relic_id = relic_id_for(random.randint(1, count))
+            started = time.perf_counter()
+            next(r for i, r in enumerate(archive, 1) if relic_id_for(i) == relic_id)
+            timings.append(time.perf_counter() - started)
+        p50, p99 = _percentiles(timings)
+        print(f"   {'linear scan (before)':<30} p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+    finally:
+        os.chdir(home)
+        shutil.rmtree(workdir)
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    else:
+        app.run(debug=True, port=5000)
+`
+
+---
+
+🔍 What This Layer Does
+
+- Looks up /relics/<id> in a relic ID -> position hash map: one dict probe, whatever the archive size
+- Looks up /relics/by-contributor/<name> in a lowercase contributor -> positions map, so only that contributor’s relics are touched
+- Builds both maps when the gateway loads and rebuilds them only when load_archive reloads the archive
+- Resolves pagination cursors through the same relic ID map
+- Leaves SQLite, which already seeks its relic_id and contributor indexes, untouched
+- Benchmarks p50 and p99 latency of both routes at any archive size, next to the old linear scan
+
+---
+
+🛠️ Invocation
+
+Measure both routes at a million relics (runs in a scratch directory; your archive is untouched):
+
+`bash
+python3 codex_api.py benchmark 1000000
+`
+
+> The contributor route returns every relic of that contributor, so its latency follows the size of the answer—never the size of the archive.
+
+
+Let’s let the Codex REST API Gateway remember its answers, OMEGA. Dashboards poll /relics, /contributors and /status every few seconds, and between archive writes every poll used to rebuild the same JSON. Each GET response is now cached under its route, its query string and the archive generation, with a strong ETag over its bytes: a repeat poll is one dictionary lookup, and a poll that sends If-None-Match gets a bodiless 304.
+
+---
+
+🜂 codex_api.py — Cached REST Gateway
+
+`python
+# 🜂 Codex REST API Gateway: Response cache keyed by route + query + archive generation, with ETags
+# Every route above stays as it is; these hooks wrap them
+
+import hashlib
+import threading
+
+from flask import Response, g
+
+from archive_store import ARCHIVE_BACKEND
+from relic_archive import _archive_signature, archive_generation, load_archive
+
+RESPONSE_CACHE_LIMIT = 512
+
+_response_cache = {}
+_cached_generation = None
+_response_cache_lock = threading.Lock()
+
+def current_generation():
+    """
+    Returns a value that changes whenever the archive does
+    The journal backend has the load_archive generation; SQLite and shards fall back to their file signature
+    """
+    if ARCHIVE_BACKEND == "journal":
+        load_archive()
+        return archive_generation()
+    return _archive_signature()
+
+@app.before_request
+def serve_cached_response():
+    """
+    Answers a repeated GET from the cache: 304 when If-None-Match carries its ETag, else the stored bytes
+    """
+    global _cached_generation
+    g.cache_key = None
+    if request.method != "GET":
+        return None
+    generation = current_generation()
+    key = (request.path, request.query_string, generation)
+    with _response_cache_lock:
+        if generation != _cached_generation:
+            _response_cache.clear()
+            _cached_generation = generation
+        cached = _response_cache.get(key)
+    if cached is None:
+        g.cache_key = key
+        return None
+    body, headers = cached
+    return Response(body, headers=headers).make_conditional(request)
+
+@app.after_request
+def cache_response(response):
+    """
+    Tags a fresh 200 response with a strong ETag over its bytes and caches it
+    """
+    key = g.get("cache_key")
+    if key is None or response.status_code != 200 or response.direct_passthrough:
+        return response
+    body = response.get_data()
+    response.set_etag(hashlib.sha256(body).hexdigest())
+    with _response_cache_lock:
+        if key[2] == _cached_generation:
+            if len(_response_cache) >= RESPONSE_CACHE_LIMIT:
+                _response_cache.pop(next(iter(_response_cache)))
+            _response_cache[key] = (body, list(response.headers))
+    return response.make_conditional(request)
+`
+
+---
+
+🔍 What This Layer Does
+
+- Caches every 200 GET response by route, query string and archive generation, so each page and search is cached on its own
+- Tags it with a strong ETag: the SHA-256 of its exact bytes
+- Replays a cached response without calling the route or touching the JSON encoder
+- Answers If-None-Match with 304 Not Modified and no body, on fresh and cached responses alike
+- Clears the whole cache the moment the archive generation moves, so no poll ever sees a stale archive
+- Keeps at most 512 responses, dropping the oldest first
+- Reads the generation from load_archive on the journal backend, and from the archive file signature on SQLite and shards
+
+---
+
+🛠️ Invocation
+
+Poll like a dashboard:
+
+`bash
+curl -i http://localhost:5000/contributors
+curl -i -H 'If-None-Match: "<etag from above>"' http://localhost:5000/contributors
+`
+
+> The second call returns 304 Not Modified until a new relic is archived.
+
+
+Let’s let the Codex REST API Gateway follow the archive while it runs, OMEGA. A background watcher checks the archive files every second; when relics are appended it reads only the new journal lines, extends the relic ID and contributor indexes by the new positions alone, and swaps the whole snapshot in with one assignment. Requests never wait for a reload—each reads the snapshot that was current when it asked—and new relics appear within a second, no restart required.
+
+---
+
+🜂 codex_api.py — Hot-Reloading REST Gateway
+
+`python
+# 🜂 Codex REST API Gateway: Background archive watcher with atomic snapshot swaps
+# Replace current_generation of the cached layer above with this version
+
+if hasattr(store, "watch"):
+    store.watch()
+
+def current_generation():
+    """
+    Returns a value that changes whenever the archive does
+    The journal backend reports the generation of its current snapshot, without touching the files
+    """
+    if hasattr(store, "generation"):
+        return store.generation()
+    return _archive_signature()
+`
+
+---
+
+🔍 What This Layer Does
+
+- Starts the archive store’s watcher when the gateway loads (journal backend)
+- Picks up appended relics by parsing only the new journal lines
+- Extends copies of the relic ID and contributor indexes, then swaps view, indexes and generation in one assignment
+- Lets requests in flight finish on the snapshot they started with
+- Falls back to a full reload after a compaction or a rewrite—still off the request path
+- Clears the response cache exactly when a new snapshot is swapped in
+- Leaves SQLite and shards, which always read live, as they were
+
+
+Let’s stop re-encoding relics that never change, OMEGA. The journal store now keeps every relic’s compact JSON bytes in its snapshot—encoded once when the archive loads, and only for the new relics when it grows—and the list routes assemble their responses by joining those fragments. jsonify is left to the small answers; a page of a thousand relics is a single bytes join. A benchmark compares the cost per 10k relics before and after.
+
+---
+
+🜂 codex_api.py — Pre-Encoded REST Gateway
+
+`python
+# 🜂 Codex REST API Gateway: List responses joined from pre-encoded relic JSON
+# Replace _paged, getallrelics, search_relics and relicsbycontributor above with these
+
+import statistics
+
+from archive_store import encode_relic_json
+
+if hasattr(store, "encode_relics"):
+    store.encode_relics = True
+    store.refresh()
+
+def encode_relics(relics):
+    """
+    Returns one JSON fragment per relic, from the store's snapshot when it keeps them
+    """
+    if hasattr(store, "encoded"):
+        return store.encoded(relics)
+    return [encode_relic_json(relic) for relic in relics]
+
+def json_list(relics):
+    return Response(b"[" + b",".join(encode_relics(relics)) + b"]", mimetype="application/json")
+
+def _paged(relics, total, more, limit):
+    """
+    Returns a page of relics with X-Total-Count, and X-Next-Cursor plus a Link header when more follow
+    """
+    response = json_list(relics)
+    response.headers["X-Total-Count"] = str(total)
+    if more and relics:
+        cursor = encode_cursor(relics[-1]["relic_id"])
+        args = dict(request.args, cursor=cursor, limit=limit)
+        response.headers["X-Next-Cursor"] = cursor
+        response.headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+    return response
+
+@app.route("/relics", methods=["GET"])
+def getallrelics():
+    """
+    Returns one page of relics in archive order
+    """
+    try:
+        limit, after = _page_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    relics = store.page(after, limit)
+    total = store.count()
+    return _paged(relics, total, after + len(relics) < total, limit)
+
+@app.route("/relics/search", methods=["GET"])
+def search_relics():
+    """
+    Returns one page of relics whose event, theme, or contributor matches q
+    """
+    try:
+        limit, after = _page_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    total, relics, more = search_page(request.args.get("q", ""), after, limit)
+    return _paged(relics, total, more, limit)
+
+@app.route("/relics/by-contributor/<name>", methods=["GET"])
+def relicsbycontributor(name):
+    """
+    Returns all relics authored by a specific contributor
+    """
+    return json_list(store.by_contributor(name))
+
+def benchmark_encoding(count=100_000, batch=10_000, rounds=10):
+    """
+    Times jsonify against joining pre-encoded fragments for batch relics, over a synthetic journal archive
+    """
+    from codex_merge import merge_codex
+    from relic_archive import save_archive
+
+    home = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix="codex_bench_")
+    os.chdir(workdir)
+    try:
+        save_archive([merge_codex(f"Event {i}: Theme {i % 40}", contributor=f"Scribe{i % 25}") for i in range(count)])
+        started = time.perf_counter()
+        store.refresh()
+        print(f"🧮 {count:,} relics loaded and encoded in {time.perf_counter() - started:.2f}s")
+        relics = store.page(0, batch)
+        with app.test_request_context():
+            for name, build in (("jsonify (before)", lambda: jsonify(relics)), ("joined fragments", lambda: json_list(relics))):
+                timings = []
+                for _ in range(rounds):
+                    started = time.perf_counter()
+                    build().get_data()
+                    timings.append(time.perf_counter() - started)
+                print(f"   {name:<18} {statistics.median(timings) * 1000:8.2f} ms per {batch:,} relics")
+    finally:
+        os.chdir(home)
+        shutil.rmtree(workdir)
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    elif len(sys.argv) > 1 and sys.argv[1] == "benchmark-encoding":
+        benchmark_encoding(int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)
+    else:
+        app.run(debug=True, port=5000)
+`
+
+---
+
+🔍 What This Layer Does
+
+- Asks the journal store to keep each relic’s compact JSON bytes in its snapshot
+- Encodes the whole archive once on load, then only the appended relics on each hot reload
+- Builds /relics, /relics/search and /relics/by-contributor/<name> responses with one bytes join
+- Falls back to encoding per relic on SQLite and shards, still skipping jsonify’s sorting and indenting
+- Leaves small answers (/status, /contributors, single relics, errors) to jsonify
+- Benchmarks jsonify against the joined fragments, per 10k relics
+
+---
+
+🛠️ Invocation
+
+Compare the two paths:
+
+`bash
+python3 codex_api.py benchmark-encoding 100000
+`
+
+> Relics are served with their keys in archive order and no whitespace—the same JSON values as before.
+
+
+Let’s compress the Codex on the wire, OMEGA. A page of relics is highly repetitive JSON—the same invocation_log on every relic—so gzip shrinks it many times over. The gateway now honours Accept-Encoding: gzip for any answer over a kilobyte. The first gzip request for a cached response compresses it chunk by chunk as it streams out and keeps the result beside the plain bytes, under the same route, query and archive generation; every later poll gets the compressed bytes with no compression work at all.
+
+---
+
+🜂 codex_api.py — Compressed REST Gateway
+
+`python
+# 🜂 Codex REST API Gateway: gzip negotiation with streamed compression and cached gzip variants
+# Replace serve_cached_response and cache_response of the cached layer above with these
+
+import zlib
+
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+GZIP_CHUNK = 64 * 1024
+
+def accepts_gzip():
+    return request.accept_encodings["gzip"] > 0
+
+def stream_gzip(entry):
+    """
+    Yields the gzip form of a cached body chunk by chunk, then keeps it in the cache entry
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    body, parts = entry["body"], []
+    for start in range(0, len(body), GZIP_CHUNK):
+        part = compressor.compress(body[start:start + GZIP_CHUNK])
+        if part:
+            parts.append(part)
+            yield part
+    parts.append(compressor.flush())
+    yield parts[-1]
+    entry["gzip"] = b"".join(parts)
+
+def respond_from_cache(entry):
+    """
+    Answers from a cache entry in the encoding the client accepts, or 304 when its ETag still matches
+    """
+    if len(entry["body"]) < GZIP_MIN_SIZE or not accepts_gzip():
+        response = Response(entry["body"], headers=entry["headers"])
+        response.set_etag(entry["etag"])
+        response.vary.add("Accept-Encoding")
+        return response.make_conditional(request)
+
+    etag = entry["etag"] + "-gzip"
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    elif entry["gzip"] is not None:
+        response = Response(entry["gzip"], headers=entry["headers"])
+    else:
+        response = Response(stream_gzip(entry), headers=entry["headers"])
+    response.set_etag(etag)
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+@app.before_request
+def serve_cached_response():
+    """
+    Answers a repeated GET from the cache, plain or gzip
+    """
+    global _cached_generation
+    g.cache_key = None
+    if request.method != "GET":
+        return None
+    generation = current_generation()
+    key = (request.path, request.query_string, generation)
+    with _response_cache_lock:
+        if generation != _cached_generation:
+            _response_cache.clear()
+            _cached_generation = generation
+        entry = _response_cache.get(key)
+    if entry is None:
+        g.cache_key = key
+        return None
+    return respond_from_cache(entry)
+
+@app.after_request
+def cache_response(response):
+    """
+    Caches a fresh 200 response with a strong ETag over its bytes, then answers from that entry
+    """
+    key = g.get("cache_key")
+    if key is None or response.status_code != 200 or response.direct_passthrough:
+        return response
+    body = response.get_data()
+    entry = {
+        "body": body,
+        "headers": [(name, value) for name, value in response.headers if name not in ("Content-Length", "ETag")],
+        "etag": hashlib.sha256(body).hexdigest(),
+        "gzip": None
+    }
+    with _response_cache_lock:
+        if key[2] == _cached_generation:
+            if len(_response_cache) >= RESPONSE_CACHE_LIMIT:
+                _response_cache.pop(next(iter(_response_cache)))
+            _response_cache[key] = entry
+    return respond_from_cache(entry)
+`
+
+---
+
+🔍 What This Layer Does
+
+- Sends gzip whenever Accept-Encoding allows it and the answer is at least 1 KB
+- Compresses a page in 64 KB steps as it streams out, so the first compressed byte leaves before the last is compressed
+- Keeps the finished gzip bytes beside the plain ones in the response cache, keyed by route, query and archive generation
+- Serves every later gzip poll straight from those bytes, and drops them with the rest when the archive changes
+- Gives each encoding its own strong ETag (the gzip one ends in -gzip), so If-None-Match stays exact
+- Adds Vary: Accept-Encoding, so proxies never mix the two forms
+
+---
+
+🛠️ Invocation
+
+Fetch a compressed page:
+
+`bash
+curl -s --compressed -D - "http://localhost:5000/relics?limit=1000" -o /dev/null
+`
+
+> Clients that send no Accept-Encoding, or refuse gzip, still get plain JSON.
+
+
+Let’s open the Codex REST API Gateway for writing, OMEGA. Producers no longer shell out to relic_archive.py: POST /relics takes a JSON array or an NDJSON stream of flyer titles, merges each with merge_codex, commits them in batches of a thousand through the archive’s own commit path, and answers with the relic IDs it assigned. An Idempotency-Key header makes retries safe—the same key and body get the first answer back instead of a second set of relics, and a retry after a failed request picks up after its last committed batch.
+
+---
+
+🜂 codex_api.py — Writable REST Gateway
+
+`python
+# 🜂 Codex REST API Gateway: Bulk POST /relics with batched commits and idempotency keys
+# Titles -> merge_codex -> batches of POST_BATCH_SIZE -> _commit_scrolls -> relic IDs
+
+import json
+import sqlite3
+
+from codex_merge import merge_codex
+from ingest_pipeline import chunked
+from relic_archive import _commit_scrolls
+
+POST_BATCH_SIZE = 1000
+IDEMPOTENCY_DB = "codex_idempotency.db"
+IDEMPOTENCY_TTL = 24 * 60 * 60
+IDEMPOTENCY_PENDING_TIMEOUT = 10 * 60
+RECOVERY_CHUNK = 10000
+
+class IdempotencyConflict(Exception):
+    """
+    Raised when a resumed request's body differs from the part its key already committed
+    """
+
+class IdempotencyLedger:
+    """
+    Remembers the answer to each Idempotency-Key for a day, so a retried POST is answered, not re-run
+    A key is claimed before its request runs; every committed batch is recorded against it, so a retry
+    after a failure (or a claim older than the pending timeout) resumes after the last committed batch
+    """
+
+    def __init__(self, path=IDEMPOTENCY_DB):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        conn.executescript(
+            "CREATE TABLE IF NOT EXISTS requests ("
+            "key TEXT PRIMARY KEY, fingerprint TEXT, status INTEGER, response TEXT, created REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS requests_created ON requests(created);"
+            "CREATE TABLE IF NOT EXISTS batches ("
+            "key TEXT NOT NULL, first_entry INTEGER NOT NULL, relic_ids TEXT NOT NULL, skipped INTEGER NOT NULL,"
+            "PRIMARY KEY (key, first_entry));"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(requests)")}
+        for column, kind in (("running", "INTEGER NOT NULL DEFAULT 1"), ("updated", "REAL"),
+                             ("entries", "INTEGER NOT NULL DEFAULT 0"), ("prefix", "TEXT"), ("intent", "TEXT")):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE requests ADD COLUMN {column} {kind}")
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def claim(self, key):
+        """
+        Claims key and returns None, or returns what is already stored for it as a dict:
+        fingerprint, status and response once the request with the key has answered; otherwise
+        resumable (False while it is still running), and the entries, prefix, intent and batches it committed
+        """
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("DELETE FROM requests WHERE created < ?", (now - IDEMPOTENCY_TTL,)).rowcount:
+                conn.execute("DELETE FROM batches WHERE key NOT IN (SELECT key FROM requests)")
+            row = conn.execute(
+                "SELECT fingerprint, status, response, running, updated, entries, prefix, intent "
+                "FROM requests WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                conn.execute("INSERT INTO requests (key, created, updated) VALUES (?, ?, ?)", (key, now, now))
+                conn.execute("COMMIT")
+                return None
+            fingerprint, status, response, running, updated, entries, prefix, intent = row
+            resumable = status is None and (not running or (updated or 0) < now - IDEMPOTENCY_PENDING_TIMEOUT)
+            if resumable:
+                conn.execute("UPDATE requests SET running = 1, updated = ? WHERE key = ?", (now, key))
+            batches = conn.execute(
+                "SELECT relic_ids, skipped FROM batches WHERE key = ? ORDER BY first_entry", (key,)
+            ).fetchall()
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return {
+            "fingerprint": fingerprint, "status": status, "response": response, "resumable": resumable,
+            "entries": entries, "prefix": prefix, "intent": json.loads(intent) if intent else None,
+            "batches": [(json.loads(relic_ids), skipped) for relic_ids, skipped in batches]
+        }
+
+    def begin_batch(self, key, mark, size, prefix):
+        """
+        Records the batch about to be committed: the archive size before it, its entry count, and
+        the body prefix hash once it is consumed, so a retry can look for it if its record never lands
+        """
+        self._connect().execute(
+            "UPDATE requests SET intent = ?, updated = ? WHERE key = ?",
+            (json.dumps({"mark": mark, "size": size, "prefix": prefix}), time.time(), key)
+        )
+
+    def commit_batch(self, key, first_entry, entries, prefix, relic_ids, skipped):
+        """
+        Records a committed batch and the entries consumed through it, in one transaction
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO batches (key, first_entry, relic_ids, skipped) VALUES (?, ?, ?, ?)",
+                (key, first_entry, json.dumps(relic_ids), skipped)
+            )
+            conn.execute(
+                "UPDATE requests SET entries = ?, prefix = ?, intent = NULL, updated = ? WHERE key = ?",
+                (entries, prefix, time.time(), key)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def complete(self, key, fingerprint, status, response):
+        conn = self._connect()
+        conn.execute(
+            "UPDATE requests SET fingerprint = ?, status = ?, response = ?, running = 0 WHERE key = ?",
+            (fingerprint, status, json.dumps(response), key)
+        )
+        conn.execute("DELETE FROM batches WHERE key = ?", (key,))
+
+    def pause(self, key):
+        """
+        Marks a failed request's key as resumable, keeping the batches it committed
+        """
+        self._connect().execute("UPDATE requests SET running = 0 WHERE key = ?", (key,))
+
+idempotency = IdempotencyLedger()
+
+def _title_entry(item, contributor):
+    if isinstance(item, str) and item.strip():
+        return item.strip(), contributor
+    if isinstance(item, dict) and isinstance(item.get("title"), str) and item["title"].strip():
+        return item["title"].strip(), str(item.get("contributor") or contributor)
+    raise ValueError('each entry must be a flyer title or {"title": ..., "contributor": ...}')
+
+def iter_posted_titles(hasher, contributor):
+    """
+    Yields (title, contributor) from a JSON array body, or line by line from an NDJSON body
+    Every byte read is fed to hasher, for the idempotency fingerprint
+    """
+    if request.mimetype == "application/x-ndjson":
+        for line in request.stream:
+            hasher.update(line)
+            if line.strip():
+                yield _title_entry(json.loads(line), contributor)
+        return
+    body = request.get_data()
+    hasher.update(body)
+    titles = json.loads(body or b"null")
+    if not isinstance(titles, list):
+        raise ValueError("expected a JSON array of flyer titles")
+    for item in titles:
+        yield _title_entry(item, contributor)
+
+def _commit_batch(batch, key=None):
+    """
+    Merges and commits one batch; returns the relic IDs assigned and how many the Glyph Ledger skipped
+    Every backend mints a relic's ID from its archive index, so the IDs follow from the first index
+    """
+    scrolls = [merge_codex(title, contributor) for title, contributor in batch]
+    first = _commit_scrolls(scrolls, "codex_api", key)
+    if first is None:
+        return [], len(batch)
+    return [relic_id_for(index) for index in range(first, first + len(scrolls))], len(batch) - len(scrolls)
+
+def _add_batch(result, relic_ids, skipped):
+    result["relic_ids"].extend(relic_ids)
+    result["skipped"] += skipped
+    result["archived"] = len(result["relic_ids"])
+
+def ingest_titles(entries, result):
+    """
+    Merges and commits entries in batches of POST_BATCH_SIZE, recording assigned relic IDs in result
+    An invalid entry stops the ingest before its batch is committed
+    """
+    for batch in chunked(entries, POST_BATCH_SIZE):
+        _add_batch(result, *_commit_batch(batch))
+    return result
+
+def _recover_batch(key, intent, recorded):
+    """
+    Returns the relic IDs of a batch key committed past intent's mark without recording it, or None
+    The mark may trail the archive (a watched snapshot), so relics of batches already recorded are passed over
+    """
+    if hasattr(store, "refresh"):
+        store.refresh()
+    recorded = set(recorded)
+    found, after = [], intent["mark"]
+    while relics := store.page(after=after, limit=RECOVERY_CHUNK):
+        after = store.position(relics[-1]["relic_id"])
+        # The store's own relic IDs, so every ID handed back resolves through GET /relics/<id>
+        found.extend(
+            relic["relic_id"] for relic in relics
+            if relic.get("archivelog", {}).get("request") == key and relic["relic_id"] not in recorded
+        )
+    return found or None
+
+def ingest_idempotent(key, claimed, entries, result):
+    """
+    Like ingest_titles, but records every committed batch against key; a resumed request adds the batches
+    already recorded to result, skips the entries they consumed and commits only the rest
+    Exactly once holds with or without the Glyph Ledger: a batch committed but never recorded is
+    found again by the key in its relics' archivelog
+    """
+    done, prefix = 0, None
+    if claimed:
+        done, prefix = claimed["entries"], claimed["prefix"]
+        for relic_ids, skipped in claimed["batches"]:
+            _add_batch(result, relic_ids, skipped)
+        intent = claimed["intent"]
+        if intent and (relic_ids := _recover_batch(key, intent, result["relic_ids"])) is not None:
+            skipped = intent["size"] - len(relic_ids)
+            idempotency.commit_batch(key, done, done + intent["size"], intent["prefix"], relic_ids, skipped)
+            _add_batch(result, relic_ids, skipped)
+            done, prefix = done + intent["size"], intent["prefix"]
+
+    consumed = hashlib.sha256()
+
+    def remaining():
+        # Entries the key already committed are hashed, not re-committed; the hash proves the body matches
+        count = 0
+        for entry in entries:
+            consumed.update(json.dumps(entry).encode() + b"\n")
+            count += 1
+            if count == done and consumed.hexdigest() != prefix:
+                raise IdempotencyConflict()
+            if count > done:
+                yield entry
+        if count < done:
+            raise IdempotencyConflict()
+
+    for batch in chunked(remaining(), POST_BATCH_SIZE):
+        batch_prefix = consumed.hexdigest()
+        idempotency.begin_batch(key, store.count(), len(batch), batch_prefix)
+        relic_ids, skipped = _commit_batch(batch, key)
+        idempotency.commit_batch(key, done, done + len(batch), batch_prefix, relic_ids, skipped)
+        _add_batch(result, relic_ids, skipped)
+        done += len(batch)
+    return result
+
+def _idempotent_replay(row):
+    if row["status"] is None:
+        return jsonify({"error": "A request with this Idempotency-Key is still running"}), 409
+    if hashlib.sha256(request.get_data()).hexdigest() != row["fingerprint"]:
+        return jsonify({"error": "This Idempotency-Key was already used with a different body"}), 422
+    replayed = jsonify(json.loads(row["response"]))
+    replayed.status_code = row["status"]
+    replayed.headers["Idempotent-Replayed"] = "true"
+    return replayed
+
+@app.route("/relics", methods=["POST"])
+def addrelics():
+    """
+    Archives a JSON array or NDJSON stream of flyer titles and returns their relic IDs
+    """
+    key = request.headers.get("Idempotency-Key")
+    claimed = idempotency.claim(key) if key else None
+    if claimed is not None and not claimed["resumable"]:
+        return _idempotent_replay(claimed)
+
+    hasher = hashlib.sha256()
+    result = {"archived": 0, "skipped": 0, "relic_ids": []}
+    entries = iter_posted_titles(hasher, request.args.get("contributor", "OMEGA"))
+    try:
+        if key:
+            ingest_idempotent(key, claimed, entries, result)
+        else:
+            ingest_titles(entries, result)
+    except IdempotencyConflict:
+        idempotency.pause(key)
+        return jsonify({"error": "This Idempotency-Key was already used with a different body"}), 422
+    except ValueError as e:
+        if key:
+            idempotency.pause(key)
+        return jsonify(dict(result, error=str(e))), 400
+    except Exception:
+        if key:
+            idempotency.pause(key)
+        raise
+    finally:
+        if hasattr(store, "refresh"):
+            store.refresh()
+
+    if key:
+        idempotency.complete(key, hasher.hexdigest(), 201, result)
+    return jsonify(result), 201
+`
+
+---
+
+🔍 What This Layer Does
+
+- Accepts a JSON array, or an NDJSON stream (Content-Type: application/x-ndjson) read line by line
+- Takes plain titles or {"title", "contributor"} objects; ?contributor= sets the default contributor
+- Merges each title with merge_codex and commits every 1000 scrolls through _commit_scrolls, which keeps the search index and Glyph Ledger in step
+- Answers 201 with the relic IDs assigned, plus how many titles the Glyph Ledger skipped as already archived
+- Stores each Idempotency-Key’s answer for 24 hours: the same key and body replay it (Idempotent-Replayed: true), a different body gets 422, a retry racing the first request gets 409
+- Records every committed batch’s relic IDs against its Idempotency-Key, so a retry after a failure resumes after the last committed batch and answers with every relic ID
+- Checks that a resumed body starts with the entries already committed (else 422), and tags POSTed relics with their key, so a batch committed just before a crash is found, not repeated
+- Holds exactly once with CODEX_DEDUP=off too; the Glyph Ledger only decides which titles are new
+- Refreshes the journal snapshot before answering, so the new relics are readable at once
+
+---
+
+🛠️ Invocation
+
+Archive a batch of titles:
+
+`bash
+curl -X POST -H "Content-Type: application/json" -H "Idempotency-Key: batch-0001" \
+     -d '["Cosmic Ball: Stars in Motion", {"title": "Neon Veil: Sonic Noir", "contributor": "Nova"}]' \
+     "http://localhost:5000/relics?contributor=OMEGA"
+`
+
+Or stream a whole file of them:
+
+`bash
+jq -R . flyer_titles.txt | curl -X POST -H "Content-Type: application/x-ndjson" --data-binary @- http://localhost:5000/relics
+`
+
+---
+
+Your Codex now listens as well as it speaks—every producer one request away from the archive, and no retry ever carving a relic twice.
@@ -0,0 +1,227 @@
+Then let us summon the Async Codex Gateway, OMEGA—an ASGI twin of the REST API Gateway. It answers the same routes, but /relics and /relics/search no longer build one giant response in memory: relics leave the store a batch at a time and reach the client as chunked JSON (or NDJSON), so every request holds only a few batches however large the archive grows, and a slow client waits on its own coroutine instead of a worker.
+
+---
+
+🜂 codex_asgi.py — Streaming ASGI Gateway
+
+This relic will:
+- Serve /status, /relics, /relics/search, /relics/<id>, /contributors and /relics/by-contributor/<name> over ASGI
+- Stream relic lists as one chunked JSON array, or as NDJSON on request
+- Read the store on a producer thread, never on the event loop
+- Keep memory per request constant with a bounded queue between store and socket
+- Stop reading the store as soon as a client disconnects
+
+---
+
+🜂 codex_asgi.py — Sovereign Async Engine
+
+`python
+# 🜂 Async Codex Gateway: ASGI routes with streamed JSON / NDJSON relic lists
+# Store -> producer thread -> bounded queue -> http.response.body chunks
+
+import asyncio
+import json
+import threading
+from urllib.parse import parse_qs
+
+from archive_store import open_store
+
+STREAM_BATCH = 500
+STREAM_QUEUE = 4
+NDJSON_TYPE = "application/x-ndjson"
+
+store = open_store()
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False).encode()
+
+def json_chunks(relics, batch=STREAM_BATCH):
+    """
+    Yields one JSON array as byte chunks of up to batch relics each
+    """
+    yield b"["
+    sep = b"\n"
+    chunk = []
+    for relic in relics:
+        chunk.append(sep + _dumps(relic))
+        sep = b",\n"
+        if len(chunk) == batch:
+            yield b"".join(chunk)
+            chunk = []
+    chunk.append(b"\n]\n")
+    yield b"".join(chunk)
+
+def ndjson_chunks(relics, batch=STREAM_BATCH):
+    """
+    Yields one relic per line as byte chunks of up to batch relics each
+    """
+    chunk = []
+    for relic in relics:
+        chunk.append(_dumps(relic) + b"\n")
+        if len(chunk) == batch:
+            yield b"".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"".join(chunk)
+
+async def _start(send, status, content_type):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type.encode())]
+    })
+
+async def send_json(send, payload, status=200):
+    body = _dumps(payload)
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    })
+    await send({"type": "http.response.body", "body": body})
+
+async def send_stream(send, chunks, content_type):
+    """
+    Sends byte chunks from a blocking generator as a chunked response
+    The generator runs whole on one producer thread (SQLite cursors stay on their thread),
+    and the bounded queue holds it back whenever the client reads slower than the store
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=STREAM_QUEUE)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if stop.is_set():
+                    break
+                asyncio.run_coroutine_threadsafe(queue.put(chunk), loop).result()
+        finally:
+            asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+
+    producer = loop.run_in_executor(None, produce)
+    try:
+        await _start(send, 200, content_type)
+        while (chunk := await queue.get()) is not None:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        stop.set()
+        # Drain whatever the producer is still waiting to hand over, so it can exit
+        while not producer.done():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                await asyncio.sleep(0.01)
+        await producer
+
+async def stream_relics(scope, send, relics):
+    """
+    Streams relics as NDJSON when asked (?format=ndjson or Accept: application/x-ndjson), else as a JSON array
+    """
+    query = parse_qs(scope.get("query_string", b"").decode())
+    accept = dict(scope.get("headers", [])).get(b"accept", b"").decode()
+    if query.get("format", [""])[0] == "ndjson" or NDJSON_TYPE in accept:
+        await send_stream(send, ndjson_chunks(relics), NDJSON_TYPE)
+    else:
+        await send_stream(send, json_chunks(relics), "application/json")
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send):
+    """
+    The ASGI application: the REST Gateway's routes, with relic lists streamed
+    """
+    if scope["type"] == "lifespan":
+        return await _lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+    if scope["method"] != "GET":
+        return await send_json(send, {"error": "Method not allowed"}, 405)
+
+    path = scope["path"].rstrip("/") or "/"
+    query = parse_qs(scope.get("query_string", b"").decode())
+
+    if path == "/status":
+        total = await asyncio.to_thread(store.count)
+        return await send_json(send, {
+            "status": "Codex API active",
+            "total_relics": total,
+            "available_endpoints": ["/relics", "/relics/search", "/relics/<id>", "/contributors"],
+            "source": "codex_asgi.py"
+        })
+    if path == "/relics":
+        return await stream_relics(scope, send, store.stream())
+    if path == "/relics/search":
+        return await stream_relics(scope, send, store.stream_search(query.get("q", [""])[0]))
+    if path == "/contributors":
+        contributors = await asyncio.to_thread(store.contributors)
+        return await send_json(send, {"contributors": contributors})
+    if path.startswith("/relics/by-contributor/"):
+        relics = await asyncio.to_thread(store.by_contributor, path[len("/relics/by-contributor/"):])
+        return await stream_relics(scope, send, relics)
+    if path.startswith("/relics/") and path.count("/") == 2:
+        result = await asyncio.to_thread(store.get, path[len("/relics/"):])
+        if result:
+            return await send_json(send, result)
+        return await send_json(send, {"error": "Relic not found"}, 404)
+    return await send_json(send, {"error": "Not found"}, 404)
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    try:
+        import uvicorn
+    except ImportError:
+        print("⚠️ uvicorn is not installed: pip install uvicorn (or run codex_asgi:app under any ASGI server)")
+    else:
+        uvicorn.run(app, port=5000)
+`
+
+---
+
+🔍 What This Relic Does
+
+- Answers the same routes as codex_api.py, from the same Archive Store
+- Streams /relics and /relics/search as a chunked JSON array, 500 relics per chunk
+- Switches to NDJSON (one relic per line) for ?format=ndjson or Accept: application/x-ndjson
+- Iterates the store lazily (stream, stream_search), so the SQLite backend never materializes a result
+- Runs every blocking store call off the event loop; a stream’s producer thread stays put, as SQLite cursors require
+- Holds at most four chunks between the store and a slow client; the producer simply waits
+- Stops the producer and frees its thread when a client goes away mid-stream
+
+---
+
+🛠️ Invocation
+
+Run it under uvicorn (or any ASGI server):
+
+`bash
+pip install uvicorn
+python3 codex_asgi.py
+`
+
+Or choose your own server and workers:
+
+`bash
+uvicorn codex_asgi:app --port 5000 --workers 4
+`
+
+Then stream the archive:
+
+`bash
+curl -N http://localhost:5000/relics
+curl -N "http://localhost:5000/relics/search?q=Stars&format=ndjson"
+`
+
+> The Flask gateway (codex_api.py) still serves the same routes for a quick local ritual.
+
+---
+
+Your Codex now streams—every relic on the wire as soon as it leaves the store, and no client too slow to wait for.
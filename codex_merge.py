@@ -209,3 +209,365 @@ save_codex(codex, encrypt=True)
 ---
 
 This relic is now ready for archival, broadcast, or integration into a ceremonial dashboard. Next, we can ritualize a Relic Archive Engine, a Flyer-to-HTML Generator, or a Codex Dashboard Renderer. Your Codex is evolving—ready to summon the fourth relic?
+
+
+Let’s bind the Codex Merge Engine to its neighbours, OMEGA. merge_codex above calls decodeflyer and processrelic from modules that do not exist, then reads a flyer_data it never assigned—so the Relic Archive, which commits every scroll through it, could not archive a single flyer. This layer imports flyer_decoder and relic_processor by their real names and builds the same scroll from them.
+
+---
+
+🜂 codex_merge.py — Bound Merge Engine
+
+`python
+# 🜂 Codex Merge Engine: merge_codex bound to flyer_decoder and relic_processor
+# Replace merge_codex above with this version
+
+from flyer_decoder import decode_flyer
+from relic_processor import process_relic
+
+def merge_codex(title, contributor="OMEGA"):
+    """
+    Fuses flyer decoding and relic processing into one scroll
+    Adds contributor glyph and invocation log
+    """
+    flyer_data = decode_flyer(title)
+    relic_data = process_relic(title)
+    return {
+        "event": flyer_data["event"],
+        "theme": flyer_data["theme"],
+        "timestamp": flyer_data["timestamp"],
+        "encoded_glyph": relic_data["encoded_glyph"],
+        "contributor": contributor,
+        "invocation_log": {
+            "source": "codex_merge.py",
+            "method": "merge_codex",
+            "status": "Codex Merged"
+        }
+    }
+`
+
+---
+
+🔍 What This Bound Relic Does
+
+- Decodes the flyer with flyer_decoder.decode_flyer and hashes it with relic_processor.process_relic
+- Returns the scroll under encoded_glyph, the key the Relic Archive and every reader expect
+- Lets addtoarchive and every later archive layer commit real scrolls
+
+
+Let’s fuse the Codex Merge Engine down to a single pass, OMEGA. merge_codex used to call decode_flyer and process_relic, and each of them hashed the same title and read the clock on its own—so every relic cost two SHA-256 digests, and its two timestamps could disagree. The fused path hashes once, reads the clock once, and builds the scroll directly. The two-call version stays as merge_codex_unfused, and a micro-benchmark compares them.
+
+---
+
+🜂 codex_merge.py — Fused Single-Hash Merge
+
+`python
+# 🜂 Codex Merge Engine: Fused decode + process in one pass
+# Replace merge_codex above with this version; the earlier one remains as merge_codex_unfused
+
+import re
+import sys
+import time
+
+from flyer_decoder import decode_flyer
+from relic_processor import process_relic
+
+TITLE_PATTERN = re.compile(r"^(.*?):\s*(.*)$")
+
+def merge_codex_unfused(title, contributor="OMEGA"):
+    """
+    The Bound Merge Engine's merge: decodes the flyer and processes the relic separately
+    Kept as the benchmark's baseline; it returns the same scroll as merge_codex
+    """
+    flyer_data = decode_flyer(title)
+    relic_data = process_relic(title)
+    return {
+        "event": flyer_data["event"],
+        "theme": flyer_data["theme"],
+        "timestamp": flyer_data["timestamp"],
+        "encoded_glyph": relic_data["encoded_glyph"],
+        "contributor": contributor,
+        "invocation_log": {
+            "source": "codex_merge.py",
+            "method": "merge_codex",
+            "status": "Codex Merged"
+        }
+    }
+
+def merge_codex(title, contributor="OMEGA"):
+    """
+    Fuses flyer decoding and relic processing into one scroll
+    Hashes the title once and reads the clock once, so glyph and timestamp always agree
+    """
+    match = TITLE_PATTERN.match(title)
+    if match:
+        event_name, theme = match.groups()
+    else:
+        event_name, theme = title, "Unknown Transmission"
+    return {
+        "event": event_name.strip(),
+        "theme": theme.strip(),
+        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "encoded_glyph": hashlib.sha256(title.encode()).hexdigest(),
+        "contributor": contributor,
+        "invocation_log": {
+            "source": "codex_merge.py",
+            "method": "merge_codex",
+            "status": "Codex Merged"
+        }
+    }
+
+def benchmark(sizes=(1_000, 10_000, 100_000, 1_000_000)):
+    """
+    Times merge_codex_unfused against merge_codex and reports the cost per relic
+    """
+    for size in sizes:
+        titles = [f"Event {i}: Theme {i % 40}" for i in range(size)]
+        costs = {}
+        for merge in (merge_codex_unfused, merge_codex):
+            started = time.perf_counter()
+            for title in titles:
+                merge(title)
+            costs[merge.__name__] = (time.perf_counter() - started) / size * 1e6
+        before, after = costs["merge_codex_unfused"], costs["merge_codex"]
+        print(f"🧮 {size:>9,} relics: {before:6.2f} µs → {after:6.2f} µs per relic ({before / after:.2f}x)")
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        benchmark(tuple(int(n) for n in sys.argv[2:]) or (1_000, 10_000, 100_000, 1_000_000))
+    else:
+        sample_title = "Oddyssey Noir: Sonic Gate Invocation"
+        codex = merge_codex(sample_title, contributor="OMEGA")
+        print("🧿 Codex Output:")
+        print(json.dumps(codex, indent=4))
+        assert codex["encoded_glyph"] == merge_codex_unfused(sample_title)["encoded_glyph"]
+`
+
+---
+
+🔍 What This Fused Relic Does
+
+- Hashes each title once instead of twice
+- Reads the clock once, so a relic carries exactly one timestamp
+- Parses event and theme with a precompiled pattern
+- Builds the scroll dict directly, with the same keys and values as before
+- Keeps the bound two-call merge as merge_codex_unfused, a working baseline for comparison
+- Benchmarks both paths at 1k, 10k, 100k and 1M relics
+
+---
+
+🛠️ Invocation
+
+Compare the two paths:
+
+`bash
+python3 codex_merge.py benchmark 1000 10000 100000 1000000
+`
+
+Every caller—addtoarchive, addmanytoarchive and the Ingestion Pipeline—takes the fused path automatically.
+
+
+Let’s give the Codex Merge Engine a sealed scroll container, OMEGA. save_codex(encrypt=True) minted and printed a fresh Fernet key for every scroll, so 100k scrolls meant 100k keys to keep safe. The container writer seals a whole batch with one data key: the key is wrapped by a single master key kept in codex_master.key, every scroll is encrypted as its own record with AES-GCM, and an offset table at the end of the file lets any one record be read and decrypted without touching the others.
+
+---
+
+🜂 codex_merge.py — Batched Encrypted Scroll Container
+
+`python
+# 🜂 Codex Merge Engine: Sealed scroll containers, one data key per batch
+# Layout: header + wrapped data key, records (u32 length, nonce, ciphertext), u64 offset table, footer
+
+import struct
+
+# Optional: AES-GCM for the records (the data key itself is wrapped with Fernet)
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+except ImportError:
+    AESGCM = None
+
+MASTER_KEY_FILE = "codex_master.key"
+CONTAINER_MAGIC = b"CODEXSCR"
+CONTAINER_VERSION = 1
+CONTAINER_HEADER = struct.Struct("<8sHH")  # magic, version, wrapped key length
+CONTAINER_FOOTER = struct.Struct("<QQ8s")  # offset table position, record count, magic
+RECORD_LENGTH = struct.Struct("<I")
+OFFSET = struct.Struct("<Q")
+NONCE_BYTES = 12
+
+def _require_encryption():
+    if not (ENCRYPTION_ENABLED and AESGCM):
+        raise RuntimeError("🔐 Sealed scroll containers need the cryptography package")
+
+def load_master_key(path=MASTER_KEY_FILE):
+    """
+    Returns the master key from CODEX_MASTER_KEY or the key file, creating the file once if needed
+    """
+    _require_encryption()
+    if os.environ.get("CODEX_MASTER_KEY"):
+        return os.environ["CODEX_MASTER_KEY"].encode()
+    if not os.path.exists(path):
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(Fernet.generate_key())
+        print(f"🗝️ Master key created in {path}—keep it safe, every sealed container depends on it")
+    with open(path, "rb") as f:
+        return f.read().strip()
+
+class ScrollContainerWriter:
+    """
+    Seals many scrolls into one container file with a single data key
+    Written to a temporary file and renamed into place on close
+    """
+
+    def __init__(self, path, master_key=None):
+        _require_encryption()
+        self.path = path
+        self._tmp_path = path + ".tmp"
+        data_key = AESGCM.generate_key(bit_length=256)
+        wrapped = Fernet(master_key or load_master_key()).encrypt(data_key)
+        self._aead = AESGCM(data_key)
+        self._offsets = []
+        self._file = open(self._tmp_path, "wb")
+        self._file.write(CONTAINER_HEADER.pack(CONTAINER_MAGIC, CONTAINER_VERSION, len(wrapped)))
+        self._file.write(wrapped)
+
+    def add(self, scroll):
+        """
+        Encrypts one scroll as its own record and returns its position in the container
+        The position is bound into the ciphertext, so records cannot be swapped unnoticed
+        """
+        position = len(self._offsets)
+        nonce = os.urandom(NONCE_BYTES)
+        sealed = nonce + self._aead.encrypt(nonce, json.dumps(scroll).encode(), OFFSET.pack(position))
+        self._offsets.append(self._file.tell())
+        self._file.write(RECORD_LENGTH.pack(len(sealed)))
+        self._file.write(sealed)
+        return position
+
+    def close(self):
+        table = self._file.tell()
+        self._file.write(b"".join(OFFSET.pack(offset) for offset in self._offsets))
+        self._file.write(CONTAINER_FOOTER.pack(table, len(self._offsets), CONTAINER_MAGIC))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type:
+            self._file.close()
+            os.remove(self._tmp_path)
+        else:
+            self.close()
+
+class ScrollContainer:
+    """
+    Reads a sealed container: any single record is located through the offset table and decrypted alone
+    """
+
+    def __init__(self, path, master_key=None):
+        _require_encryption()
+        self._file = open(path, "rb")
+        magic, version, wrapped_length = CONTAINER_HEADER.unpack(self._file.read(CONTAINER_HEADER.size))
+        if magic != CONTAINER_MAGIC or version != CONTAINER_VERSION:
+            raise ValueError(f"{path} is not a sealed scroll container")
+        data_key = Fernet(master_key or load_master_key()).decrypt(self._file.read(wrapped_length))
+        self._aead = AESGCM(data_key)
+        self._file.seek(-CONTAINER_FOOTER.size, os.SEEK_END)
+        self._table, self._count, magic = CONTAINER_FOOTER.unpack(self._file.read(CONTAINER_FOOTER.size))
+        if magic != CONTAINER_MAGIC:
+            raise ValueError(f"{path} was not closed cleanly")
+
+    def __len__(self):
+        return self._count
+
+    def read(self, position):
+        """
+        Decrypts the scroll at position, reading only its offset and its own record
+        """
+        if not 0 <= position < self._count:
+            raise IndexError("scroll position out of range")
+        self._file.seek(self._table + position * OFFSET.size)
+        (offset,) = OFFSET.unpack(self._file.read(OFFSET.size))
+        self._file.seek(offset)
+        (length,) = RECORD_LENGTH.unpack(self._file.read(RECORD_LENGTH.size))
+        sealed = self._file.read(length)
+        plain = self._aead.decrypt(sealed[:NONCE_BYTES], sealed[NONCE_BYTES:], OFFSET.pack(position))
+        return json.loads(plain)
+
+    def __iter__(self):
+        for position in range(self._count):
+            yield self.read(position)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def save_codex_batch(scrolls, filename="codex_scrolls.sealed", master_key=None):
+    """
+    Seals a batch of scrolls into one container under a single data key
+    """
+    count = 0
+    with ScrollContainerWriter(filename, master_key) as writer:
+        for scroll in scrolls:
+            writer.add(scroll)
+            count += 1
+    print(f"🔐 {count} scrolls sealed into {filename}")
+    return count
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "sample"
+    if command == "benchmark":
+        benchmark(tuple(int(n) for n in sys.argv[2:]) or (1_000, 10_000, 100_000, 1_000_000))
+    elif command == "seal":
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+        started = time.perf_counter()
+        save_codex_batch(merge_codex(f"Event {i}: Theme {i % 40}") for i in range(count))
+        print(f"⏱️ {count / (time.perf_counter() - started):,.0f} scrolls/sec")
+        with ScrollContainer("codex_scrolls.sealed") as container:
+            print(f"🪬 Scroll {count // 2}: {container.read(count // 2)['event']}")
+    else:
+        sample_title = "Oddyssey Noir: Sonic Gate Invocation"
+        codex = merge_codex(sample_title, contributor="OMEGA")
+        print("🧿 Codex Output:")
+        print(json.dumps(codex, indent=4))
+`
+
+---
+
+🔍 What This Sealed Relic Does
+
+- Generates one 256-bit data key per container instead of one Fernet key per scroll
+- Wraps the data key with the master key (CODEX_MASTER_KEY or codex_master.key), so no key is ever printed
+- Encrypts every scroll as its own AES-GCM record with a fresh nonce, bound to its position
+- Appends a table of record offsets, so reading scroll 70,000 touches only its offset and its record
+- Writes the container to a temporary file and renames it into place once the table is complete
+
+---
+
+🛠️ Invocation
+
+Seal 100k scrolls and read one back:
+
+`bash
+python3 codex_merge.py seal 100000
+`
+
+Or seal an archive export from your own ritual:
+
+`python
+from codex_merge import ScrollContainer, save_codex_batch
+
+save_codex_batch(load_archive(), "nightly.sealed")
+with ScrollContainer("nightly.sealed") as container:
+    print(container.read(42))
+`
@@ -0,0 +1,331 @@
+Then let us summon the Codex Merkle Log, OMEGA—a Python module that seals every relic hash into an append-only Merkle tree. Each append touches only the O(log n) nodes above the new leaf, one root hash vouches for the whole archive, and two nodes that disagree find exactly where by trading subtree hashes level by level—never whole files.
+
+---
+
+🜂 codex_merkle.py — Incremental Merkle Integrity
+
+This relic will:
+- Keep an append-only Merkle tree over relic hashes, RFC 6962 style
+- Append in O(log n) and report the root hash at any size
+- Save and reload the tree without rehashing a single leaf
+- Compare two trees subtree by subtree and return the diverging leaf ranges
+- Back both the archive (relic_archive.py) and the merged codex (codexmergedaemon.py)
+
+---
+
+🜂 codex_merkle.py — Sovereign Merkle Engine
+
+`python
+# 🜂 Codex Merkle Log: Append-only Merkle tree with O(log n) appends and subtree diffs
+# Leaves hash as sha256(0x00 + data), inner nodes as sha256(0x01 + left + right)
+
+import hashlib
+import json
+import os
+import struct
+import sys
+
+from archive_writer import file_lock
+
+HASH_BYTES = 32
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+LOG_MAGIC = b"CODEXMRK"
+LOG_HEADER = struct.Struct("<8sH")  # magic, format version
+LOG_VERSION = 1
+NODE_RECORD = 1 + HASH_BYTES  # level byte, hash
+SYNC_CHUNK = 10000
+
+def leaf_hash(data):
+    return hashlib.sha256(LEAF_PREFIX + data).digest()
+
+def node_hash(left, right):
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+def relic_leaf(relic):
+    """
+    Returns the canonical bytes of a relic: every field, sorted keys, no whitespace
+    """
+    return json.dumps(relic, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+class MerkleLog:
+    """
+    Append-only Merkle tree
+    levels[h][i] is the hash of the complete subtree over leaves i*2^h .. (i+1)*2^h - 1
+    """
+
+    def __init__(self):
+        self.levels = [[]]
+        # Nodes per level already in the saved file, and that file's size, once saved or loaded
+        self._saved = None
+        self._saved_size = None
+
+    def __len__(self):
+        return len(self.levels[0])
+
+    def append(self, data):
+        """
+        Adds one leaf and completes the subtrees it closes: O(log n) hashes
+        """
+        self._push(0, leaf_hash(data))
+        return len(self) - 1
+
+    def _push(self, level, digest):
+        while True:
+            if level == len(self.levels):
+                self.levels.append([])
+            nodes = self.levels[level]
+            nodes.append(digest)
+            if len(nodes) % 2:
+                return
+            digest = node_hash(nodes[-2], nodes[-1])
+            level += 1
+
+    def extend(self, items):
+        for data in items:
+            self.append(data)
+
+    def _peaks(self, size):
+        """
+        Splits leaves 0..size-1 into complete subtrees, largest first, as (level, index)
+        """
+        peaks, start = [], 0
+        for level in range(size.bit_length() - 1, -1, -1):
+            if size & (1 << level):
+                peaks.append((level, start >> level))
+                start += 1 << level
+        return peaks
+
+    def root(self, size=None):
+        """
+        Returns the root hash over the first size leaves (all of them by default)
+        """
+        size = len(self) if size is None else size
+        if not size:
+            return hashlib.sha256(b"").digest()
+        peaks = [self.levels[level][index] for level, index in self._peaks(size)]
+        digest = peaks.pop()
+        while peaks:
+            digest = node_hash(peaks.pop(), digest)
+        return digest
+
+    def root_hex(self, size=None):
+        return self.root(size).hex()
+
+    def node_hashes(self, level, indices):
+        """
+        Returns the hashes of complete subtrees at level; a peer asks for these while diffing
+        """
+        nodes = self.levels[level] if level < len(self.levels) else []
+        return [nodes[i] if i < len(nodes) else None for i in indices]
+
+    def _records(self, start):
+        """
+        Encodes the nodes of every level from start[level] on as (level, hash) records, lower levels first
+        """
+        return b"".join(
+            bytes((level,)) + digest
+            for level, nodes in enumerate(self.levels)
+            for digest in nodes[start[level] if level < len(start) else 0:]
+        )
+
+    def _mark_saved(self, size):
+        self._saved = [len(nodes) for nodes in self.levels]
+        self._saved_size = size
+
+    def save(self, path):
+        """
+        Writes every leaf and inner node hash as one record each, so loading never rehashes
+        """
+        data = LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION) + self._records([])
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._mark_saved(len(data))
+
+    def flush(self, path):
+        """
+        Appends only the nodes added since the last save or load: O(log n) records per new leaf
+        Falls back to save() when the file is not the one this log last wrote or read
+        """
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = None
+        if self._saved is None or size != self._saved_size:
+            return self.save(path)
+        data = self._records(self._saved)
+        with open(path, "ab") as f:
+            f.write(data)
+        self._mark_saved(size + len(data))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a saved log; nodes an interrupted flush never wrote are recomputed from their children
+        """
+        log = cls()
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:len(LOG_MAGIC)] != LOG_MAGIC:
+            raise ValueError(f"{path} is not a Merkle log")
+        magic, version = LOG_HEADER.unpack_from(data, 0)
+        if version != LOG_VERSION:
+            raise ValueError(f"unsupported Merkle log version {version}")
+        end = LOG_HEADER.size + (len(data) - LOG_HEADER.size) // NODE_RECORD * NODE_RECORD
+        for pos in range(LOG_HEADER.size, end, NODE_RECORD):
+            level = data[pos]
+            while level >= len(log.levels):
+                log.levels.append([])
+            log.levels[level].append(data[pos + 1:pos + NODE_RECORD])
+        log._mark_saved(end)
+        log._complete()
+        return log
+
+    def _complete(self):
+        """
+        Recomputes inner nodes whose children are present but which were never saved
+        """
+        level = 0
+        while len(self.levels[level]) > 1:
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            children, parents = self.levels[level], self.levels[level + 1]
+            del parents[len(children) // 2:]
+            for i in range(len(parents), len(children) // 2):
+                parents.append(node_hash(children[2 * i], children[2 * i + 1]))
+            level += 1
+        del self.levels[level + 1:]
+
+def diverging_ranges(local, remote_size, remote_node_hashes):
+    """
+    Finds the leaf ranges [start, stop) where local and a remote tree differ
+    remote_node_hashes(level, indices) returns the remote hashes, one batched call per level,
+    so only O(d log n) hashes cross the wire for d diverging leaves
+    """
+    common = min(len(local), remote_size)
+    frontier = local._peaks(common)
+    leaves = []
+    while frontier:
+        by_level = {}
+        for level, index in frontier:
+            by_level.setdefault(level, []).append(index)
+        frontier = []
+        for level, indices in by_level.items():
+            theirs = remote_node_hashes(level, indices)
+            for index, ours, other in zip(indices, local.node_hashes(level, indices), theirs):
+                if ours == other:
+                    continue
+                if level == 0:
+                    leaves.append(index)
+                else:
+                    frontier.extend(((level - 1, 2 * index), (level - 1, 2 * index + 1)))
+
+    ranges = []
+    for index in sorted(leaves):
+        if ranges and ranges[-1][1] == index:
+            ranges[-1][1] = index + 1
+        else:
+            ranges.append([index, index + 1])
+    if len(local) != remote_size:
+        ranges.append([common, max(len(local), remote_size)])
+    return [tuple(r) for r in ranges]
+
+def prefix_root(fetch, size):
+    """
+    Returns the root hash over the first size relics, hashing them page by page and keeping
+    only the O(log n) peaks in memory; None if fetch runs out first
+    """
+    if not size:
+        return hashlib.sha256(b"").digest()
+    peaks, position = [], 0
+    while position < size:
+        relics = fetch(position, min(SYNC_CHUNK, size - position))
+        if not relics:
+            return None
+        for relic in relics[:size - position]:
+            level, digest = 0, leaf_hash(relic_leaf(relic))
+            while peaks and peaks[-1][0] == level:
+                digest = node_hash(peaks.pop()[1], digest)
+                level += 1
+            peaks.append((level, digest))
+        position += len(relics)
+    digest = peaks.pop()[1]
+    while peaks:
+        digest = node_hash(peaks.pop()[1], digest)
+    return digest
+
+def sync_log(log, count, fetch, path=None):
+    """
+    Appends the relics the log has not seen yet: fetch(after, limit) returns up to limit relics
+    after that many, and count is how many there are
+    Rebuilds the log if the archive shrank or the relics it covers no longer hash to its root
+    """
+    covered = len(log)
+    rebuilt = covered > count or prefix_root(fetch, covered) != log.root(covered)
+    if rebuilt:
+        log.levels = [[]]
+    while len(log) < count:
+        relics = fetch(len(log), SYNC_CHUNK)
+        if not relics:
+            break
+        for relic in relics:
+            log.append(relic_leaf(relic))
+    if path and (rebuilt or len(log) != covered):
+        with file_lock(path):
+            if rebuilt:
+                log.save(path)
+            else:
+                log.flush(path)
+    return log
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    ours, theirs = MerkleLog(), MerkleLog()
+    for i in range(size):
+        ours.append(f"relic {i}".encode())
+        theirs.append(f"relic {i}".encode() if i not in (7, 8, size // 2) else b"tampered")
+    theirs.append(b"one more")
+    print(f"🌳 {size:,} leaves, root {ours.root_hex()[:16]}…")
+    asked = []
+    def remote(level, indices):
+        asked.extend(indices)
+        return theirs.node_hashes(level, indices)
+    print(f"🔀 Diverging ranges: {diverging_ranges(ours, len(theirs), remote)} ({len(asked)} subtree hashes compared)")
+`
+
+---
+
+🔍 What This Relic Does
+
+- Hashes leaves and inner nodes with distinct prefixes (RFC 6962), so a leaf can never pose as a subtree
+- Appends a leaf and the subtrees it completes—at most log₂ n hashes per append
+- Computes the root over any prefix of the log from its O(log n) peaks
+- Saves every node to disk as an append-only record log, so a sync writes only the nodes it added, and reloads without rehashing
+- Checks a synced log against its archive by rehashing the covered relics into one root, page by page, so a rewrite anywhere is caught
+- Diffs two trees top-down, one batched hash request per level, and merges diverging leaves into ranges
+- Reports leaves present on only one side as a trailing range
+
+---
+
+🛠️ Invocation
+
+See two diverging logs meet:
+
+`bash
+python3 codex_merkle.py 100000
+`
+
+Or check the archive’s root from your own ritual:
+
+`python
+from relic_archive import archive_merkle
+
+print(archive_merkle().root_hex())
+`
+
+---
+
+Your Codex can now prove itself in a single hash—and show another node exactly where their stories part.
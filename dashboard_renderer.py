@@ -280,3 +280,153 @@ This becomes your ceremonial interface—ready to deploy, embed in a Render broa
 ---
 
 Next, we can summon relic seven: a Glyph Encryption Vault, a REST API for relics, or a Contributor Badge Generator. Or we can ritualize flyer animations, relic filters, or dashboard theming. Your Codex now breathes—ready to encode, protect, and evolve. Shall we summon the seventh relic?
+
+
+Let’s teach the Codex Dashboard Renderer to stream, OMEGA. The extended renderer builds the whole page as one string from a fully loaded archive; this version walks the Archive Reader relic by relic and writes each card straight to html_gates/index.html, so memory stays flat however large the archive grows.
+
+---
+
+🜂 dashboard_renderer.py — Streaming Codex Interface Generator
+
+`python
+# 🜂 Codex Dashboard Renderer: Streaming version for archives of any size
+# Reads relics lazily through archive_reader.py and writes the dashboard card by card
+
+import os
+from archive_reader import open_archive
+
+OUTPUT_FILE = "html_gates/index.html"
+
+DASHBOARD_HEADER = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Codex Archive Dashboard</title>
+    <style>
+        body {
+            background: #0f0f0f;
+            color: #f0f0f0;
+            font-family: 'Courier New', monospace;
+            padding: 2rem;
+        }
+        h1 {
+            color: #ffcc00;
+            font-size: 2.5rem;
+            margin-bottom: 1rem;
+        }
+        .relic {
+            margin-bottom: 1.5rem;
+            padding: 1rem;
+            border: 1px solid #00ffcc;
+            border-radius: 8px;
+            background: #1a1a1a;
+        }
+        .relic a {
+            color: #00ffff;
+            text-decoration: none;
+            font-weight: bold;
+        }
+        .meta {
+            font-size: 0.9rem;
+            color: #ccc;
+        }
+        .filter {
+            margin-bottom: 2rem;
+        }
+        .filter input {
+            padding: 0.5rem;
+            font-size: 1rem;
+            width: 300px;
+            background: #222;
+            color: #fff;
+            border: 1px solid #00ffcc;
+            border-radius: 5px;
+        }
+    </style>
+    <script>
+        function filterRelics() {
+            const query = document.getElementById('filterInput').value.toLowerCase();
+            const relics = document.getElementsByClassName('relic');
+            for (let i = 0; i < relics.length; i++) {
+                const text = relics[i].innerText.toLowerCase();
+                relics[i].style.display = text.includes(query) ? 'block' : 'none';
+            }
+        }
+    </script>
+</head>
+<body>
+    <h1>🧿 Codex Archive Dashboard</h1>
+    <div class="filter">
+        <input type="text" id="filterInput" onkeyup="filterRelics()" placeholder="🔍 Filter by event, theme, contributor...">
+    </div>
+"""
+
+DASHBOARD_FOOTER = """
+</body>
+</html>
+"""
+
+def render_relic_card(i, relic):
+    """
+    Renders one relic as a dashboard card
+    """
+    glyph_preview = relic["encoded_glyph"][:16] + "..."
+    audio_embed = f"""
+    <audio controls>
+        <source src="https://example.com/sonic/{i}.mp3" type="audio/mpeg">
+        Your browser does not support the audio element.
+    </audio>
+    """ if "Sonic" in relic["theme"] else ""
+
+    return f"""
+    <div class="relic">
+        <a href="codex_gate_{i}.html" target="_blank">{relic['event']}</a>
+        <div class="meta">
+            <p>🎭 Theme: {relic['theme']}</p>
+            <p>🕰️ Timestamp: {relic['timestamp']}</p>
+            <p>🧿 Contributor: {relic.get('contributor', 'Unknown')}</p>
+            <p>🔐 Glyph: {glyph_preview}</p>
+            {audio_embed}
+        </div>
+    </div>
+    """
+
+def generate_dashboard(archive):
+    """
+    Writes the dashboard card by card from any relic iterable
+    """
+    os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        f.write(DASHBOARD_HEADER)
+        for i, relic in enumerate(archive, 1):
+            f.write(render_relic_card(i, relic))
+        f.write(DASHBOARD_FOOTER)
+    print(f"🧭 Codex dashboard generated: {OUTPUT_FILE}")
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    with open_archive() as archive:
+        generate_dashboard(archive)
+`
+
+---
+
+🔍 What This Streaming Relic Does
+
+- Streams relics from the Archive Reader instead of load_archive()
+- Writes each card to html_gates/index.html as soon as it is rendered
+- Keeps the extended dashboard’s styling, live filter, glyph previews, and sonic overlays
+- Still accepts a plain relic list, so existing invocations keep working
+
+---
+
+🛠️ Invocation
+
+`bash
+python3 dashboard_renderer.py
+`
+
+---
+
+Your dashboard now unrolls like a scroll—one relic at a time, however long the archive.
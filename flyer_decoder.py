@@ -90,3 +90,247 @@ And it will output something like:
 ---
 
 If you want to merge this with relic_processor.py, create a Codex Merge Engine next. Or we can ritualize a third relic: icon renderer, encryption overlay, or flyer-to-HTML converter. Your Codex is expanding—ready for the next glyph?
+
+
+Before the Relic Archive leans on the decoder, OMEGA, let’s bind its names. decode_flyer above hashes into encoded_glyph but returns encodedglyph, so every call dies with a NameError—and its pattern keeps only the first character of the event. This layer parses the whole “Event: Theme” title and returns the glyph under the name it was computed as.
+
+---
+
+🜂 flyer_decoder.py — Bound Flyer Decoder
+
+`python
+# 🜂 Flyer Decoder: decode_flyer with its glyph bound and the full event name parsed
+# Replace decode_flyer above with this version
+
+TITLE_PATTERN = re.compile(r"^(.*?):\s*(.*)$")
+
+def decode_flyer(title):
+    """
+    Ritualizes a flyer title into structured metadata:
+    - Extracts event name and theme
+    - Adds timestamp
+    - Encodes glyph
+    """
+    match = TITLE_PATTERN.match(title)
+    if match:
+        event_name, theme = match.groups()
+    else:
+        event_name, theme = title, "Unknown Transmission"
+    return {
+        "event": event_name.strip(),
+        "theme": theme.strip(),
+        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "encoded_glyph": hashlib.sha256(title.encode()).hexdigest(),
+        "status": "Decoded"
+    }
+`
+
+---
+
+🔍 What This Bound Relic Does
+
+- Returns the glyph as encoded_glyph, the name every other relic reads
+- Keeps the whole event name before the first colon, not just its first character
+- Falls back to “Unknown Transmission” when a title has no theme, as before
+
+
+Let’s teach the Flyer Decoder to read whole flyer pages, OMEGA. Upstream no longer sends “Event: Theme” titles alone—it sends HTML flyers like flyers/oak-space-night.html, often many of them in one batch file. The HTML mode streams each page through html.parser in small chunks, picks the event and theme out of the markup as the tags go by, and emits one relic per flyer in exactly the shape decode_flyer returns—without ever holding a whole document in memory.
+
+---
+
+🜂 flyer_decoder.py — Streaming HTML Flyer Decoder
+
+`python
+# 🜂 Flyer Decoder: Streaming HTML mode built on html.parser
+# Pages are fed in chunks; every flyer found yields a decode_flyer relic as soon as it closes
+
+import os
+from html.parser import HTMLParser
+
+HTML_CHUNK = 64 * 1024
+FLYER_CLASSES = {"flyer", "codex-gate"}
+EVENT_META = {"event", "og:title", "twitter:title"}
+THEME_META = {"theme", "og:description", "description", "twitter:description"}
+
+class FlyerHTMLDecoder(HTMLParser):
+    """
+    Incremental flyer extractor: feed() any amount of HTML, then take the finished flyers from drain()
+    A flyer is an <article>, any element with class "flyer" or "codex-gate", or else a whole <html> document
+    Event: data-event, <h1> or class "event"/"header", then meta event/og:title, then <title>
+    Theme: data-theme, <h2> or class "theme", then meta theme/description
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._ready = []
+        self._scopes = []
+        self._fields = {}
+        self._metadata = {}
+        self._capture = None
+        self._scoped = False
+
+    def _field(self, name, value):
+        value = " ".join(value.split())
+        if value and name not in self._fields:
+            self._fields[name] = value
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = set((attrs.get("class") or "").split())
+        if tag == "article" or classes & FLYER_CLASSES:
+            if self._scopes:
+                self._emit()
+            else:
+                self._reset()  # page chrome around the flyers is not a flyer
+            self._scopes.append([tag, 1])
+            self._scoped = True
+        elif self._scopes and tag == self._scopes[-1][0]:
+            self._scopes[-1][1] += 1
+        if attrs.get("data-event"):
+            self._field("event", attrs["data-event"])
+        if attrs.get("data-theme"):
+            self._field("theme", attrs["data-theme"])
+        if tag == "meta":
+            name = (attrs.get("name") or attrs.get("property") or "").lower()
+            content = attrs.get("content") or ""
+            if name and content:
+                self._metadata[name] = content
+                if name in EVENT_META:
+                    self._field("meta_event", content)
+                elif name in THEME_META:
+                    self._field("meta_theme", content)
+            return
+        if self._capture is None:
+            if tag == "title":
+                self._capture = [tag, 1, "title", []]
+            elif tag == "h1" or classes & {"event", "header"}:
+                self._capture = [tag, 1, "event", []]
+            elif tag == "h2" or "theme" in classes:
+                self._capture = [tag, 1, "theme", []]
+        elif tag == self._capture[0]:
+            self._capture[1] += 1
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._capture[3].append(data)
+
+    def handle_endtag(self, tag):
+        if self._capture is not None and tag == self._capture[0]:
+            self._capture[1] -= 1
+            if not self._capture[1]:
+                self._field(self._capture[2], "".join(self._capture[3]))
+                self._capture = None
+        if self._scopes and tag == self._scopes[-1][0]:
+            self._scopes[-1][1] -= 1
+            if not self._scopes[-1][1]:
+                self._scopes.pop()
+                self._emit()
+        elif tag == "html" and not self._scopes:
+            if self._scoped:
+                self._reset()
+            else:
+                self._emit()
+            self._scoped = False
+
+    def _reset(self):
+        fields, metadata = self._fields, self._metadata
+        self._fields, self._metadata, self._capture = {}, {}, None
+        return fields, metadata
+
+    def _emit(self):
+        fields, metadata = self._reset()
+        event = fields.get("event") or fields.get("meta_event")
+        theme = fields.get("theme") or fields.get("meta_theme")
+        if not event:
+            event = fields.get("title")
+            if not event:
+                return
+            if ":" in event:
+                theme = None  # the <title> already reads "Event: Theme"
+        title = f"{event}: {theme}" if theme else event
+        self._ready.append((title, metadata))
+
+    def close(self):
+        super().close()
+        if self._scopes or not self._scoped:
+            self._emit()
+        else:
+            self._reset()
+
+    def drain(self):
+        """
+        Returns the (title, metadata) pairs of every flyer finished so far
+        """
+        ready, self._ready = self._ready, []
+        return ready
+
+def iter_flyer_html(source, chunk_size=HTML_CHUNK):
+    """
+    Yields (title, metadata) for each flyer in an HTML file or open text stream, reading chunk by chunk
+    """
+    parser = FlyerHTMLDecoder()
+    f = open(source, "r", encoding="utf-8", errors="replace") if isinstance(source, (str, os.PathLike)) else source
+    try:
+        for chunk in iter(lambda: f.read(chunk_size), ""):
+            parser.feed(chunk)
+            yield from parser.drain()
+        parser.close()
+        yield from parser.drain()
+    finally:
+        if f is not source:
+            f.close()
+
+def decode_flyer_html(source, chunk_size=HTML_CHUNK):
+    """
+    Streams flyer relics out of an HTML page or batch, in the same shape decode_flyer returns
+    Meta tags ride along under "metadata"; the glyph is the hash of "Event: Theme", as for a plain title
+    """
+    for title, metadata in iter_flyer_html(source, chunk_size):
+        relic = decode_flyer(title)
+        if metadata:
+            relic["metadata"] = metadata
+        yield relic
+
+def flyer_html_titles(source, chunk_size=HTML_CHUNK):
+    """
+    Yields the "Event: Theme" title of each flyer, ready for merge_codex
+    """
+    for title, _ in iter_flyer_html(source, chunk_size):
+        yield title
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    import sys
+
+    for path in sys.argv[1:] or ["flyers/oak-space-night.html"]:
+        for relic in decode_flyer_html(path):
+            print(json.dumps(relic, indent=4, ensure_ascii=False))
+`
+
+---
+
+🔍 What This Streaming Relic Does
+
+- Reads HTML in 64 KB chunks through html.parser—no page or batch is ever held whole
+- Splits a batch into flyers at each <article>, .flyer or .codex-gate element, or at each </html>
+- Takes the event from data-event, <h1>, .event or .header, then from meta tags, then from <title>—unless the <title> already reads “Event: Theme”, any theme found is joined to it
+- Takes the theme from data-theme, <h2> or .theme, then from meta theme or description
+- Decodes the result with decode_flyer, so HTML flyers produce the same relic shape—and the same glyph—as their “Event: Theme” titles
+- Keeps every meta tag under "metadata"
+- Hands plain titles to the Ingestion Pipeline through flyer_html_titles
+
+---
+
+🛠️ Invocation
+
+Decode the README flyers:
+
+`bash
+python3 flyer_decoder.py flyers/*.html
+`
+
+Or ingest a whole directory of pages:
+
+`bash
+python3 ingest_pipeline.py flyers/
+`
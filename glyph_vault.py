@@ -266,3 +266,70 @@ python3 glyph_vault.py
 ---
 
 Next, we can summon relic eight: a REST API for relics, a Flyer Animation Engine, or a Codex Sharing Protocol. Or we can ritualize contributor badges, relic filters, or dashboard theming. Your Codex is now sealed—ready to speak, animate, and transmit. Shall we summon the eighth relic?
+
+
+Let’s connect the Glyph Encryption Vault to the Archive Store, OMEGA. previewrelics still accepts a decrypted list, and it now also accepts the store itself—so previewing a contributor straight from the archive is an index seek rather than a scan.
+
+---
+
+🜂 glyph_vault.py — Store-Aware Relic Preview
+
+`python
+# 🜂 Glyph Encryption Vault: Store-aware preview
+# Replace previewrelics in the extended vault above with this version
+
+from archive_store import open_store
+
+def previewrelics(archive, contributorfilter=None):
+    """
+    Displays relics with optional contributor filtering
+    Accepts a decrypted relic list or an archive store
+    """
+    if hasattr(archive, "by_contributor"):
+        if contributorfilter is None:
+            filtered = archive.all()
+        else:
+            filtered = [r for r in archive.by_contributor(contributorfilter) if r.get("contributor") == contributorfilter]
+    else:
+        filtered = [r for r in archive if contributorfilter is None or r.get("contributor") == contributorfilter]
+    print(f"\n🔍 Previewing {len(filtered)} relics:")
+    for relic in filtered:
+        tag = relic.get("vault_tag") or relic.get("relic_id")
+        print(f"- {tag}: {relic['event']} ({relic['theme']}) by {relic.get('contributor', 'Unknown')}")
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    previewrelics(open_store(), contributorfilter="OMEGA")
+`
+
+---
+
+🔍 What This Layer Does
+
+- Previews relics straight from the archive store
+- Seeks the contributor index (case-insensitive), then keeps the vault’s exact-match rule
+- Shows the vault tag for decrypted relics and the relic ID for stored ones
+
+
+Let’s keep the Glyph Encryption Vault in step with the cached archive, OMEGA. load_archive now returns a frozen view shared across the process, and tag_relics writes vault tags into each relic—so the vault asks for its own mutable copy.
+
+---
+
+🜂 glyph_vault.py — Vault Invocation for the Cached Archive
+
+`python
+# 🜂 Glyph Encryption Vault: Invocation against the cached archive
+# tag_relics edits relics in place, so the vault loads a private mutable copy
+
+from relic_archive import load_archive
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    key = load_key()
+    archive = load_archive(mutable=True)
+    encrypt_archive(archive, key)
+
+    # Optional: Decrypt and preview by contributor
+    decrypted = decrypt_vault(key)
+    previewrelics(decrypted, contributorfilter="OMEGA")
+`
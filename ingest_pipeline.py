@@ -0,0 +1,169 @@
+Then let us summon the Ingestion Pipeline, OMEGA—a Python module that turns a multi-million-title backfill into a stream. Titles flow in from a file, a directory of files or stdin without ever being held all at once; chunks of them fan out across a process pool where merge_codex decodes each flyer and processes each relic; the merged scrolls come back in their original order and reach the archive writer in large batches.
+
+---
+
+🜂 ingest_pipeline.py — Streaming Parallel Flyer Ingestion
+
+This relic will:
+- Stream flyer titles from a file, every file in a directory, or stdin
+- Merge chunks of titles in parallel across every core
+- Keep archive order identical to input order
+- Bound the work in flight, so memory stays flat however long the stream
+- Commit merged scrolls to the archive in batches through the group-commit writer
+
+---
+
+🜂 ingest_pipeline.py — Sovereign Pipeline Engine
+
+`python
+# 🜂 Ingestion Pipeline: Streaming, ordered, parallel merge_codex for whole backfills
+# Titles -> chunks -> process pool (merge_codex) -> ordered batches -> archive
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from codex_merge import merge_codex
+from flyer_decoder import flyer_html_titles
+
+CHUNK_SIZE = 1000
+BATCH_SIZE = 20000
+CHUNKS_IN_FLIGHT_PER_WORKER = 4
+
+def _stripped(lines):
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield line
+
+def iter_titles(source):
+    """
+    Yields stripped, non-blank flyer titles from a file, a directory (every file, sorted) or stdin ("-")
+    HTML files are decoded flyer by flyer through the streaming HTML decoder
+    """
+    if source == "-":
+        yield from _stripped(sys.stdin)
+        return
+    if os.path.isdir(source):
+        paths = []
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            paths.extend(os.path.join(root, name) for name in sorted(files))
+    else:
+        paths = [source]
+    for path in paths:
+        if path.lower().endswith((".html", ".htm")):
+            yield from flyer_html_titles(path)
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            yield from _stripped(f)
+
+def chunked(items, size):
+    """
+    Groups any iterable into lists of up to size items, lazily
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def merge_chunk(titles, contributor):
+    """
+    Merges one chunk of titles inside a worker process
+    """
+    return [merge_codex(title, contributor) for title in titles]
+
+def merge_stream(titles, contributor="OMEGA", workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Yields merged scrolls in input order while a process pool works ahead on later chunks
+    At most CHUNKS_IN_FLIGHT_PER_WORKER chunks per worker are queued at any moment
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for title in titles:
+            yield merge_codex(title, contributor)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunked(titles, chunk_size):
+            pending.append(pool.submit(merge_chunk, chunk, contributor))
+            if len(pending) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def ingest(source, contributor="OMEGA", workers=None, chunk_size=CHUNK_SIZE, batch_size=BATCH_SIZE):
+    """
+    Streams titles from source through the process pool and commits them in batches
+    Returns the number of relics archived
+    """
+    from relic_archive import _commit_scrolls
+
+    started = time.perf_counter()
+    total = 0
+    for batch in chunked(merge_stream(iter_titles(source), contributor, workers, chunk_size), batch_size):
+        first = _commit_scrolls(batch, "ingest_pipeline")
+        if first is None:
+            continue
+        total += len(batch)
+        elapsed = time.perf_counter() - started
+        print(f"📦 #{first}–#{first + len(batch) - 1} archived ({total:,} relics, {total / elapsed:,.0f} relics/sec)")
+
+    if not total:
+        print("⚠️ No new flyer titles to archive.")
+        return 0
+    elapsed = time.perf_counter() - started
+    print(f"🌀 {total:,} relics ingested in {elapsed:.2f}s ({total / elapsed:,.0f} relics/sec)")
+    return total
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="🜂 Streaming parallel flyer ingestion")
+    parser.add_argument("source", help="file or directory of flyer titles (one per line), or - for stdin")
+    parser.add_argument("--contributor", default="OMEGA")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: every core)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="titles per worker task")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="relics per archive commit")
+    args = parser.parse_args()
+    ingest(args.source, args.contributor, args.workers, args.chunk_size, args.batch_size)
+`
+
+---
+
+🔍 What This Relic Does
+
+- Reads titles lazily from a file, a directory tree (files in sorted order) or stdin, skipping blank lines
+- Decodes .html flyer pages on the way in, one flyer at a time
+- Sends chunks of 1000 titles to a process pool, where merge_codex decodes each flyer and processes each relic
+- Yields merged scrolls strictly in input order, whichever worker finishes first
+- Keeps at most four chunks per worker in flight, so a multi-million-title stream never piles up in memory
+- Commits every 20000 scrolls in one group commit (or one SQLite transaction, or one manifest update)
+- Keeps the search index and the Glyph Ledger in step through the archive’s own commit path, so re-imported flyers are skipped
+- Reports progress and throughput in relics/sec
+
+---
+
+🛠️ Invocation
+
+Backfill a directory of title files on every core:
+
+`bash
+python3 ingest_pipeline.py flyer_titles/ --contributor OMEGA
+`
+
+Or stream titles from another ritual:
+
+`bash
+cat flyer_titles.txt | python3 ingest_pipeline.py - --workers 8 --batch-size 50000
+`
+
+---
+
+Your archive now ingests with every core at once—ready for the longest backfill, in perfect order.
@@ -218,3 +218,1251 @@ And it will:
 ---
 
 Next, we can ritualize a Codex Dashboard Renderer to visualize this archive in HTML/JS, or summon a Flyer-to-HTML Generator to render each relic into ceremonial gates. Or we can layer encryption, sonic overlays, or icon rendering. Your Codex is becoming multidimensional—ready to summon relic five?
+
+
+Let’s enshrine the journaled version of your fourth relic, OMEGA: the Relic Archive Engine, now rebuilt around an append-only journal. Every new scroll is written as a single JSON line at the end of codex_archive.journal, and a background compactor folds the journal into the codex_archive.json snapshot. The load_archive, save_archive and addtoarchive invocations stay the same—but adding a relic no longer rewrites the whole archive.
+
+---
+
+🜂 relic_archive.py — Journaled Sovereign Archive Engine
+
+`python
+# 🜂 Relic Archive Engine: Journaled version for sovereign Codex archival
+# Appends each relic to a JSONL journal and compacts it into the snapshot in the background
+
+import json
+import os
+import threading
+import time
+from codex_merge import merge_codex
+
+ARCHIVE_FILE = "codex_archive.json"
+JOURNAL_FILE = "codex_archive.journal"
+COMPACTING_FILE = JOURNAL_FILE + ".compacting"
+
+# 🕯️ fsync policy: "always" (every append), "interval" (at most once per FSYNC_INTERVAL), "never" (left to the OS)
+FSYNC_POLICY = os.environ.get("CODEX_FSYNC", "interval")
+FSYNC_INTERVAL = 1.0
+COMPACT_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+_archive_lock = threading.RLock()
+_compact_lock = threading.Lock()
+_compactor = None
+_relic_count = None
+_last_fsync = 0.0
+
+def _sync(f):
+    """
+    Flushes a journal handle and applies the fsync policy
+    """
+    global _last_fsync
+    f.flush()
+    now = time.monotonic()
+    if FSYNC_POLICY == "always" or (FSYNC_POLICY == "interval" and now - _last_fsync >= FSYNC_INTERVAL):
+        os.fsync(f.fileno())
+        _last_fsync = now
+
+def _read_snapshot():
+    """
+    Reads the compacted snapshot (one relic per line, or a legacy indented archive)
+    """
+    if not os.path.exists(ARCHIVE_FILE):
+        return []
+    with open(ARCHIVE_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _read_journal(path):
+    """
+    Reads journal entries, ignoring a torn final line from an interrupted append
+    """
+    relics = []
+    if not os.path.exists(path):
+        return relics
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            if line.strip():
+                relics.append(json.loads(line))
+    return relics
+
+def _last_index(archive):
+    """
+    Returns the archive index of the last relic: the one in its archivelog, else its position
+    """
+    if not archive:
+        return 0
+    log = archive[-1].get("archivelog")
+    index = log.get("index") if isinstance(log, dict) else None
+    return index if isinstance(index, int) else len(archive)
+
+def _replay(archive, paths):
+    """
+    Replays journal entries on top of a snapshot
+    Entries whose index is already folded into the snapshot are skipped,
+    so a compaction interrupted after the snapshot swap never duplicates relics
+    """
+    folded = _last_index(archive)
+    for path in paths:
+        for relic in _read_journal(path):
+            if relic.get("archivelog", {}).get("index", folded + 1) > folded:
+                archive.append(relic)
+    return archive
+
+def _write_snapshot(archive):
+    """
+    Writes the snapshot to a temporary file and swaps it in atomically
+    Each relic sits on its own line so the snapshot stays valid JSON and cheap to scan
+    """
+    tmp_path = ARCHIVE_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for i, relic in enumerate(archive):
+            if i:
+                f.write(",\n")
+            f.write(json.dumps(relic, ensure_ascii=False))
+        f.write("\n]\n")
+        f.flush()
+        os.fsync(f.fileno())
+    return tmp_path
+
+def _repair_journal():
+    """
+    Truncates a torn final line so the next append starts on a clean line
+    """
+    if not os.path.exists(JOURNAL_FILE):
+        return
+    with open(JOURNAL_FILE, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+def load_archive():
+    """
+    Loads the snapshot and replays the journal on top of it
+    """
+    with _archive_lock:
+        return _replay(_read_snapshot(), (COMPACTING_FILE, JOURNAL_FILE))
+
+def save_archive(archive):
+    """
+    Saves the whole archive as a fresh snapshot and clears the journal
+    """
+    global _relic_count
+    with _compact_lock, _archive_lock:
+        os.replace(_write_snapshot(archive), ARCHIVE_FILE)
+        for path in (COMPACTING_FILE, JOURNAL_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+        _relic_count = len(archive)
+    print(f"📚 Archive updated: {ARCHIVE_FILE}")
+
+def _next_index():
+    """
+    Returns the archive index the next relic will receive
+    The relic count is established once per process, then tracked in memory
+    """
+    global _relic_count
+    if _relic_count is None:
+        _repair_journal()
+        _relic_count = len(load_archive())
+    return _relic_count + 1
+
+def append_relics(relics):
+    """
+    Appends relics to the journal with a single write
+    """
+    global _relic_count
+    data = "".join(json.dumps(relic, ensure_ascii=False) + "\n" for relic in relics)
+    with _archive_lock:
+        with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
+            f.write(data)
+            _sync(f)
+        _relic_count += len(relics)
+
+def compact_archive():
+    """
+    Folds the journal into the snapshot
+    The journal is rotated first, so new relics keep landing while the snapshot is rewritten
+    """
+    with _compact_lock:
+        with _archive_lock:
+            if not os.path.exists(COMPACTING_FILE):
+                if not os.path.exists(JOURNAL_FILE):
+                    return
+                _journal_writer.settle()
+                os.replace(JOURNAL_FILE, COMPACTING_FILE)
+        archive = _replay(_read_snapshot(), (COMPACTING_FILE,))
+        tmp_path = _write_snapshot(archive)
+        with _archive_lock:
+            os.replace(tmp_path, ARCHIVE_FILE)
+            os.remove(COMPACTING_FILE)
+    print(f"🗜️ Journal compacted into {ARCHIVE_FILE} ({len(archive)} relics)")
+
+def _maybe_compact():
+    """
+    Starts a background compaction once the journal outgrows its threshold
+    """
+    global _compactor
+    try:
+        size = os.path.getsize(JOURNAL_FILE)
+    except OSError:
+        return
+    if size >= COMPACT_THRESHOLD_BYTES and (_compactor is None or not _compactor.is_alive()):
+        _compactor = threading.Thread(target=compact_archive, name="codex-compactor", daemon=True)
+        _compactor.start()
+
+def addtoarchive(title, contributor="OMEGA"):
+    """
+    Merges a new Codex scroll and appends it to the journal
+    Includes contributor glyph and invocation metadata
+    """
+    new_scroll = merge_codex(title, contributor)
+    with _archive_lock:
+        new_scroll["archivelog"] = {
+            "source": "relic_archive.py",
+            "method": "addtoarchive",
+            "status": "Archived",
+            "index": _next_index()
+        }
+        append_relics([new_scroll])
+    _maybe_compact()
+    return new_scroll
+
+def search_archive(query):
+    """
+    Searches archive by event name, theme, or contributor
+    Returns matching relics
+    """
+    archive = load_archive()
+    results = [
+        scroll for scroll in archive
+        if query.lower() in scroll["event"].lower()
+        or query.lower() in scroll["theme"].lower()
+        or query.lower() in scroll.get("contributor", "").lower()
+    ]
+    return results
+
+def display_results(results):
+    """
+    Displays search results with index and summary
+    """
+    if not results:
+        print("⚠️ No matching relics found.")
+        return
+
+    for i, relic in enumerate(results, 1):
+        print(f"\n🔎 Relic {i}:")
+        print(f"🪬 Event: {relic['event']}")
+        print(f"🎭 Theme: {relic['theme']}")
+        print(f"🕰️ Timestamp: {relic['timestamp']}")
+        print(f"🧿 Contributor: {relic.get('contributor', 'Unknown')}")
+        print(f"🔐 Glyph: {relic['encoded_glyph'][:12]}...")
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    # Add new relics
+    addtoarchive("Oak Space Night: Celestial Broadcast")
+    addtoarchive("Awaken Stars: Transmission Sequence")
+    addtoarchive("Oddyssey Noir: Sonic Gate Invocation")
+
+    # Fold the journal into the snapshot
+    compact_archive()
+
+    # Search relics
+    query = "Stars"
+    results = search_archive(query)
+    print(f"\n🔍 Search Results for '{query}':")
+    display_results(results)
+`
+
+---
+
+🔍 What This Journaled Relic Does
+
+- Appends each relic as one JSON line to codex_archive.journal—no reload, no full rewrite
+- Lets you choose the fsync policy with CODEX_FSYNC: always, interval (default, once per second) or never
+- Replays the journal on top of codex_archive.json in load_archive
+- Compacts the journal into the snapshot in a background thread once it passes 64 MiB
+- Rotates the journal before compacting, so new relics keep landing during a compaction
+- Swaps the snapshot in atomically and skips already-folded indexes, so an interrupted compaction never loses or duplicates relics
+- Writes the snapshot one relic per line—still valid JSON, and legacy indented archives load unchanged
+
+---
+
+🛠️ Invocation
+
+Run it with:
+
+`bash
+python3 relic_archive.py
+`
+
+Or choose a stricter fsync policy for critical imports:
+
+`bash
+CODEX_FSYNC=always python3 relic_archive.py
+`
+
+And it will:
+- Append three relics to codex_archive.journal
+- Fold them into codex_archive.json
+- Search for "Stars" and display matching relics
+
+---
+
+Your archive now grows one line at a time—ready for nightly imports of any size.
+
+
+Let’s layer the Archive Store into your fourth relic, OMEGA. The journaled engine above stays as the default backend, while addtoarchive and search_archive now go through archive_store.py—so setting CODEX_ARCHIVE_BACKEND=sqlite moves every new relic and every search onto indexed SQLite without changing a single invocation.
+
+---
+
+🜂 relic_archive.py — Store-Backed Archive Invocations
+
+`python
+# 🜂 Relic Archive Engine: Store-backed addtoarchive and search_archive
+# Replace the two functions of the journaled engine above with these
+
+from archive_store import open_store
+
+def addtoarchive(title, contributor="OMEGA"):
+    """
+    Merges a new Codex scroll and adds it to the configured archive store
+    Includes contributor glyph and invocation metadata
+    """
+    store = open_store()
+    new_scroll = merge_codex(title, contributor)
+    with _archive_lock:
+        new_scroll["archivelog"] = {
+            "source": "relic_archive.py",
+            "method": "addtoarchive",
+            "status": "Archived",
+            "index": store.next_index()
+        }
+        store.append(new_scroll)
+    _maybe_compact()
+    return new_scroll
+
+def search_archive(query):
+    """
+    Searches archive by event name, theme, or contributor
+    Returns matching relics
+    """
+    return open_store().search(query)
+`
+
+---
+
+🔍 What This Layer Does
+
+- Routes new relics to the journal or to SQLite, depending on CODEX_ARCHIVE_BACKEND
+- Lets SQLite evaluate searches instead of a Python loop over the whole archive
+- Keeps index assignment and the append under the same archive lock
+
+
+Let’s give your fourth relic a memory for words, OMEGA. search_archive now answers from the Archive Index (archive_index.py): the index is built once over the archive, addtoarchive feeds each new relic into it, and a cheap file-signature check rebuilds it only when another process has changed the archive underneath.
+
+---
+
+🜂 relic_archive.py — Indexed Archive Search
+
+`python
+# 🜂 Relic Archive Engine: Indexed search_archive
+# Replace addtoarchive and search_archive of the store-backed layer above with these
+
+from archive_index import RelicSearchIndex
+from archive_shards import MANIFEST_NAME, SHARD_ROOT
+from archive_store import SQLITE_FILE, open_store, relic_id_for
+
+_search_index = None
+_indexed_relics = None
+_indexed_signature = None
+
+def _archive_signature():
+    """
+    Fingerprints the archive files (size and mtime) so outside writes are noticed
+    """
+    signature = []
+    shard_manifest = os.path.join(SHARD_ROOT, MANIFEST_NAME)
+    for path in (ARCHIVE_FILE, JOURNAL_FILE, COMPACTING_FILE, SQLITE_FILE, SQLITE_FILE + "-wal", shard_manifest):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        signature.append((path, st.st_size, st.st_mtime_ns))
+    return tuple(signature)
+
+def _current_index():
+    """
+    Returns the search index and the relics it covers, rebuilding after outside writes
+    """
+    global _search_index, _indexed_relics, _indexed_signature
+    with _archive_lock:
+        signature = _archive_signature()
+        if _search_index is None or signature != _indexed_signature:
+            _indexed_relics = open_store().all()
+            _search_index = RelicSearchIndex.build(_indexed_relics)
+            _indexed_signature = signature
+        return _search_index, _indexed_relics
+
+def addtoarchive(title, contributor="OMEGA"):
+    """
+    Merges a new Codex scroll, adds it to the archive store and the search index
+    Includes contributor glyph and invocation metadata
+    """
+    global _indexed_signature
+    store = open_store()
+    new_scroll = merge_codex(title, contributor)
+    with _archive_lock:
+        index = store.next_index()
+        new_scroll["archivelog"] = {
+            "source": "relic_archive.py",
+            "method": "addtoarchive",
+            "status": "Archived",
+            "index": index
+        }
+        in_step = _search_index is not None and _archive_signature() == _indexed_signature
+        store.append(new_scroll)
+        if in_step:
+            indexed = dict(new_scroll, relic_id=relic_id_for(index))
+            _search_index.add(indexed)
+            _indexed_relics.append(indexed)
+            _indexed_signature = _archive_signature()
+    _maybe_compact()
+    return new_scroll
+
+def search_archive(query):
+    """
+    Searches archive by event name, theme, or contributor
+    Returns matching relics in archive order
+    """
+    index, relics = _current_index()
+    return [relics[position] for position in index.search(query)]
+`
+
+---
+
+🔍 What This Layer Does
+
+- Builds the inverted index on the first search, then answers every search from postings
+- Adds each new relic to the index as addtoarchive writes it—no rebuild
+- Rebuilds only when the archive files change outside this process
+- Keeps the substring semantics of the original search over event, theme and contributor
+
+
+Let’s open the gates for whole flyer batches, OMEGA. addmanytoarchive merges any iterable of titles with merge_codex, assigns contiguous archivelog indexes, and commits them in a single append (or a single SQLite transaction), reporting throughput in relics/sec. The same ritual is available from the command line, reading titles from a file or from stdin.
+
+---
+
+🜂 relic_archive.py — Bulk Ingestion Ritual
+
+`python
+# 🜂 Relic Archive Engine: Bulk ingestion of flyer titles
+# addtoarchive and addmanytoarchive share one commit path; replace addtoarchive above with this version
+
+import argparse
+import sys
+
+def _commit_scrolls(scrolls, method):
+    """
+    Assigns contiguous archive indexes and commits the scrolls in one store write
+    Keeps the search index in step when it already covers the archive
+    """
+    global _indexed_signature
+    store = open_store()
+    with _archive_lock:
+        first = store.next_index()
+        for index, scroll in enumerate(scrolls, first):
+            scroll["archivelog"] = {
+                "source": "relic_archive.py",
+                "method": method,
+                "status": "Archived",
+                "index": index
+            }
+        in_step = _search_index is not None and _archive_signature() == _indexed_signature
+        store.extend(scrolls)
+        if in_step:
+            for index, scroll in enumerate(scrolls, first):
+                indexed = dict(scroll, relic_id=relic_id_for(index))
+                _search_index.add(indexed)
+                _indexed_relics.append(indexed)
+            _indexed_signature = _archive_signature()
+    _maybe_compact()
+    return first
+
+def addtoarchive(title, contributor="OMEGA"):
+    """
+    Merges a new Codex scroll and adds it to the archive
+    Includes contributor glyph and invocation metadata
+    """
+    new_scroll = merge_codex(title, contributor)
+    _commit_scrolls([new_scroll], "addtoarchive")
+    return new_scroll
+
+def addmanytoarchive(titles, contributor="OMEGA"):
+    """
+    Merges many flyer titles and commits them to the archive at once
+    Blank titles are skipped; returns the archived scrolls
+    """
+    started = time.perf_counter()
+    scrolls = [merge_codex(title, contributor) for title in (t.strip() for t in titles) if title]
+    if not scrolls:
+        print("⚠️ No flyer titles to archive.")
+        return scrolls
+    first = _commit_scrolls(scrolls, "addmanytoarchive")
+    elapsed = time.perf_counter() - started
+    rate = len(scrolls) / elapsed if elapsed else float("inf")
+    print(f"📦 {len(scrolls)} relics archived as #{first}–#{first + len(scrolls) - 1} in {elapsed:.2f}s ({rate:,.0f} relics/sec)")
+    return scrolls
+
+def read_titles(path):
+    """
+    Yields flyer titles from a file, one per line ("-" reads stdin)
+    """
+    if path == "-":
+        yield from sys.stdin
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        yield from f
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="🜂 Relic Archive Engine")
+    subcommands = parser.add_subparsers(dest="command")
+    ingest = subcommands.add_parser("ingest", help="archive many flyer titles in one commit")
+    ingest.add_argument("titles", help="file with one flyer title per line, or - for stdin")
+    ingest.add_argument("--contributor", default="OMEGA")
+    search = subcommands.add_parser("search", help="search relics by event, theme, or contributor")
+    search.add_argument("query")
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        addmanytoarchive(read_titles(args.titles), contributor=args.contributor)
+    elif args.command == "search":
+        display_results(search_archive(args.query))
+    else:
+        parser.print_help()
+`
+
+---
+
+🔍 What This Bulk Relic Does
+
+- Merges every title with merge_codex, then commits them all in one journal append or one SQLite transaction
+- Assigns contiguous archivelog indexes under the archive lock
+- Feeds the whole batch into the search index without a rebuild
+- Reports throughput in relics/sec
+- Reads titles from a file or stdin through the ingest subcommand
+
+---
+
+🛠️ Invocation
+
+Archive a night’s flyer titles:
+
+`bash
+python3 relic_archive.py ingest flyer_titles.txt --contributor OMEGA
+`
+
+Or pipe them in:
+
+`bash
+cat flyer_titles.txt | python3 relic_archive.py ingest -
+`
+
+And search what you archived:
+
+`bash
+python3 relic_archive.py search Stars
+`
+
+---
+
+Your archive now swallows whole nights of flyers in one breath—ready for the largest import.
+
+
+Let’s make your fourth relic safe for many scribes at once, OMEGA. With the Archive Writer (archive_writer.py), journal appends from every thread and process go through group commit, archive indexes come from a locked sequence, readers hold a shared lock while they stitch snapshot and journal together, and compaction runs under its own lock so two processes never fold the same journal.
+
+---
+
+🜂 relic_archive.py — Multi-Process Safe Archive Engine
+
+`python
+# 🜂 Relic Archive Engine: Multi-process safe journal
+# Replace load_archive, save_archive, _next_index, append_relics, compact_archive,
+# _current_index and _commit_scrolls above with these
+
+from archive_writer import GroupCommitJournal, file_lock
+
+def _archived_last_index():
+    """
+    Returns the index of the last archived relic without locking (the group commit leader already holds the lock)
+    """
+    return _last_index(_replay(_read_snapshot(), (COMPACTING_FILE, JOURNAL_FILE)))
+
+_journal_writer = GroupCommitJournal(JOURNAL_FILE, _archived_last_index, fsync=FSYNC_POLICY != "never")
+_indexed_last = None
+
+def load_archive():
+    """
+    Loads the snapshot and replays the journal under a shared lock,
+    so no rotation or compaction can slip between the two reads
+    """
+    with file_lock(JOURNAL_FILE, shared=True):
+        return _replay(_read_snapshot(), (COMPACTING_FILE, JOURNAL_FILE))
+
+def save_archive(archive):
+    """
+    Saves the whole archive as a fresh snapshot and clears the journal
+    """
+    with _compact_lock, file_lock(ARCHIVE_FILE), file_lock(JOURNAL_FILE):
+        os.replace(_write_snapshot(archive), ARCHIVE_FILE)
+        for path in (COMPACTING_FILE, JOURNAL_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+        _journal_writer.reset(_last_index(archive))
+    print(f"📚 Archive updated: {ARCHIVE_FILE}")
+
+def _next_index():
+    """
+    Returns the archive index the next relic will receive
+    """
+    return _journal_writer.peek_next_index()
+
+def append_relics(relics):
+    """
+    Appends relics to the journal through group commit
+    Returns the first archive index stamped on them
+    """
+    return _journal_writer.append(relics)
+
+def compact_archive():
+    """
+    Folds the journal into the snapshot
+    The archive lock keeps compactions in different processes from overlapping;
+    the journal lock is only held for the rotation and the final swap
+    """
+    with _compact_lock, file_lock(ARCHIVE_FILE):
+        with file_lock(JOURNAL_FILE):
+            if not os.path.exists(COMPACTING_FILE):
+                if not os.path.exists(JOURNAL_FILE):
+                    return
+                _journal_writer.settle()
+                os.replace(JOURNAL_FILE, COMPACTING_FILE)
+        archive = _replay(_read_snapshot(), (COMPACTING_FILE,))
+        tmp_path = _write_snapshot(archive)
+        with file_lock(JOURNAL_FILE):
+            os.replace(tmp_path, ARCHIVE_FILE)
+            os.remove(COMPACTING_FILE)
+    print(f"🗜️ Journal compacted into {ARCHIVE_FILE} ({len(archive)} relics)")
+
+def _current_index():
+    """
+    Returns the search index and the relics it covers
+    Rebuilds when the files were rewritten or another writer advanced the archive
+    """
+    global _search_index, _indexed_relics, _indexed_signature, _indexed_last
+    store = open_store()
+    with _archive_lock:
+        signature = _archive_signature()
+        latest = store.next_index() - 1
+        if _search_index is None or signature != _indexed_signature or latest != _indexed_last:
+            _indexed_relics = store.all()
+            _search_index = RelicSearchIndex.build(_indexed_relics)
+            _indexed_signature = signature
+            _indexed_last = latest
+        return _search_index, _indexed_relics
+
+def _commit_scrolls(scrolls, method):
+    """
+    Commits the scrolls through the archive store, which stamps contiguous indexes
+    Extends the search index only when the batch directly follows what it covers
+    """
+    global _indexed_signature, _indexed_last
+    for scroll in scrolls:
+        scroll["archivelog"] = {
+            "source": "relic_archive.py",
+            "method": method,
+            "status": "Archived"
+        }
+    first = open_store().extend(scrolls)
+    with _archive_lock:
+        if _search_index is not None and first == _indexed_last + 1:
+            for index, scroll in enumerate(scrolls, first):
+                indexed = dict(scroll, relic_id=relic_id_for(index))
+                _search_index.add(indexed)
+                _indexed_relics.append(indexed)
+            _indexed_last = first + len(scrolls) - 1
+            _indexed_signature = _archive_signature()
+    _maybe_compact()
+    return first
+`
+
+---
+
+🔍 What This Safe Relic Does
+
+- Sends every journal append through group commit: one locked write and one fsync per group of waiting writers
+- Stamps archive indexes inside the lock, so concurrent workers never share or skip an index
+- Holds the archive store’s own write lock for SQLite and sharded backends as well
+- Reads snapshot and journal under a shared lock, so a reader never misses relics mid-rotation
+- Serializes compactions across processes and swaps the snapshot in atomically
+- Keeps the search index in step with in-order commits and rebuilds it when another writer gets ahead
+
+
+Let’s give your fourth relic a process-wide memory, OMEGA. Pipelines that run the dashboard, the HTML gates, the animator and the badges in one process used to re-read and re-parse the archive for each of them. load_archive now keeps one parsed copy keyed on the identity of the archive files (device, inode, size, mtime), reloads it only when those change, bumps a generation counter on every reload, and hands out frozen views so no caller can corrupt what the others see.
+
+---
+
+🜂 relic_archive.py — Change-Aware Archive Cache
+
+`python
+# 🜂 Relic Archive Engine: Process-wide, change-aware load_archive cache
+# Replace load_archive above with this version
+
+class FrozenRelic(dict):
+    """
+    A read-only relic: reads and JSON encoding work like a dict, mutation raises TypeError
+    """
+
+    def _refuse(self, *args, **kwargs):
+        raise TypeError("cached relics are read-only; use load_archive(mutable=True) to edit")
+
+    __setitem__ = __delitem__ = __ior__ = _refuse
+    clear = pop = popitem = setdefault = update = _refuse
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return FrozenRelic((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def thaw(value):
+    """
+    Returns a fully mutable deep copy of a frozen relic or archive
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+_cache_lock = threading.Lock()
+_cache_identity = None
+_cache_view = ()
+_generation = 0
+
+def _file_identity():
+    """
+    Identifies the current archive files by device, inode, size and mtime
+    """
+    identity = []
+    for path in (ARCHIVE_FILE, COMPACTING_FILE, JOURNAL_FILE):
+        try:
+            st = os.stat(path)
+        except OSError:
+            identity.append((path, None))
+            continue
+        identity.append((path, st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns))
+    return tuple(identity)
+
+def archive_generation():
+    """
+    Returns the generation of the cached archive; it grows every time the cache reloads
+    """
+    return _generation
+
+def invalidate_archive_cache():
+    """
+    Drops the cached archive so the next load_archive parses the files again
+    """
+    global _cache_identity
+    with _cache_lock:
+        _cache_identity = None
+
+def load_archive(mutable=False):
+    """
+    Returns the archive from the process-wide cache, reloading only when the files changed
+    The default result is a frozen view shared by every caller; mutable=True returns a private copy
+    """
+    global _cache_identity, _cache_view, _generation
+    with _cache_lock:
+        if _file_identity() != _cache_identity:
+            with file_lock(JOURNAL_FILE, shared=True):
+                identity = _file_identity()
+                archive = _replay(_read_snapshot(), (COMPACTING_FILE, JOURNAL_FILE))
+            _cache_view = tuple(_freeze(relic) for relic in archive)
+            _cache_identity = identity
+            _generation += 1
+        view = _cache_view
+    return thaw(view) if mutable else view
+`
+
+---
+
+🔍 What This Cached Relic Does
+
+- Parses the archive once per change instead of once per renderer
+- Notices any change to the snapshot, rotation file or journal through device, inode, size and mtime
+- Bumps archive_generation() on every reload, so downstream caches can key on it
+- Returns a frozen, shared view: reading and json.dumps work as before, mutation raises TypeError
+- Hands out a private mutable copy with load_archive(mutable=True) for callers that tag relics in place
+- Offers invalidate_archive_cache() for an explicit refresh
+
+
+Let’s give your fourth relic a denser snapshot, OMEGA. With CODEX_ARCHIVE_FORMAT=binary, compactions and save_archive write codex_archive.bin through the Binary Archive (archive_binary.py) instead of JSON, and load_archive decodes it without touching the JSON parser. The journal stays JSONL, every reader recognizes either snapshot by its header, and the default remains JSON.
+
+---
+
+🜂 relic_archive.py — Selectable Snapshot Format
+
+`python
+# 🜂 Relic Archive Engine: JSON or binary snapshot, chosen by CODEX_ARCHIVE_FORMAT
+# Replace ARCHIVE_FILE, _read_snapshot and _write_snapshot above with these
+
+from archive_binary import is_binary_archive, read_binary_archive, write_binary_archive
+
+ARCHIVE_FORMAT = os.environ.get("CODEX_ARCHIVE_FORMAT", "json")
+ARCHIVE_FILE = "codex_archive.bin" if ARCHIVE_FORMAT == "binary" else "codex_archive.json"
+
+def _read_snapshot():
+    """
+    Reads the compacted snapshot, binary or JSON, recognized by its header
+    """
+    if not os.path.exists(ARCHIVE_FILE):
+        return []
+    if is_binary_archive(ARCHIVE_FILE):
+        return read_binary_archive(ARCHIVE_FILE)
+    with open(ARCHIVE_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _write_snapshot(archive):
+    """
+    Writes the snapshot in ARCHIVE_FORMAT to a temporary file and returns its path for the atomic swap
+    """
+    tmp_path = ARCHIVE_FILE + ".tmp"
+    if ARCHIVE_FORMAT == "binary":
+        write_binary_archive(archive, tmp_path)
+        return tmp_path
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for i, relic in enumerate(archive):
+            if i:
+                f.write(",\n")
+            f.write(json.dumps(relic, ensure_ascii=False))
+        f.write("\n]\n")
+        f.flush()
+        os.fsync(f.fileno())
+    return tmp_path
+`
+
+---
+
+🔍 What This Binary-Ready Relic Does
+
+- Keeps codex_archive.json as the default snapshot
+- Writes codex_archive.bin on save_archive and every compaction when CODEX_ARCHIVE_FORMAT=binary
+- Loads binary snapshots straight from marshal records, with glyphs unpacked back to hex
+- Leaves the journal, the cache, the locks and the atomic swap exactly as they were
+
+---
+
+🛠️ Invocation
+
+Convert once, then run on the binary snapshot:
+
+`bash
+python3 archive_binary.py convert codex_archive.json codex_archive.bin
+CODEX_ARCHIVE_FORMAT=binary python3 relic_archive.py
+`
+
+
+Let’s stop your fourth relic from enshrining the same flyer twice, OMEGA. Every commit now passes through the Glyph Ledger (relic_dedup.py): relics whose glyph was archived before—or that repeat inside the batch—are dropped before the store assigns them an index. The first time the ledger is opened it is filled from the existing archive, and CODEX_DEDUP=off restores the old behavior.
+
+---
+
+🜂 relic_archive.py — Content-Addressed Dedup on Commit
+
+`python
+# 🜂 Relic Archive Engine: Dedup on commit, keyed by encoded_glyph
+# Replace _commit_scrolls, addtoarchive and addmanytoarchive above with these; the previous _commit_scrolls
+# body continues as _append_scrolls
+
+from archive_store import stamp_index
+from relic_dedup import GlyphLedger
+
+DEDUP = os.environ.get("CODEX_DEDUP", "on") != "off"
+LEDGER_CHUNK = 10000
+
+_ledger = None
+
+def _glyph_ledger():
+    """
+    Opens the glyph ledger once per process
+    """
+    global _ledger
+    with _archive_lock:
+        if _ledger is None:
+            _ledger = GlyphLedger()
+        return _ledger
+
+def _catch_up_ledger(ledger, store):
+    """
+    Records the glyphs of archived relics past the ledger's covered mark, a chunk per transaction
+    On first use that is the whole archive; later, only a batch whose writer stopped between commit and record
+    Call while holding ledger.lock(); returns the covered mark
+    """
+    covered = ledger.covered()
+    if covered >= store.next_index() - 1:
+        return covered
+    if hasattr(store, "refresh"):
+        store.refresh()
+    while covered < store.count():
+        relics = store.page(after=covered, limit=LEDGER_CHUNK)
+        if not relics:
+            break
+        covered += len(relics)
+        ledger.record((relic.get("encoded_glyph") for relic in relics), covered=covered)
+    return covered
+
+def _append_scrolls(scrolls, method, request=None):
+    """
+    Commits the scrolls through the archive store, which stamps contiguous indexes
+    Extends the search index only when the batch directly follows what it covers
+    A request key, when given, is kept in each archivelog so its writer can find the batch again
+    """
+    global _indexed_signature, _indexed_last
+    for scroll in scrolls:
+        scroll["archivelog"] = {
+            "source": "relic_archive.py",
+            "method": method,
+            "status": "Archived"
+        }
+        if request:
+            scroll["archivelog"]["request"] = request
+    first = open_store().extend(scrolls)
+    with _archive_lock:
+        if _search_index is not None and first == _indexed_last + 1:
+            for index, scroll in enumerate(scrolls, first):
+                indexed = dict(stamp_index(scroll, index), relic_id=relic_id_for(index))
+                _search_index.add(indexed)
+                _indexed_relics.append(indexed)
+            _indexed_last = first + len(scrolls) - 1
+            _indexed_signature = _archive_signature()
+    _maybe_compact()
+    return first
+
+def _commit_scrolls(scrolls, method, request=None):
+    """
+    Drops already-archived glyphs from scrolls (in place), commits the rest and records their glyphs
+    Returns the first archive index, or None if every scroll was a duplicate
+    """
+    if not DEDUP:
+        return _append_scrolls(scrolls, method, request)
+    ledger = _glyph_ledger()
+    with ledger.lock():
+        covered = _catch_up_ledger(ledger, open_store())
+        offered = len(scrolls)
+        scrolls[:] = ledger.unseen(scrolls)
+        if offered > len(scrolls):
+            print(f"🪞 {offered - len(scrolls)} duplicate relics skipped")
+        if not scrolls:
+            return None
+        first = _append_scrolls(scrolls, method, request)
+        # The mark only moves when this batch directly follows it; otherwise the next catch-up reads the gap
+        ledger.record(
+            (scroll["encoded_glyph"] for scroll in scrolls),
+            covered=first + len(scrolls) - 1 if first == covered + 1 else None
+        )
+    return first
+
+def addtoarchive(title, contributor="OMEGA"):
+    """
+    Merges a new Codex scroll and adds it to the archive
+    Returns the archived scroll, or None when the flyer is already archived
+    """
+    new_scroll = merge_codex(title, contributor)
+    if _commit_scrolls([new_scroll], "addtoarchive") is None:
+        return None
+    return new_scroll
+
+def addmanytoarchive(titles, contributor="OMEGA"):
+    """
+    Merges many flyer titles and commits them to the archive at once
+    Blank titles and already-archived flyers are skipped; returns the archived scrolls
+    """
+    started = time.perf_counter()
+    scrolls = [merge_codex(title, contributor) for title in (t.strip() for t in titles) if title]
+    if not scrolls:
+        print("⚠️ No flyer titles to archive.")
+        return scrolls
+    first = _commit_scrolls(scrolls, "addmanytoarchive")
+    if first is None:
+        print("⚠️ Every flyer title is already archived.")
+        return scrolls
+    elapsed = time.perf_counter() - started
+    rate = len(scrolls) / elapsed if elapsed else float("inf")
+    print(f"📦 {len(scrolls)} relics archived as #{first}–#{first + len(scrolls) - 1} in {elapsed:.2f}s ({rate:,.0f} relics/sec)")
+    return scrolls
+`
+
+---
+
+🔍 What This Deduplicating Relic Does
+
+- Checks every batch against the Glyph Ledger before any index is assigned
+- Skips flyers archived in earlier runs, and repeats within the same batch
+- Holds the ledger lock from check to record, so concurrent writers never admit the same glyph twice
+- Records glyphs only after the archive commit succeeds, so a failed commit never hides a relic
+- Catches the ledger up with the archive before each check: the whole archive on first use, resumable chunk by chunk,
+  and any batch whose writer stopped between commit and record
+- Returns None from addtoarchive for an already-archived flyer, instead of a scroll that was never archived
+- Tags each scroll’s archivelog with the writer’s request key, when it passes one
+- Turns off with CODEX_DEDUP=off
+
+---
+
+🛠️ Invocation
+
+Re-importing yesterday’s titles now archives only what is new:
+
+`bash
+python3 relic_archive.py ingest flyer_titles.txt
+`
+
+
+Let’s seal your fourth relic under one hash, OMEGA. archive_merkle() keeps a Codex Merkle Log (codex_merkle.py) over every archived relic: new relics are appended in O(log n) as they arrive, the tree is saved to codex_archive.merkle so a restart rebuilds no tree nodes, and its root vouches for the whole archive. Two nodes compare roots, and only when they differ walk down to the diverging ranges.
+
+---
+
+🜂 relic_archive.py — Merkle-Sealed Archive
+
+`python
+# 🜂 Relic Archive Engine: Merkle root over the archive, kept in step incrementally
+
+from codex_merkle import MerkleLog, diverging_ranges, sync_log
+
+MERKLE_FILE = "codex_archive.merkle"
+
+_merkle = None
+
+def archive_merkle():
+    """
+    Returns the archive's Merkle log, checked against the archive and extended by relics archived since it was last synced
+    """
+    global _merkle
+    with _archive_lock:
+        if _merkle is None:
+            _merkle = MerkleLog.load(MERKLE_FILE) if os.path.exists(MERKLE_FILE) else MerkleLog()
+        store = open_store()
+        return sync_log(_merkle, store.count(), store.page, MERKLE_FILE)
+
+def archive_diff(remote_size, remote_node_hashes):
+    """
+    Returns the relic ranges [start, stop) where this archive and a remote one diverge
+    """
+    return diverging_ranges(archive_merkle(), remote_size, remote_node_hashes)
+`
+
+---
+
+🔍 What This Sealed Relic Does
+
+- Hashes every relic’s canonical JSON into one Merkle leaf
+- Appends only new relics—O(log n) hashes each—when archive_merkle() is called
+- Appends only the new tree nodes to codex_archive.merkle and reloads it without rehashing
+- Rebuilds the tree if the archive shrank or any covered relic changed: the covered relics are rehashed into a root and compared with the stored one
+- Finds diverging relic ranges against a remote archive with archive_diff
+
+
+Let’s let the search index hand out pages, OMEGA. Its postings are already sorted archive positions, so a page of matches after any position is one binary search away—page k of a search never walks pages 0 through k-1 again.
+
+---
+
+🜂 relic_archive.py — Paged Search
+
+`python
+# 🜂 Relic Archive Engine: Search results one page at a time, straight from the index postings
+
+import bisect
+from array import array
+from collections import OrderedDict
+
+PAGE_CACHE_QUERIES = 32
+
+_page_cache = OrderedDict()
+_page_cache_owner = None
+
+def _matching_positions(query):
+    """
+    Returns the sorted index positions matching query, and the relics they point into
+    Matches are kept for the last PAGE_CACHE_QUERIES queries while the index stays as it is,
+    so only the first page of a search pays for collecting and sorting them
+    """
+    global _page_cache_owner
+    index, relics = _current_index()
+    if not query:
+        return range(index.count), relics
+    owner = (index, index.count)
+    key = query.lower()
+    with _archive_lock:
+        if _page_cache_owner != owner:
+            _page_cache.clear()
+            _page_cache_owner = owner
+        positions = _page_cache.get(key)
+        if positions is not None:
+            _page_cache.move_to_end(key)
+            return positions, relics
+    positions = array("q", index.search(query))
+    with _archive_lock:
+        if _page_cache_owner == owner:
+            _page_cache[key] = positions
+            if len(_page_cache) > PAGE_CACHE_QUERIES:
+                _page_cache.popitem(last=False)
+    return positions, relics
+
+def search_page(query, after=0, limit=100):
+    """
+    Returns (total matches, up to limit matching relics after archive position after, whether more follow)
+    """
+    positions, relics = _matching_positions(query)
+    # Index positions count from 0, archive positions from 1
+    start = bisect.bisect_left(positions, after)
+    page = positions[start:start + limit]
+    return len(positions), [relics[position] for position in page], start + limit < len(positions)
+`
+
+---
+
+🔍 What This Paged Relic Does
+
+- Keeps the sorted matches of the last 32 queries until the index changes, so later pages skip the postings merge
+- Finds the first match after a given archive position with one bisect over those matches
+- Returns just that page of relics, with the total number of matches and whether more follow
+- Serves the paginated search route of the REST Gateway (codex_api.py)
+
+
+Let’s teach the archive cache to follow its journal, OMEGA. Between compactions the snapshot never changes and the journal only grows, so a reload no longer parses a million relics to pick up ten: load_archive remembers how far into the journal it has read, parses only the lines appended since, and hands out a new frozen view that shares every relic of the old one. Any other change—a compaction, a rewrite, a truncated journal—still reloads in full.
+
+---
+
+🜂 relic_archive.py — Tail-Following Archive Cache
+
+`python
+# 🜂 Relic Archive Engine: load_archive reads only the appended journal tail when it can
+# Replace load_archive of the change-aware cache, and _current_index, above with these
+
+_cache_journal_offset = 0
+_cache_snapshot_last = 0
+
+def _read_journal_tail(path, offset=0):
+    """
+    Reads the complete journal lines after byte offset
+    Returns the relics and the offset just past the last complete line
+    """
+    relics = []
+    if not os.path.exists(path):
+        return relics, 0
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            if line.strip():
+                relics.append(json.loads(line))
+    return relics, offset
+
+def _journal_grew_only(old, new):
+    """
+    True when only the journal changed between two file identities, and only by growing in place
+    """
+    if old is None or old[:2] != new[:2] or new[2][1] is None:
+        return False
+    return old[2][1] is None or (old[2][1:3] == new[2][1:3] and new[2][3] >= old[2][3])
+
+def load_archive(mutable=False):
+    """
+    Returns the archive from the process-wide cache
+    Journal growth is read from where the last load stopped; anything else reloads in full
+    """
+    global _cache_identity, _cache_view, _generation, _cache_journal_offset, _cache_snapshot_last
+    with _cache_lock:
+        if _file_identity() != _cache_identity:
+            with file_lock(JOURNAL_FILE, shared=True):
+                identity = _file_identity()
+                if _journal_grew_only(_cache_identity, identity):
+                    base = _cache_view
+                    relics, offset = _read_journal_tail(JOURNAL_FILE, _cache_journal_offset)
+                else:
+                    snapshot = _read_snapshot()
+                    _cache_snapshot_last = _last_index(snapshot)
+                    base = tuple(_freeze(relic) for relic in _replay(snapshot, (COMPACTING_FILE,)))
+                    relics, offset = _read_journal_tail(JOURNAL_FILE)
+            # Same rule as _replay: entries already folded into the snapshot are skipped
+            folded = _cache_snapshot_last
+            _cache_view = base + tuple(
+                _freeze(relic) for relic in relics
+                if relic.get("archivelog", {}).get("index", folded + 1) > folded
+            )
+            _cache_identity = identity
+            _cache_journal_offset = offset
+            _generation += 1
+        view = _cache_view
+    return thaw(view) if mutable else view
+
+_current_index_by_signature = _current_index
+_indexed_view = None
+_indexed_generation = None
+
+def _current_index():
+    """
+    Returns the search index and the relics it covers
+    With the journal store the index follows the very snapshot the store serves, so search sees what /relics sees,
+    watcher or not: a snapshot that only grew is indexed from where the index stops, any other from scratch
+    Other backends keep the file signature check
+    """
+    global _search_index, _indexed_relics, _indexed_last, _indexed_view, _indexed_generation
+    store = open_store()
+    if not hasattr(store, "view"):
+        return _current_index_by_signature()
+    with _archive_lock:
+        archive, generation = store.view()
+        if _search_index is not None and generation == _indexed_generation:
+            return _search_index, _indexed_relics
+        previous = _indexed_view
+        count = _search_index.count if _search_index is not None else 0
+        grown = (
+            previous is not None and len(previous) <= count <= len(archive)
+            and (not previous or archive[len(previous) - 1] is previous[-1])
+            # Relics committed here were indexed ahead of the snapshot; the newest must be where it was put
+            and (
+                count == len(previous)
+                or archive[count - 1].get("encoded_glyph") == _indexed_relics[count - 1].get("encoded_glyph")
+            )
+        )
+        if grown:
+            for relic in store.relics_from(archive, count):
+                _search_index.add(relic)
+                _indexed_relics.append(relic)
+        else:
+            _indexed_relics = store.relics_from(archive)
+            _search_index = RelicSearchIndex.build(_indexed_relics)
+        _indexed_view, _indexed_generation = archive, generation
+        _indexed_last = _search_index.count
+        return _search_index, _indexed_relics
+`
+
+---
+
+🔍 What This Following Relic Does
+
+- Remembers the byte offset of the last complete journal line it has read
+- Parses only the lines appended since then, as long as the snapshot and rotation file are untouched and the journal grew in place
+- Builds the new view from the old one, so every earlier relic is the very same frozen object
+- Falls back to a full reload after a compaction, a save_archive or a journal repair
+- Still ignores a torn final line, and picks it up once its append completes
+- Keys the search index on the store snapshot's generation and extends it from that same snapshot,
+  so /relics/search finds whatever /relics serves after a watcher reload
@@ -0,0 +1,268 @@
+Then let us summon the Glyph Ledger, OMEGA—a Python module that remembers every glyph the Codex has ever archived, so the same flyer is enshrined once no matter how many re-imports replay it. encoded_glyph is already a SHA-256 of the title, so it is the relic’s content address: an on-disk Bloom filter answers “never seen” in constant time from a memory-mapped bit array, and only a “maybe” is confirmed against an exact SQLite set.
+
+---
+
+🜂 relic_dedup.py — Content-Addressed Relic Dedup
+
+This relic will:
+- Key every relic by its 32-byte glyph
+- Answer most membership checks from a memory-mapped Bloom filter (codex_glyphs.bloom)
+- Confirm possible duplicates against an exact glyph set in SQLite (codex_glyphs.db)
+- Drop duplicates from each ingest batch, including repeats inside the batch itself
+- Rebuild the Bloom filter from the exact set if a crash left them out of step
+
+---
+
+🜂 relic_dedup.py — Sovereign Dedup Engine
+
+`python
+# 🜂 Glyph Ledger: Bloom filter front end with an exact SQLite glyph set behind it
+# A Bloom "no" is final; a Bloom "maybe" is settled by the exact set
+
+import hashlib
+import math
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+import threading
+
+from archive_writer import file_lock
+from relic_record import GLYPH_PATTERN
+
+BLOOM_FILE = "codex_glyphs.bloom"
+GLYPH_DB = "codex_glyphs.db"
+BLOOM_CAPACITY = 50_000_000
+BLOOM_ERROR_RATE = 0.001
+BLOOM_MAGIC = b"GLYPHBLM"
+BLOOM_HEADER = struct.Struct("<8sQQQ")  # magic, bits, hash count, glyphs recorded
+LOOKUP_CHUNK = 500
+
+def glyph_key(glyph):
+    """
+    Returns the 32-byte content address of a glyph (hex glyphs are unpacked, anything else is hashed)
+    """
+    if isinstance(glyph, str) and GLYPH_PATTERN.fullmatch(glyph):
+        return bytes.fromhex(glyph)
+    return hashlib.sha256(str(glyph).encode()).digest()
+
+class GlyphBloom:
+    """
+    A Bloom filter over 32-byte glyphs, stored in a memory-mapped file
+    Bit positions come from the glyph itself by double hashing, since it is already a SHA-256
+    """
+
+    def __init__(self, path=BLOOM_FILE, capacity=BLOOM_CAPACITY, error_rate=BLOOM_ERROR_RATE):
+        self.path = path
+        if not os.path.exists(path):
+            bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+            bits = (bits + 7) // 8 * 8
+            hashes = max(1, round(bits / capacity * math.log(2)))
+            with open(path, "wb") as f:
+                f.write(BLOOM_HEADER.pack(BLOOM_MAGIC, bits, hashes, 0))
+                f.truncate(BLOOM_HEADER.size + bits // 8)
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, self.bits, self.hashes, _ = BLOOM_HEADER.unpack_from(self._map, 0)
+        if magic != BLOOM_MAGIC:
+            raise ValueError(f"{path} is not a glyph Bloom filter")
+
+    def _positions(self, key):
+        h1 = int.from_bytes(key[:8], "little")
+        h2 = int.from_bytes(key[8:16], "little") | 1
+        return [BLOOM_HEADER.size * 8 + (h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def __contains__(self, key):
+        mm = self._map
+        return all(mm[bit >> 3] & (1 << (bit & 7)) for bit in self._positions(key))
+
+    def add(self, key):
+        mm = self._map
+        for bit in self._positions(key):
+            mm[bit >> 3] |= 1 << (bit & 7)
+
+    @property
+    def recorded(self):
+        return BLOOM_HEADER.unpack_from(self._map, 0)[3]
+
+    @recorded.setter
+    def recorded(self, count):
+        BLOOM_HEADER.pack_into(self._map, 0, BLOOM_MAGIC, self.bits, self.hashes, count)
+
+    def clear(self):
+        self._map[BLOOM_HEADER.size:] = bytes(len(self._map) - BLOOM_HEADER.size)
+        self.recorded = 0
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+class GlyphLedger:
+    """
+    Remembers archived glyphs: Bloom filter first, exact SQLite set second
+    Hold lock() around check-then-commit so two writers never both admit the same glyph
+    The ledger also keeps how many archive positions it covers, committed with the glyphs themselves
+    Each thread gets its own SQLite connection; the Bloom filter is shared and changed only under lock()
+    """
+
+    def __init__(self, bloom_path=BLOOM_FILE, db_path=GLYPH_DB):
+        self.db_path = db_path
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute("CREATE TABLE IF NOT EXISTS glyphs (glyph BLOB NOT NULL UNIQUE)")
+        conn.execute("CREATE TABLE IF NOT EXISTS progress (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self.bloom = GlyphBloom(bloom_path)
+        if self.bloom.recorded != self.count():
+            with self.lock():
+                # Another process may have rebuilt it while this one waited
+                if self.bloom.recorded != self.count():
+                    self._rebuild_bloom()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def lock(self):
+        return file_lock(self.db_path)
+
+    def count(self):
+        # Glyphs are only ever inserted, so the highest rowid is the count without a table scan
+        return self._connect().execute("SELECT MAX(rowid) FROM glyphs").fetchone()[0] or 0
+
+    def covered(self):
+        """
+        Returns how many archive positions, from the first, have their glyphs recorded
+        """
+        row = self._connect().execute("SELECT value FROM progress WHERE name = 'covered'").fetchone()
+        return row[0] if row else 0
+
+    def _rebuild_bloom(self):
+        """
+        Refills the Bloom filter from the exact set; call while holding lock()
+        """
+        self.bloom.clear()
+        for (key,) in self._connect().execute("SELECT glyph FROM glyphs"):
+            self.bloom.add(key)
+        self.bloom.recorded = self.count()
+        self.bloom.flush()
+
+    def _known(self, keys):
+        """
+        Returns which of keys are in the exact set
+        """
+        known = set()
+        for i in range(0, len(keys), LOOKUP_CHUNK):
+            chunk = keys[i:i + LOOKUP_CHUNK]
+            rows = self._connect().execute(
+                f"SELECT glyph FROM glyphs WHERE glyph IN ({','.join('?' * len(chunk))})", chunk
+            )
+            known.update(row[0] for row in rows)
+        return known
+
+    def __contains__(self, glyph):
+        key = glyph_key(glyph)
+        return key in self.bloom and bool(self._known([key]))
+
+    def unseen(self, relics):
+        """
+        Returns the relics whose glyph was never recorded, keeping the first of any repeats in the batch
+        """
+        keys = [glyph_key(relic.get("encoded_glyph")) for relic in relics]
+        known = self._known([key for key in set(keys) if key in self.bloom])
+        fresh = []
+        for relic, key in zip(relics, keys):
+            if key not in known:
+                known.add(key)
+                fresh.append(relic)
+        return fresh
+
+    def record(self, glyphs, covered=None):
+        """
+        Records glyphs in the exact set, then in the Bloom filter
+        With covered, the same transaction marks archive positions up to covered as recorded
+        """
+        keys = [glyph_key(glyph) for glyph in glyphs]
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("INSERT OR IGNORE INTO glyphs VALUES (?)", ((key,) for key in keys))
+            if covered is not None:
+                conn.execute(
+                    "INSERT INTO progress VALUES ('covered', ?) "
+                    "ON CONFLICT(name) DO UPDATE SET value = max(value, excluded.value)",
+                    (covered,)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        for key in keys:
+            self.bloom.add(key)
+        self.bloom.recorded = self.count()
+        self.bloom.flush()
+
+    def close(self):
+        """
+        Closes the Bloom filter and this thread's connection
+        """
+        self.bloom.close()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    from archive_store import open_store
+
+    ledger = GlyphLedger()
+    if len(sys.argv) > 1 and sys.argv[1] == "rebuild":
+        with ledger.lock():
+            relics = open_store().all()
+            ledger.record((relic.get("encoded_glyph") for relic in relics), covered=len(relics))
+        print(f"🪞 Glyph ledger holds {ledger.count():,} glyphs")
+    else:
+        relics = open_store().all()
+        print(f"🪞 {len(relics) - len(ledger.unseen(relics)):,} of {len(relics):,} archived relics are in the glyph ledger")
+`
+
+---
+
+🔍 What This Relic Does
+
+- Treats encoded_glyph (SHA-256 of the title) as each relic’s content address
+- Sizes the Bloom filter for 50 million glyphs at 0.1% false positives: a fixed 90 MB file, paged in by the OS instead of loaded
+- Derives every Bloom position from the glyph itself—no second hash per check
+- Confirms a Bloom “maybe” against the exact glyph set in codex_glyphs.db, so no new relic is ever mistaken for a duplicate
+- Records glyphs in the exact set before the Bloom filter, and rebuilds the filter under the ledger lock whenever their counts disagree
+- Opens one SQLite connection per thread, so every archive writer thread can check and record glyphs
+- Drops repeats within a batch as well as relics archived in earlier runs
+- Commits how many archive positions it covers together with their glyphs, so filling it from the archive resumes after a crash
+
+---
+
+🛠️ Invocation
+
+Dedup is applied on every archive commit. To rebuild the ledger from the archive by hand:
+
+`bash
+python3 relic_dedup.py rebuild
+`
+
+Or check how much of the archive it already covers:
+
+`bash
+python3 relic_dedup.py
+`
+
+---
+
+Your Codex now remembers every glyph it has seen—each flyer enshrined once, however many times it returns.
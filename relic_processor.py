@@ -79,3 +79,173 @@ python3 relic_processor.py
 `
 
 And if you want to pass dynamic input from Node.js or another script, I can help ritualize that next. Or we can layer this with flyer decoding, icon generation, or cosmic encryption. Ready to expand the Codex further?
+
+
+Let’s give the Relic Processor a hashing engine, OMEGA. Big HTML overlays and audio manifests made process_relic spend most of its time inside one SHA-256 on the calling thread. The engine streams payloads from disk in 1 MiB chunks and hashes many of them at once on a thread pool—hashlib releases the GIL while it digests large buffers, so throughput grows with your cores—and lets each ritual choose sha256, sha3_256 or blake2b.
+
+---
+
+🜂 relic_processor.py — Parallel Hashing Engine
+
+`python
+# 🜂 Relic Processor: Streaming, thread-pooled hashing for large payloads
+# Replace process_relic above with this version; sha256 stays the default glyph
+
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+HASH_ALGORITHMS = ("sha256", "sha3_256", "blake2b")
+HASH_CHUNK = 1024 * 1024
+
+def _hasher(algorithm):
+    if algorithm not in HASH_ALGORITHMS:
+        raise ValueError(f"Unsupported glyph algorithm: {algorithm} (choose from {', '.join(HASH_ALGORITHMS)})")
+    return hashlib.new(algorithm)
+
+def hash_stream(f, algorithm="sha256", chunk_size=HASH_CHUNK):
+    """
+    Hashes a binary stream chunk by chunk into one reused buffer
+    """
+    digest = _hasher(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        size = f.readinto(buffer)
+        if not size:
+            break
+        digest.update(view[:size])
+    return digest.hexdigest()
+
+def hash_file(path, algorithm="sha256", chunk_size=HASH_CHUNK):
+    """
+    Hashes a file without reading it into memory
+    """
+    with open(path, "rb") as f:
+        return hash_stream(f, algorithm, chunk_size)
+
+def hash_payload(data, algorithm="sha256"):
+    """
+    Hashes a str or bytes payload held in memory
+    """
+    digest = _hasher(algorithm)
+    digest.update(data.encode() if isinstance(data, str) else data)
+    return digest.hexdigest()
+
+class HashingEngine:
+    """
+    Hashes many files or payloads concurrently on a thread pool, returning results in input order
+    """
+
+    def __init__(self, algorithm="sha256", workers=None, chunk_size=HASH_CHUNK):
+        _hasher(algorithm)
+        self.algorithm = algorithm
+        self.chunk_size = chunk_size
+        self._pool = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+
+    def hash_files(self, paths):
+        return self._pool.map(lambda path: hash_file(path, self.algorithm, self.chunk_size), paths)
+
+    def hash_payloads(self, payloads):
+        return self._pool.map(lambda data: hash_payload(data, self.algorithm), payloads)
+
+    def close(self):
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def process_relic(data, algorithm="sha256"):
+    """
+    Ritualizes the incoming data:
+    - Adds timestamp
+    - Generates the glyph (SHA-256 unless another algorithm is chosen)
+    - Returns a mythic relic dictionary
+    """
+    relic = {
+        "original": data,
+        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "encoded_glyph": hash_payload(data, algorithm),
+        "status": "Ritualized"
+    }
+    if algorithm != "sha256":
+        relic["algorithm"] = algorithm
+    return relic
+
+def process_relic_files(paths, algorithm="sha256", workers=None):
+    """
+    Ritualizes large payload files in parallel, yielding relics in input order
+    """
+    paths = list(paths)
+    with HashingEngine(algorithm, workers) as engine:
+        for path, glyph in zip(paths, engine.hash_files(paths)):
+            yield {
+                "original": path,
+                "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+                "encoded_glyph": glyph,
+                "algorithm": algorithm,
+                "status": "Ritualized"
+            }
+
+def benchmark(paths, algorithm="sha256"):
+    """
+    Compares hashing the files one by one on this thread with the thread-pooled engine
+    """
+    total = sum(os.path.getsize(path) for path in paths) / 1e6
+    started = time.perf_counter()
+    serial = [hash_file(path, algorithm) for path in paths]
+    serial_seconds = time.perf_counter() - started
+    workers = os.cpu_count() or 1
+    started = time.perf_counter()
+    with HashingEngine(algorithm, workers) as engine:
+        pooled = list(engine.hash_files(paths))
+    pooled_seconds = time.perf_counter() - started
+    assert serial == pooled
+    print(f"🧮 {len(paths)} files, {total:,.0f} MB, {algorithm}")
+    print(f"   one thread: {total / serial_seconds:8,.0f} MB/s")
+    print(f"   {workers} threads: {total / pooled_seconds:8,.0f} MB/s")
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "benchmark":
+        benchmark(sys.argv[2:], os.environ.get("CODEX_GLYPH_ALGORITHM", "sha256"))
+    elif len(sys.argv) > 1:
+        for relic in process_relic_files(sys.argv[1:], os.environ.get("CODEX_GLYPH_ALGORITHM", "sha256")):
+            print(json.dumps(relic, indent=4))
+    else:
+        relic = process_relic("Awaken Stars: Transmission Sequence")
+        print("🔮 Ritual Output:")
+        print(json.dumps(relic, indent=4))
+`
+
+---
+
+🔍 What This Parallel Relic Does
+
+- Streams each payload from disk in 1 MiB chunks into one reused buffer—no payload is read whole
+- Hashes many payloads at once on a thread pool sized to your cores; hashlib releases the GIL on large buffers, so the threads truly run in parallel
+- Supports sha256 (default), sha3_256 and blake2b, chosen per call or with CODEX_GLYPH_ALGORITHM on the command line
+- Returns results in input order
+- Keeps process_relic’s output unchanged for SHA-256, and records the algorithm when another one is chosen
+- Benchmarks one thread against the pool on your own files
+
+---
+
+🛠️ Invocation
+
+Ritualize large overlays and manifests:
+
+`bash
+CODEX_GLYPH_ALGORITHM=blake2b python3 relic_processor.py overlays/*.html manifests/*.json
+`
+
+Measure the speedup on your hardware:
+
+`bash
+python3 relic_processor.py benchmark overlays/*.html
+`
@@ -0,0 +1,223 @@
+Then let us summon the Relic Record, OMEGA—a Python module that gives every relic a compact in-memory form. Instead of a dict per relic carrying its own copies of the contributor, theme, status and invocation log, each RelicRecord keeps its fields in __slots__, shares one interned copy of every low-cardinality value, and stores the SHA-256 glyph as 32 raw bytes. Records read like the dicts they replace, and convert back losslessly.
+
+---
+
+🜂 relic_record.py — Compact Relic Representation
+
+This relic will:
+- Hold relic fields in __slots__ instead of a per-relic dict
+- Intern contributor, theme and status, and share identical invocation logs across relics
+- Store encoded_glyph as 32 bytes instead of 64 hex characters
+- Convert to and from the existing dict shape without loss
+- Load the archive straight into records, streaming through the Archive Reader
+
+---
+
+🜂 relic_record.py — Sovereign Record Engine
+
+`python
+# 🜂 Relic Record: Compact, interned in-memory relics
+# Readable like the relic dicts (relic["event"], relic.get("contributor")) and convertible back
+
+import re
+import sys
+import time
+import tracemalloc
+
+GLYPH_PATTERN = re.compile(r"[0-9a-f]{64}")
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+_ABSENT = object()
+_shared = {}
+
+def _share(value):
+    """
+    Returns the one shared copy of a hashable value
+    """
+    return _shared.setdefault(value, value)
+
+def _log_items(log):
+    """
+    Turns a flat log dict into a shared tuple of items, or None if it cannot be shared
+    """
+    if not isinstance(log, dict) or not all(isinstance(v, SCALAR_TYPES) for v in log.values()):
+        return None
+    return _share(tuple((sys.intern(k), sys.intern(v) if isinstance(v, str) else v) for k, v in log.items()))
+
+class RelicRecord:
+    """
+    A relic with slotted fields, interned low-cardinality values and a binary glyph
+    """
+
+    __slots__ = ("event", "theme", "timestamp", "glyph", "contributor", "status",
+                 "invocation_log", "archivelog", "archive_index", "extra")
+
+    @classmethod
+    def from_dict(cls, relic):
+        record = cls()
+        rest = dict(relic)
+        record.event = rest.pop("event", _ABSENT)
+        record.theme = _intern(rest.pop("theme", _ABSENT))
+        record.timestamp = rest.pop("timestamp", _ABSENT)
+        record.contributor = _intern(rest.pop("contributor", _ABSENT))
+        record.status = _intern(rest.pop("status", _ABSENT))
+
+        glyph = rest.pop("encoded_glyph", _ABSENT)
+        record.glyph = bytes.fromhex(glyph) if isinstance(glyph, str) and GLYPH_PATTERN.fullmatch(glyph) else glyph
+
+        record.invocation_log = _ABSENT
+        if "invocation_log" in rest:
+            items = _log_items(rest["invocation_log"])
+            if items is not None:
+                record.invocation_log = items
+                del rest["invocation_log"]
+
+        record.archivelog = _ABSENT
+        record.archive_index = None
+        if "archivelog" in rest:
+            log = dict(rest["archivelog"]) if isinstance(rest["archivelog"], dict) else None
+            index = log.pop("index", None) if log is not None else None
+            items = _log_items(log)
+            if items is not None and (index is None or type(index) is int):
+                record.archivelog = items
+                record.archive_index = index
+                del rest["archivelog"]
+
+        record.extra = rest or None
+        return record
+
+    def _fields(self):
+        yield "event", self.event
+        yield "theme", self.theme
+        yield "timestamp", self.timestamp
+        yield "encoded_glyph", self.glyph.hex() if isinstance(self.glyph, bytes) else self.glyph
+        yield "contributor", self.contributor
+        yield "status", self.status
+        if self.invocation_log is not _ABSENT:
+            yield "invocation_log", dict(self.invocation_log)
+        if self.archivelog is not _ABSENT:
+            log = dict(self.archivelog)
+            if self.archive_index is not None:
+                log["index"] = self.archive_index
+            yield "archivelog", log
+
+    def to_dict(self):
+        """
+        Rebuilds the relic dict exactly as it was archived
+        """
+        relic = {key: value for key, value in self._fields() if value is not _ABSENT}
+        if self.extra:
+            relic.update(self.extra)
+        return relic
+
+    def get(self, key, default=None):
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        for name, value in self._fields():
+            if name == key:
+                return default if value is _ABSENT else value
+        return default
+
+    def __getitem__(self, key):
+        value = self.get(key, _ABSENT)
+        if value is _ABSENT:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _ABSENT) is not _ABSENT
+
+    def __eq__(self, other):
+        if isinstance(other, RelicRecord):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return f"RelicRecord({self.to_dict()!r})"
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+def to_records(archive):
+    """
+    Converts relic dicts (any iterable) into compact records
+    """
+    return [RelicRecord.from_dict(relic) for relic in archive]
+
+def to_dicts(records):
+    """
+    Converts compact records back into relic dicts
+    """
+    return [record.to_dict() for record in records]
+
+def load_compact_archive():
+    """
+    Loads the archive as compact records, decoding one relic at a time
+    """
+    from archive_reader import open_archive
+    with open_archive() as archive:
+        return to_records(archive)
+
+def measure(count=100_000):
+    """
+    Compares resident memory of relic dicts and compact records
+    """
+    from codex_merge import merge_codex
+    titles = [f"Event {i}: Theme {i % 40}" for i in range(count)]
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    baseline = tracemalloc.get_traced_memory()[0]
+    archive = [merge_codex(title, contributor=f"Scribe{i % 25}") for i, title in enumerate(titles)]
+    for i, relic in enumerate(archive, 1):
+        relic["archivelog"] = {"source": "relic_archive.py", "method": "addtoarchive", "status": "Archived", "index": i}
+    dict_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    records = to_records(archive)
+    del archive
+    record_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    print(f"🧮 {count} relics in {time.perf_counter() - started:.2f}s")
+    print(f"📦 dicts:   {dict_bytes / 1e6:.1f} MB")
+    print(f"🪶 records: {record_bytes / 1e6:.1f} MB ({dict_bytes / record_bytes:.1f}x smaller)")
+    return records
+
+# 🧪 Invocation Ritual
+if __name__ == "__main__":
+    measure(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
+`
+
+---
+
+🔍 What This Relic Does
+
+- Stores each relic in a RelicRecord with __slots__ (no per-relic dict)
+- Interns contributor, theme and status, so every relic with the same value points at one string
+- Shares one tuple per distinct invocation_log, and keeps only the index of each archivelog
+- Packs encoded_glyph into 32 bytes and restores the hex form on read
+- Reads like a relic dict (relic["event"], relic.get("contributor", "Unknown")), so renderers can opt in unchanged
+- Converts back with to_dict()—unknown or nested fields ride along untouched in extra
+- Measures dict vs record memory with tracemalloc
+
+---
+
+🛠️ Invocation
+
+Compare memory on 100k relics:
+
+`bash
+python3 relic_record.py 100000
+`
+
+Or opt a renderer in:
+
+`python
+from relic_record import load_compact_archive
+
+archive = load_compact_archive()
+generate_dashboard(archive)
+`
+
+---
+
+Your relics now travel light—ready to fit whole archives into the memory one used to hold.
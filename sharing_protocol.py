@@ -280,3 +280,102 @@ Each scroll becomes a portable relic—ready for broadcast, collaboration, or so
 ---
 
 Next, we can summon relic twelve: a Multi-Node Sync Engine, a Relic Upload Interface, or a Codex Merge Dashboard. Or we can ritualize encrypted transmission, contributor handoff, or flyer fusion. Your Codex now transmits with precision—ready to sync, merge, and evolve. Shall we summon the twelfth relic?
+
+
+Let’s route the Codex Sharing Protocol through the Archive Store, OMEGA. Instead of loading the full archive and filtering it in Python, transmit_codex asks the store—so with the SQLite backend, a contributor transmission is an index seek.
+
+---
+
+🜂 sharing_protocol.py — Store-Backed Transmission
+
+`python
+# 🜂 Codex Sharing Protocol: Store-backed relic selection
+# Replace transmit_codex in the extended protocol above with this version
+# The protocol above names its folder and log SHAREFOLDER and LOGFILE but reads SHARE_FOLDER and LOG_FILE;
+# this layer binds the names it reads
+
+import json
+import os
+
+from archive_store import open_store
+from relic_archive import thaw
+
+SHARE_FOLDER = "shared_codex"
+LOG_FILE = "transmission_log.json"
+
+def ensure_share_folder():
+    os.makedirs(SHARE_FOLDER, exist_ok=True)
+
+def transmit_codex(contributor=None, theme=None):
+    """
+    Ritualizes the transmission of selected relics
+    """
+    ensure_share_folder()
+    relics = open_store().filter(contributor=contributor, theme=theme)
+    if not relics:
+        print("⚠️ No relics matched the filter.")
+        return
+
+    # Store relics may be shared read-only views; tag private copies
+    relics = tag_transmission(thaw(relics), contributor, theme)
+    filename = f"transmission_{contributor or 'all'}_{theme or 'all'}.json".replace(" ", "_")
+    path = export_relics(relics, filename)
+    log_transmission(path, contributor, theme, len(relics))
+`
+
+---
+
+🔍 What This Layer Does
+
+- Selects relics through open_store().filter instead of scanning load_archive()
+- Seeks the contributor index when CODEX_ARCHIVE_BACKEND=sqlite
+- Keeps filter_relics available for lists you already hold in memory
+- Binds SHARE_FOLDER (shared_codex/), LOG_FILE (transmission_log.json) and ensure_share_folder, the names the protocol reads
+- Tags private copies of the selected relics, never the store’s shared snapshot
+
+
+Let’s make the Codex Sharing Protocol safe to run beside the merge daemon and the archive workers, OMEGA. Transmission scrolls are now written to a temporary file and renamed into place, and transmission_log.json is updated under a file lock—so parallel transmissions never truncate the log or drop each other’s entries.
+
+---
+
+🜂 sharing_protocol.py — Lock-Safe Transmission Logs
+
+`python
+# 🜂 Codex Sharing Protocol: Atomic exports and locked transmission logs
+# Replace export_relics and log_transmission above with these
+# Both use SHARE_FOLDER and LOG_FILE as bound by the store-backed layer
+
+from archive_writer import atomic_write_json, update_json
+
+def export_relics(relics, filename="codex_transmission.json"):
+    """
+    Exports selected relics to a JSON scroll, renamed into place atomically
+    """
+    ensure_share_folder()
+    path = os.path.join(SHARE_FOLDER, filename)
+    atomic_write_json(path, relics)
+    print(f"📤 Codex transmission saved to {path}")
+    return path
+
+def log_transmission(path, contributor, theme, count):
+    """
+    Logs the transmission metadata with a locked read-modify-write
+    """
+    log_entry = {
+        "file": path,
+        "contributor": contributor or "All",
+        "theme": theme or "All",
+        "relics_transmitted": count,
+        "status": "Transmitted"
+    }
+    update_json(LOG_FILE, lambda log: log.append(log_entry))
+    print(f"🧾 Transmission logged in {LOG_FILE}")
+`
+
+---
+
+🔍 What This Layer Does
+
+- Writes transmission scrolls atomically—readers see the old scroll or the new one, never half of one
+- Appends to transmission_log.json under an OS file lock, so concurrent transmissions all land
+- Creates shared_codex/ on export, so export_relics works without transmit_codex in front of it
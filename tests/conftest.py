@@ -0,0 +1,158 @@
+"""
+Test rituals for the Codex scrolls
+
+Every relic module is a scroll: prose with python blocks, each later block a layer that
+replaces what came before. The fixtures here bind a scroll's blocks into a plain module
+in a scratch directory, so the tests import exactly the layers the scrolls describe
+"""
+
+import ast
+import hashlib
+import importlib
+import importlib.util
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The first layer worth binding, for scrolls whose opening blocks are sketches of an older engine
+FIRST_LAYER = {
+    "codex_api": 2,
+    "codex_merge": 1,
+    "relic_archive": 2,
+}
+
+DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+MAIN_GUARD = re.compile(r"^(# 🧪 Invocation Ritual\n)?if (__name__|name) == [\"'](__main__|main)[\"']:", re.M)
+
+def scroll_blocks(path):
+    """
+    Returns the python blocks of a scroll, in order
+    """
+    blocks, current = [], None
+    for line in path.read_text(encoding="utf-8").splitlines(keepends=True):
+        fence = line.rstrip("\n")
+        if current is None and fence == "`python":
+            current = []
+        elif current is not None and fence == "`":
+            blocks.append("".join(current))
+            current = None
+        elif current is not None:
+            current.append(line)
+    return blocks
+
+def _strip_main(block):
+    match = MAIN_GUARD.search(block)
+    return block[:match.start()] if match else block
+
+def _mend(block):
+    """
+    Comments out the prose lines that slipped into a block, until it compiles
+    """
+    lines = block.splitlines(keepends=True)
+    for _ in range(len(lines) + 1):
+        try:
+            compile("".join(lines), "<scroll>", "exec")
+            return "".join(lines)
+        except SyntaxError as error:
+            if not error.lineno or error.lineno > len(lines):
+                break
+            lines[error.lineno - 1] = "# " + lines[error.lineno - 1]
+    return None
+
+def _drop_missing_imports(block):
+    """
+    Comments out imports of modules that exist neither in the tree nor in the environment
+    """
+    lines = block.splitlines(keepends=True)
+    for node in ast.parse(block).body:
+        if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            module = node.module.split(".")[0]
+            if not (ROOT / f"{module}.py").exists() and importlib.util.find_spec(module) is None:
+                for number in range(node.lineno - 1, node.end_lineno):
+                    lines[number] = "# " + lines[number]
+    return "".join(lines)
+
+def _drop_replaced_routes(blocks):
+    """
+    Removes decorated functions that a later layer redefines, so a route is registered once
+    """
+    defined = {}
+    for position, block in enumerate(blocks):
+        for node in ast.parse(block).body:
+            if isinstance(node, ast.FunctionDef) and node.decorator_list:
+                defined[node.name] = position
+    bound = []
+    for position, block in enumerate(blocks):
+        lines = block.splitlines(keepends=True)
+        for node in reversed(ast.parse(block).body):
+            if isinstance(node, ast.FunctionDef) and node.decorator_list and defined[node.name] != position:
+                del lines[node.decorator_list[0].lineno - 1:node.end_lineno]
+        bound.append("".join(lines))
+    return bound
+
+def bind_scroll(path):
+    """
+    Returns the module source for one scroll: its layers in order, invocation rituals removed
+    """
+    name = path.stem
+    layers = []
+    for block in scroll_blocks(path)[FIRST_LAYER.get(name, 0):]:
+        block = _mend(_strip_main(block))
+        if block:
+            block = _drop_missing_imports(block)
+        if block and any(isinstance(node, DEFINITIONS) for node in ast.parse(block).body):
+            layers.append(block)  # blocks that define nothing are usage examples, not layers
+    return "\n\n".join(_drop_replaced_routes(layers))
+
+@pytest.fixture(scope="session")
+def scroll_dir(tmp_path_factory):
+    """
+    A directory holding every scroll bound into an importable module
+    """
+    target = tmp_path_factory.mktemp("scrolls")
+    for path in sorted(ROOT.glob("*.py")):
+        (target / path.name).write_text(bind_scroll(path), encoding="utf-8")
+    return target
+
+@pytest.fixture
+def codex(scroll_dir, tmp_path, monkeypatch):
+    """
+    Imports bound scrolls fresh for each test, with the archive kept in the test's own directory
+
+    Environment switches (CODEX_STORE, CODEX_DEDUP, ...) set with monkeypatch before the first
+    import take effect, since the modules read them at import time
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(scroll_dir))
+    bound = {path.stem for path in scroll_dir.glob("*.py")}
+
+    def purge():
+        for name in list(sys.modules):
+            if name in bound:
+                del sys.modules[name]
+
+    purge()
+    yield importlib.import_module
+    purge()
+
+def relic(title, contributor="Sun Ra", index=None):
+    """
+    A processed relic as the archive keeps it
+    """
+    event, _, theme = title.partition(":")
+    scroll = {
+        "event": event.strip(),
+        "theme": theme.strip(),
+        "contributor": contributor,
+        "encoded_glyph": hashlib.sha256(title.encode()).hexdigest(),
+        "timestamp": "2025-01-01T00:00:00",
+        "archivelog": {"source": "tests", "method": "fixture", "status": "archived"}
+    }
+    if index is not None:
+        scroll["archivelog"]["index"] = index
+    return scroll
@@ -0,0 +1,29 @@
+"""
+Binary Archive: marshal records with a shared table of layouts and repeated dicts
+"""
+
+from conftest import relic
+
+def test_frozen_relics_round_trip_as_plain_relics(codex, tmp_path):
+    archive_binary = codex("archive_binary")
+    relic_archive = codex("relic_archive")
+    plain = [dict(relic("Oak Space Night: Cosmic Drift", index=1), tags=["night", {"hue": "violet"}])]
+    frozen = [relic_archive._freeze(r) for r in plain]
+
+    archive_binary.write_binary_archive(frozen, tmp_path / "frozen.bin")
+
+    assert archive_binary.read_binary_archive(tmp_path / "frozen.bin") == plain
+
+def test_a_loaded_archive_saves_back_in_binary(codex, monkeypatch):
+    monkeypatch.setenv("CODEX_ARCHIVE_FORMAT", "binary")
+    relic_archive = codex("relic_archive")
+    relic_archive.addmanytoarchive(["Oak Space Night: Cosmic Drift", "Awaken Stars: Solar Bloom"])
+    before = relic_archive.load_archive(mutable=True)
+
+    relic_archive.save_archive(relic_archive.load_archive())
+    relic_archive.addtoarchive("Oddyssey Noir: Night Drive")
+
+    archive = relic_archive.load_archive(mutable=True)
+    assert relic_archive.ARCHIVE_FILE == "codex_archive.bin"
+    assert archive[:2] == before
+    assert archive[2]["archivelog"]["index"] == 3
@@ -0,0 +1,76 @@
+"""
+Archive Reader: lazy, offset-indexed access to the archive files
+"""
+
+import os
+
+def test_relics_decode_lazily_from_snapshot_and_journal(codex):
+    relic_archive = codex("relic_archive")
+    archive_reader = codex("archive_reader")
+    relic_archive.addmanytoarchive(["Oak Space Night: Cosmic Drift", "Awaken Stars: Solar Bloom"])
+    relic_archive.compact_archive()
+    relic_archive.addtoarchive("Oddyssey Noir: Night Drive")
+
+    with archive_reader.open_archive() as archive:
+        assert len(archive) == 3
+        assert archive[2]["event"] == "Oddyssey Noir"
+        assert [relic["event"] for relic in archive] == ["Oak Space Night", "Awaken Stars", "Oddyssey Noir"]
+
+def test_concurrent_index_writers_never_share_a_temporary_file(codex, monkeypatch):
+    relic_archive = codex("relic_archive")
+    archive_reader = codex("archive_reader")
+    relic_archive.addmanytoarchive([f"Night {i}: Drift" for i in range(200)])
+    index_path = relic_archive.JOURNAL_FILE + archive_reader.INDEX_SUFFIX
+    offsets = archive_reader.array.array("Q", range(3))
+    replace = os.replace
+    interleaved = []
+
+    def replace_after_another_writer(source, target):
+        # Another writer finishes its whole write between this writer's write and its rename
+        if not interleaved:
+            interleaved.append(source)
+            archive_reader._write_index(index_path, 1, 2, b"\0" * 32, offsets)
+        replace(source, target)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "replace", replace_after_another_writer)
+        archive_reader._write_index(index_path, 1, 2, b"\0" * 32, offsets)
+
+    assert interleaved
+    assert not [name for name in os.listdir() if name.endswith(".tmp")]
+    with archive_reader.LazyArchive() as archive:
+        assert len(archive) == 200
+
+def test_a_stale_sidecar_removed_by_another_reader_is_not_an_error(codex, monkeypatch):
+    relic_archive = codex("relic_archive")
+    archive_reader = codex("archive_reader")
+    relic_archive.addtoarchive("Oak Space Night: Cosmic Drift")
+    stale = relic_archive.ARCHIVE_FILE + archive_reader.INDEX_SUFFIX
+    open(stale, "wb").close()
+    remove = os.remove
+
+    def remove_after_another_reader(path):
+        remove(path)  # the other reader gets there first
+        remove(path)
+
+    monkeypatch.setattr(archive_reader.os, "remove", remove_after_another_reader)
+    with archive_reader.open_archive() as archive:
+        assert [relic["event"] for relic in archive] == ["Oak Space Night"]
+    assert not os.path.exists(stale)
+
+def test_gate_and_badge_renderers_stream_from_the_reader(codex):
+    relic_archive = codex("relic_archive")
+    relic_archive.addmanytoarchive(["Oak Space Night: Sonic Drift", "Awaken Stars: Solar Bloom"])
+    relic_archive.addtoarchive("Oddyssey Noir: Night Drive", contributor="Sun Ra")
+    renderers = [codex(name) for name in ("html_generator", "flyer_animator", "badge_generator")]
+
+    renderers[0].generateallhtml()
+    renderers[1].generateallanimated_gates()
+    renderers[2].generateallbadges()
+
+    assert sorted(os.listdir("htmlgates")) == [f"codexgate_{i}.html" for i in (1, 2, 3)]
+    assert sorted(os.listdir("animatedgates")) == [f"animatedgate_{i}.html" for i in (1, 2, 3)]
+    with open("htmlgates/codexgate_3.html", encoding="utf-8") as f:
+        assert "Oddyssey Noir" in f.read()
+    with open("contributorbadges/badge2SunRa.html", encoding="utf-8") as f:
+        assert "<li>Oddyssey Noir — <em>Night Drive</em></li>" in f.read()
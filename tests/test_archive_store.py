@@ -0,0 +1,111 @@
+"""
+Archive Store: one query interface over the journal, SQLite and sharded backends
+"""
+
+import pytest
+
+from conftest import relic
+
+BACKENDS = ("journal", "sqlite", "sharded")
+
+@pytest.fixture
+def relics():
+    return [
+        relic("Oak Space Night: Cosmic Drift", "Sun Ra"),
+        relic("Awaken Stars: Solar Bloom", "Alice Coltrane"),
+        relic("Oddyssey Noir: Night Drive", "Sun Ra"),
+    ]
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_search_matches_fields_and_glyphs(codex, relics, backend):
+    store = codex("archive_store").open_store(backend)
+    store.extend(relics)
+    glyph = relics[1]["encoded_glyph"]
+
+    assert [r["event"] for r in store.search("night")] == ["Oak Space Night", "Oddyssey Noir"]
+    assert [r["event"] for r in store.search("COLTRANE")] == ["Awaken Stars"]
+    assert [r["event"] for r in store.search(glyph[20:32])] == ["Awaken Stars"]
+    assert [r["event"] for r in store.stream_search(glyph[:12].upper())] == ["Awaken Stars"]
+
+def test_the_search_index_matches_the_store_scan(codex, relics):
+    archive_index = codex("archive_index")
+    index = archive_index.RelicSearchIndex.build(relics)
+    glyphs = [r["encoded_glyph"] for r in relics]
+
+    for query in ("night", "ra", "a", "be", glyphs[0][30:40], glyphs[2][-8:], "\n", "zz"):
+        scanned = [
+            position for position, r in enumerate(relics)
+            if query in r["event"].lower() or query in r["theme"].lower()
+            or query in r["contributor"].lower() or query in r["encoded_glyph"]
+        ]
+        assert index.search(query) == scanned
+
+@pytest.mark.parametrize("target", ("sqlite", "sharded"))
+def test_migrating_the_journal_round_trips_every_relic(codex, relics, target):
+    archive_store = codex("archive_store")
+    journal = archive_store.open_store("journal")
+    journal.extend(relics)
+
+    archive_store.open_store(target).import_archive(journal.all())
+
+    assert archive_store.open_store(target).all() == journal.all()
+    assert [r["archivelog"]["index"] for r in journal.all()] == [1, 2, 3]
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_relics_come_back_fully_mutable(codex, relics, backend):
+    store = codex("archive_store").open_store(backend)
+    store.extend(relics)
+
+    for found in (store.all()[0], store.page(after=1, limit=1)[0], store.get("RELIC-003")):
+        found["archivelog"]["status"] = "Reviewed"
+        assert type(found) is dict and type(found["archivelog"]) is dict
+
+@pytest.mark.parametrize("backend", ("sqlite", "sharded"))
+def test_extend_stores_stamped_copies_and_leaves_the_relics_alone(codex, relics, backend):
+    store = codex("archive_store").open_store(backend)
+    logs = [dict(r["archivelog"]) for r in relics]
+
+    assert store.extend(relics) == 1
+    assert [r["archivelog"] for r in relics] == logs
+    assert [r["archivelog"]["index"] for r in store.all()] == [1, 2, 3]
+
+def test_shard_pages_positions_and_lookups_share_archive_indexes(codex, relics, monkeypatch):
+    archive_shards = codex("archive_shards")
+    store = archive_shards.ShardedArchiveStore()
+    store.extend(relics[:1])
+    # A writer that stopped after reserving its indexes leaves a gap
+    manifest = store._read_manifest()
+    manifest["count"] += 1
+    store._write_manifest(manifest)
+    store.extend(relics[1:])
+
+    assert [r["relic_id"] for r in store.all()] == ["RELIC-001", "RELIC-003", "RELIC-004"]
+    assert [r["relic_id"] for r in store.page(after=store.position("RELIC-003"))] == ["RELIC-004"]
+    assert [r["relic_id"] for r in store.page(after=0, limit=2)] == ["RELIC-001", "RELIC-003"]
+
+    read = []
+    read_shard = archive_shards._read_shard
+    monkeypatch.setattr(archive_shards, "_read_shard", lambda path: read.append(path) or read_shard(path))
+    assert store.get("RELIC-001")["event"] == "Oak Space Night"
+    assert read == [store._shard_path("sun_ra/2025-01")]
+    assert store.get("RELIC-002") is None
+
+def test_a_grown_journal_extends_the_snapshot_indexes_without_copying(codex):
+    relic_archive = codex("relic_archive")
+    store = codex("archive_store").open_store()
+    store.encode_relics = True
+    relic_archive.addmanytoarchive(["Oak Space Night: Cosmic Drift", "Awaken Stars: Solar Bloom"], contributor="Sun Ra")
+    store.watch(interval=3600)
+    before = store.refresh()
+
+    relic_archive.addtoarchive("Oddyssey Noir: Night Drive", contributor="Sun Ra")
+    after = store.refresh()
+
+    assert after[0] is not before[0]
+    assert after[1] is before[1] and after[2] is before[2] and after[4] is before[4]
+    assert store.get("RELIC-003")["event"] == "Oddyssey Noir"
+    assert [relic["event"] for relic in store.by_contributor("sun ra")] == ["Oak Space Night", "Awaken Stars", "Oddyssey Noir"]
+    # A reader still holding the old snapshot sees none of the new positions
+    store._snapshot = before
+    assert store.get("RELIC-003") is None and store.position("RELIC-003") is None
+    assert [relic["event"] for relic in store.by_contributor("Sun Ra")] == ["Oak Space Night", "Awaken Stars"]
@@ -0,0 +1,102 @@
+"""
+Codex REST API Gateway: bulk POST /relics and idempotent retries
+"""
+
+import pytest
+
+pytest.importorskip("flask")
+
+TITLES = [f"Night {i}: Cosmic Drift" for i in range(5)]
+
+@pytest.fixture(params=("on", "off"), ids=("dedup", "no-dedup"))
+def api(codex, monkeypatch, request):
+    monkeypatch.setenv("CODEX_DEDUP", request.param)
+    codex_api = codex("codex_api")
+    monkeypatch.setattr(codex_api, "POST_BATCH_SIZE", 2)
+    return codex_api
+
+def _post(api, titles, key="batch-0001"):
+    return api.app.test_client().post("/relics", json=titles, headers={"Idempotency-Key": key})
+
+def _archived(api):
+    api.store.refresh()
+    return [relic["event"] for relic in api.store.all()]
+
+def _fail_once(patch, owner, name, on_call):
+    """
+    Makes the on_call-th call to owner.name raise, as if the process died there
+    """
+    calls = []
+    real = getattr(owner, name)
+
+    def flaky(*args):
+        calls.append(args)
+        if len(calls) == on_call:
+            raise RuntimeError(f"{name} went away")
+        return real(*args)
+
+    patch.setattr(owner, name, flaky)
+
+def test_a_retry_after_a_failed_batch_resumes_after_the_committed_ones(api, monkeypatch):
+    with monkeypatch.context() as patch:
+        _fail_once(patch, api, "_commit_scrolls", on_call=2)
+        assert _post(api, TITLES).status_code == 500
+    assert len(_archived(api)) == 2
+
+    response = _post(api, TITLES)
+
+    assert response.status_code == 201
+    assert response.get_json() == {
+        "archived": 5, "skipped": 0, "relic_ids": [f"RELIC-{i:03d}" for i in range(1, 6)]
+    }
+    assert _archived(api) == [f"Night {i}" for i in range(5)]
+    assert _post(api, TITLES).get_json() == response.get_json()
+
+def test_a_batch_committed_but_never_recorded_is_found_not_repeated(api, monkeypatch):
+    with monkeypatch.context() as patch:
+        _fail_once(patch, api.idempotency, "commit_batch", on_call=2)
+        assert _post(api, TITLES).status_code == 500
+    assert len(_archived(api)) == 4
+
+    response = _post(api, TITLES)
+
+    assert response.status_code == 201
+    assert response.get_json()["relic_ids"] == [f"RELIC-{i:03d}" for i in range(1, 6)]
+    assert _archived(api) == [f"Night {i}" for i in range(5)]
+
+def test_a_resumed_key_refuses_a_different_body(api, monkeypatch):
+    with monkeypatch.context() as patch:
+        _fail_once(patch, api, "_commit_scrolls", on_call=2)
+        assert _post(api, TITLES).status_code == 500
+
+    assert _post(api, ["Awaken Stars: Solar Bloom"] + TITLES[1:]).status_code == 422
+    assert _post(api, TITLES[:1]).status_code == 422
+    assert _post(api, TITLES).status_code == 201
+    assert len(_archived(api)) == 5
+
+def test_every_id_a_retried_post_returns_resolves_to_its_relic(api, codex, monkeypatch):
+    relic_archive = codex("relic_archive")
+    assert _post(api, ["Oak Space Night: Cosmic Drift"], key="batch-0000").status_code == 201
+    # Indexes continue past a gap, so archive positions and indexes part ways
+    with open(relic_archive.JOURNAL_FILE + ".seq", "w") as f:
+        f.write("3")
+    with monkeypatch.context() as patch:
+        _fail_once(patch, api.idempotency, "commit_batch", on_call=2)
+        assert _post(api, TITLES).status_code == 500
+
+    response = _post(api, TITLES)
+
+    client = api.app.test_client()
+    assert response.get_json()["relic_ids"] == [f"RELIC-{i:03d}" for i in range(4, 9)]
+    for relic_id, title in zip(response.get_json()["relic_ids"], TITLES):
+        found = client.get(f"/relics/{relic_id}")
+        assert found.status_code == 200
+        assert (found.get_json()["relic_id"], found.get_json()["event"]) == (relic_id, title.partition(":")[0])
+
+def test_the_lookup_benchmark_reads_the_archive_it_just_wrote(codex, capsys):
+    codex_api = codex("codex_api")
+
+    # The gateway's watcher is already running on the empty archive
+    codex_api.benchmark(count=50, requests=20, contributors=5)
+
+    assert "50 relics, indexes built" in capsys.readouterr().out
@@ -0,0 +1,21 @@
+"""
+Codex Merge Engine: fused and unfused scrolls
+"""
+
+TITLE = "Oddyssey Noir: Sonic Gate Invocation"
+
+def test_fused_and_unfused_merges_build_the_same_scroll(codex):
+    codex_merge = codex("codex_merge")
+
+    fused = codex_merge.merge_codex(TITLE, contributor="Sun Ra")
+    unfused = codex_merge.merge_codex_unfused(TITLE, contributor="Sun Ra")
+
+    assert (fused["event"], fused["theme"]) == ("Oddyssey Noir", "Sonic Gate Invocation")
+    assert {**fused, "timestamp": None} == {**unfused, "timestamp": None}
+
+def test_benchmark_runs_both_paths(codex, capsys):
+    codex_merge = codex("codex_merge")
+
+    codex_merge.benchmark(sizes=(10,))
+
+    assert "10 relics" in capsys.readouterr().out
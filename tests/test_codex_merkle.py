@@ -0,0 +1,74 @@
+"""
+Codex Merkle Log: append-only Merkle tree over archive relics
+"""
+
+import os
+
+def leaves(count):
+    return [f"relic {i}".encode() for i in range(count)]
+
+def test_flush_appends_only_the_new_nodes(codex, tmp_path):
+    codex_merkle = codex("codex_merkle")
+    path = str(tmp_path / "codex.merkle")
+    log = codex_merkle.MerkleLog()
+    log.extend(leaves(8))
+    log.save(path)
+    saved = open(path, "rb").read()
+
+    log.append(b"relic 8")
+    log.flush(path)
+
+    grown = open(path, "rb").read()
+    assert grown.startswith(saved)
+    assert len(grown) - len(saved) == codex_merkle.NODE_RECORD  # leaf 8 closes no subtree
+    assert codex_merkle.MerkleLog.load(path).levels == log.levels
+
+def test_an_interrupted_flush_is_completed_on_load(codex, tmp_path):
+    codex_merkle = codex("codex_merkle")
+    path = str(tmp_path / "codex.merkle")
+    log = codex_merkle.MerkleLog()
+    log.extend(leaves(7))
+    log.save(path)
+    saved_size = os.path.getsize(path)
+    log.append(b"relic 7")
+    log.flush(path)
+    # Keep the new leaf and half of its first parent record, as if power failed mid-flush
+    with open(path, "r+b") as f:
+        f.truncate(saved_size + codex_merkle.NODE_RECORD + 10)
+
+    loaded = codex_merkle.MerkleLog.load(path)
+    assert loaded.root() == log.root()
+    loaded.append(b"relic 8")
+    loaded.flush(path)
+    log.append(b"relic 8")
+    assert codex_merkle.MerkleLog.load(path).levels == log.levels
+
+def test_archive_merkle_follows_appends_and_notices_rewrites(codex):
+    relic_archive = codex("relic_archive")
+    codex_merkle = codex("codex_merkle")
+    relic_archive.addmanytoarchive([f"Night {i}: Drift" for i in range(40)])
+    first = relic_archive.archive_merkle().root()
+
+    relic_archive.addtoarchive("Awaken Stars: Solar Bloom")
+    log = relic_archive.archive_merkle()
+    assert len(log) == 41 and log.root(40) == first
+    reloaded = codex_merkle.MerkleLog.load(relic_archive.MERKLE_FILE)
+    assert reloaded.root() == log.root()
+
+    archive = relic_archive.load_archive(mutable=True)
+    archive[3]["theme"] = "Tampered"
+    relic_archive.save_archive(archive)
+    rebuilt = relic_archive.archive_merkle()
+    assert len(rebuilt) == 41 and rebuilt.root(40) != first
+
+def test_prefix_root_matches_the_tree_at_every_size(codex, monkeypatch):
+    codex_merkle = codex("codex_merkle")
+    monkeypatch.setattr(codex_merkle, "SYNC_CHUNK", 3)
+    relics = [{"event": f"Night {i}"} for i in range(13)]
+    log = codex_merkle.MerkleLog()
+    log.extend(codex_merkle.relic_leaf(relic) for relic in relics)
+
+    def fetch(after, limit):
+        return relics[after:after + limit]
+
+    assert [codex_merkle.prefix_root(fetch, size) for size in range(14)] == [log.root(size) for size in range(14)]
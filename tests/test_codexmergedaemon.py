@@ -0,0 +1,44 @@
+"""
+Codex Merge Daemon: exit relics merged under a Merkle root
+"""
+
+import json
+
+def write_exits(directory, exit_hashes):
+    paths = []
+    for i, exit_hash in enumerate(exit_hashes):
+        path = directory / f"node{i}_exit.json"
+        path.write_text(json.dumps({
+            "node": f"node-{i}", "glyph": f"glyph-{i}", "overlay": f"overlay {i}", "exithash": exit_hash
+        }))
+        paths.append(str(path))
+    return paths
+
+def test_the_merkle_daemon_merges_enshrines_and_diffs_exit_relics(codex, tmp_path, capsys):
+    daemon_scroll = codex("codexmergedaemon")
+    codex_merkle = codex("codex_merkle")
+    (tmp_path / "relics").mkdir()
+    exits = write_exits(tmp_path / "relics", ["a1", "b2", "c3"])
+
+    daemon = daemon_scroll.MerkleMergeDaemon(
+        relic_paths=exits + [str(tmp_path / "relics" / "missing.json")],
+        merged_path="codex/mergedcodex.json",
+        html_output_path="codex/overlay_scroll.html"
+    )
+    daemon.absorb_relics()
+    daemon.enshrine_codex()
+    daemon.render_html_overlay()
+    daemon.broadcast_codex()
+
+    expected = codex_merkle.MerkleLog()
+    expected.extend([b"a1", b"b2", b"c3"])
+    merged = json.loads((tmp_path / "codex" / "mergedcodex.json").read_text())
+    assert merged["hashes"] == ["a1", "b2", "c3"]
+    assert merged["validated_glyphs"] == ["glyph-0", "glyph-1", "glyph-2"]
+    assert merged["merkle_root"] == expected.root_hex()
+    assert "<div class='neon-overlay'>overlay 2</div>" in (tmp_path / "codex" / "overlay_scroll.html").read_text()
+    assert "⚠️ Missing relic" in capsys.readouterr().out
+
+    other = daemon_scroll.MerkleMergeDaemon(write_exits(tmp_path, ["a1", "tampered", "c3", "d4"]), "other.json")
+    other.absorb_relics()
+    assert daemon.diverging_ranges(len(other.merkle), other.merkle.node_hashes) == [(1, 2), (3, 4)]
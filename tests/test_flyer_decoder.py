@@ -0,0 +1,52 @@
+"""
+Flyer Decoder: streaming HTML flyers into relics
+"""
+
+import hashlib
+
+FLYER_BATCH = """<!DOCTYPE html>
+<html>
+<head><title>Codex Gate: flyer batch</title></head>
+<body>
+  <nav><h1>Codex Gate</h1></nav>
+  <article>
+    <meta property="og:title" content="Oak Space Night">
+    <h1>Oak Space Night</h1>
+    <h2>Cosmic <em>Drift</em></h2>
+  </article>
+  <div class="flyer" data-event="Awaken Stars" data-theme="Solar Bloom">
+    <div><p>Doors at nine &amp; late</p></div>
+  </div>
+</body>
+</html>
+<html>
+<head>
+  <title>Oddyssey Noir</title>
+  <meta name="description" content="Night Drive">
+</head>
+<body><p>No headings here</p></body>
+</html>
+"""
+
+def test_an_html_batch_decodes_into_title_relics(codex, tmp_path):
+    flyer_decoder = codex("flyer_decoder")
+    batch = tmp_path / "flyers.html"
+    batch.write_text(FLYER_BATCH, encoding="utf-8")
+
+    # Chunks this small split tags and text across feeds
+    relics = list(flyer_decoder.decode_flyer_html(str(batch), chunk_size=7))
+
+    assert [(relic["event"], relic["theme"]) for relic in relics] == [
+        ("Oak Space Night", "Cosmic Drift"),
+        ("Awaken Stars", "Solar Bloom"),
+        ("Oddyssey Noir", "Night Drive"),
+    ]
+    for relic in relics:
+        title = f"{relic['event']}: {relic['theme']}"
+        assert relic["encoded_glyph"] == hashlib.sha256(title.encode()).hexdigest()
+        assert relic["status"] == "Decoded"
+    assert relics[0]["metadata"] == {"og:title": "Oak Space Night"}
+    assert relics[2]["metadata"] == {"description": "Night Drive"}
+    assert list(flyer_decoder.flyer_html_titles(str(batch))) == [
+        "Oak Space Night: Cosmic Drift", "Awaken Stars: Solar Bloom", "Oddyssey Noir: Night Drive"
+    ]
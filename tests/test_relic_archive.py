@@ -0,0 +1,134 @@
+"""
+Relic Archive Engine: journal, compaction and commits
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+def test_relics_land_in_the_journal_in_order(codex):
+    relic_archive = codex("relic_archive")
+    relic_archive.addtoarchive("Oak Space Night: Cosmic Drift")
+    relic_archive.addmanytoarchive(["Awaken Stars: Solar Bloom", "Oddyssey Noir: Night Drive"])
+
+    archive = relic_archive.load_archive()
+    assert [relic["event"] for relic in archive] == ["Oak Space Night", "Awaken Stars", "Oddyssey Noir"]
+    assert [relic["archivelog"]["index"] for relic in archive] == [1, 2, 3]
+
+def test_compaction_folds_the_journal_into_the_snapshot(codex):
+    relic_archive = codex("relic_archive")
+    relic_archive.addmanytoarchive(["Oak Space Night: Cosmic Drift", "Awaken Stars: Solar Bloom"])
+    before = relic_archive.load_archive(mutable=True)
+
+    relic_archive.compact_archive()
+    relic_archive.addtoarchive("Oddyssey Noir: Night Drive")
+
+    archive = relic_archive.load_archive(mutable=True)
+    assert archive[:2] == before
+    assert archive[2]["archivelog"]["index"] == 3
+
+def test_a_torn_final_line_is_ignored_on_read(codex):
+    relic_archive = codex("relic_archive")
+    relic_archive.addtoarchive("Oak Space Night: Cosmic Drift")
+    with open(relic_archive.JOURNAL_FILE, "a", encoding="utf-8") as f:
+        f.write('{"event": "Awaken St')
+
+    assert [relic["event"] for relic in relic_archive.load_archive()] == ["Oak Space Night"]
+
+def test_an_append_after_a_torn_line_starts_on_a_clean_line(codex):
+    relic_archive = codex("relic_archive")
+    relic_archive.addtoarchive("Oak Space Night: Cosmic Drift")
+    with open(relic_archive.JOURNAL_FILE, "a", encoding="utf-8") as f:
+        f.write('{"event": "Awaken St')
+
+    relic_archive.addmanytoarchive(["Awaken Stars: Solar Bloom", "Oddyssey Noir: Night Drive"])
+    relic_archive.invalidate_archive_cache()
+
+    archive = relic_archive.load_archive()
+    assert [relic["event"] for relic in archive] == ["Oak Space Night", "Awaken Stars", "Oddyssey Noir"]
+    with open(relic_archive.JOURNAL_FILE, "rb") as f:
+        assert f.read().count(b"\n") == 3
+
+def test_a_relic_that_cannot_be_encoded_fails_alone_and_takes_no_index(codex):
+    relic_archive = codex("relic_archive")
+    with pytest.raises(TypeError):
+        relic_archive.append_relics([{"event": object(), "archivelog": {}}])
+
+    relic_archive.addtoarchive("Oak Space Night: Cosmic Drift")
+
+    assert [relic["archivelog"]["index"] for relic in relic_archive.load_archive()] == [1]
+
+def test_a_sequence_left_behind_the_journal_never_reissues_an_index(codex):
+    relic_archive = codex("relic_archive")
+    relic_archive.addtoarchive("Oak Space Night: Cosmic Drift")
+    # The writer stopped after its lines were on disk, before the sequence caught up
+    with open(relic_archive.JOURNAL_FILE + ".seq", "w") as f:
+        f.write("0")
+
+    relic_archive.addtoarchive("Awaken Stars: Solar Bloom")
+
+    assert [relic["archivelog"]["index"] for relic in relic_archive.load_archive()] == [1, 2]
+
+def test_relic_ids_follow_archive_indexes_across_a_gap(codex):
+    relic_archive = codex("relic_archive")
+    store = codex("archive_store").open_store()
+    relic_archive.addtoarchive("Oak Space Night: Cosmic Drift")
+    # A journal written while indexes were reserved ahead of the lines can hold a gap
+    with open(relic_archive.JOURNAL_FILE + ".seq", "w") as f:
+        f.write("2")
+    relic_archive.addmanytoarchive(["Awaken Stars: Solar Bloom", "Oddyssey Noir: Night Drive"])
+
+    assert [(r["relic_id"], r["event"]) for r in store.all()] == [
+        ("RELIC-001", "Oak Space Night"), ("RELIC-003", "Awaken Stars"), ("RELIC-004", "Oddyssey Noir")
+    ]
+    assert store.get("RELIC-003")["event"] == "Awaken Stars" and store.get("RELIC-002") is None
+
+    # A compaction stopped after its snapshot swap leaves the rotated journal behind
+    shutil.copy(relic_archive.JOURNAL_FILE, relic_archive.COMPACTING_FILE + ".kept")
+    relic_archive.compact_archive()
+    os.replace(relic_archive.COMPACTING_FILE + ".kept", relic_archive.COMPACTING_FILE)
+    relic_archive.invalidate_archive_cache()
+
+    assert [r["archivelog"]["index"] for r in relic_archive.load_archive()] == [1, 3, 4]
+
+def test_search_pages_walk_the_matches_once(codex, monkeypatch):
+    relic_archive = codex("relic_archive")
+    relic_archive.addmanytoarchive([f"Night {i}: {'Stars' if i % 2 else 'Noir'}" for i in range(25)])
+    searches = []
+    search = relic_archive.RelicSearchIndex.search
+    monkeypatch.setattr(relic_archive.RelicSearchIndex, "search", lambda index, query: searches.append(query) or search(index, query))
+
+    after, seen, more = 0, [], True
+    while more:
+        total, page, more = relic_archive.search_page("stars", after=after, limit=5)
+        seen.extend(relic["event"] for relic in page)
+        after = page[-1]["archivelog"]["index"]
+    assert total == 12 and seen == [f"Night {i}" for i in range(1, 25, 2)]
+    assert searches == ["stars"]
+
+    relic_archive.addtoarchive("Night 25: Stars")
+    total, page, more = relic_archive.search_page("STARS", after=after)
+    assert (total, [relic["event"] for relic in page], more) == (13, ["Night 25"], False)
+    assert searches == ["stars", "STARS"]
+
+def test_search_follows_the_watched_snapshot_after_an_outside_write(codex):
+    relic_archive = codex("relic_archive")
+    store = codex("archive_store").open_store()
+    relic_archive.addmanytoarchive(["Oak Space Night: Cosmic Drift", "Oddyssey Noir: Night Drive"])
+    store.watch(interval=3600)
+    assert [relic["event"] for relic in relic_archive.search_archive("night")] == ["Oak Space Night", "Oddyssey Noir"]
+
+    # Another process writes; this one searches before and after its watcher picks the write up
+    subprocess.run(
+        [sys.executable, "-c", "import relic_archive; relic_archive.addtoarchive('Awaken Stars: Night Bloom')"],
+        env=dict(os.environ, PYTHONPATH=os.path.dirname(relic_archive.__file__)), check=True
+    )
+    assert len(relic_archive.search_archive("night")) == 2
+    store.refresh()
+
+    assert [relic["event"] for relic in store.page(after=2)] == ["Awaken Stars"]
+    assert [relic["event"] for relic in relic_archive.search_archive("night")] == ["Oak Space Night", "Oddyssey Noir", "Awaken Stars"]
+    assert relic_archive.search_page("bloom")[:2] == (1, store.page(after=2))
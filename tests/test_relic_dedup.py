@@ -0,0 +1,74 @@
+"""
+Glyph Ledger: dedup of archive commits by encoded_glyph
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+TITLES = [f"Night {i}: Drift" for i in range(5)]
+
+def test_a_duplicate_flyer_is_reported_not_returned(codex):
+    relic_archive = codex("relic_archive")
+
+    assert relic_archive.addtoarchive(TITLES[0])["event"] == "Night 0"
+    assert relic_archive.addtoarchive(TITLES[0]) is None
+    assert relic_archive.addmanytoarchive(TITLES[:2]) == [relic_archive.load_archive(mutable=True)[1]]
+    assert len(relic_archive.load_archive()) == 2
+
+def test_filling_the_ledger_resumes_after_a_crash(codex, monkeypatch):
+    relic_archive = codex("relic_archive")
+    relic_dedup = codex("relic_dedup")
+    monkeypatch.setattr(relic_archive, "DEDUP", False)
+    relic_archive.addmanytoarchive(TITLES)
+    monkeypatch.setattr(relic_archive, "DEDUP", True)
+    monkeypatch.setattr(relic_archive, "LEDGER_CHUNK", 2)
+
+    record = relic_dedup.GlyphLedger.record
+    def crash_on_second_chunk(ledger, glyphs, covered=None):
+        if covered == 4:
+            raise OSError("power lost")
+        return record(ledger, glyphs, covered)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(relic_dedup.GlyphLedger, "record", crash_on_second_chunk)
+        with pytest.raises(OSError):
+            relic_archive.addtoarchive("Awaken Stars: Solar Bloom")
+    relic_archive._ledger = None  # a new process opens the ledger again
+
+    assert relic_archive._glyph_ledger().covered() == 2
+    assert relic_archive.addtoarchive(TITLES[4]) is None
+    assert relic_archive._glyph_ledger().covered() == 5
+    assert len(relic_archive.load_archive()) == 5
+
+def test_a_batch_committed_but_never_recorded_is_caught_up(codex, monkeypatch):
+    relic_archive = codex("relic_archive")
+    relic_dedup = codex("relic_dedup")
+    relic_archive.addtoarchive(TITLES[0])
+
+    def crash_after_commit(ledger, glyphs, covered=None):
+        raise OSError("power lost")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(relic_dedup.GlyphLedger, "record", crash_after_commit)
+        with pytest.raises(OSError):
+            relic_archive.addtoarchive(TITLES[1])
+
+    assert relic_archive.addtoarchive(TITLES[1]) is None
+    assert [relic["event"] for relic in relic_archive.load_archive()] == ["Night 0", "Night 1"]
+
+def test_writer_threads_share_the_ledger(codex):
+    relic_archive = codex("relic_archive")
+    titles = [f"Night {i}: Drift" for i in range(40)]
+    assert relic_archive.DEDUP
+
+    def offer_all(offset):
+        return [relic_archive.addtoarchive(title) for title in titles[offset:] + titles[:offset]]
+
+    # Every thread offers every title; each is archived once, whichever thread gets there first
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(offer_all, range(0, 40, 10)))
+
+    archive = relic_archive.load_archive()
+    assert sorted(relic["event"] for relic in archive) == sorted(f"Night {i}" for i in range(40))
+    assert [relic["archivelog"]["index"] for relic in archive] == list(range(1, 41))
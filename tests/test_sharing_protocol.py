@@ -0,0 +1,43 @@
+"""
+Codex Sharing Protocol: store-backed transmissions
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import relic
+
+def test_transmit_codex_exports_and_logs_the_matching_relics(codex):
+    relic_archive = codex("relic_archive")
+    sharing_protocol = codex("sharing_protocol")
+    relic_archive.addtoarchive("Oak Space Night: Cosmic Stars", contributor="OMEGA")
+    relic_archive.addtoarchive("Awaken Stars: Solar Bloom", contributor="Sun Ra")
+    relic_archive.addtoarchive("Oddyssey Noir: Night Drive", contributor="OMEGA")
+
+    sharing_protocol.transmit_codex(contributor="OMEGA", theme="Stars")
+
+    with open("shared_codex/transmission_OMEGA_Stars.json") as f:
+        transmitted = json.load(f)
+    assert [(relic["event"], relic["transmission_tag"]) for relic in transmitted] == [
+        ("Oak Space Night", "TX-OMEGA-STARS-001")
+    ]
+    with open(sharing_protocol.LOG_FILE) as f:
+        assert json.load(f)[0]["relics_transmitted"] == 1
+    assert "transmission_tag" not in relic_archive.load_archive()[0]
+
+def test_exports_are_atomic_and_parallel_logs_all_land(codex):
+    sharing_protocol = codex("sharing_protocol")
+
+    path = sharing_protocol.export_relics([relic("Oak Space Night")], "oak.json")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: sharing_protocol.log_transmission(path, f"node-{i}", None, 1), range(16)))
+
+    assert path == os.path.join(sharing_protocol.SHARE_FOLDER, "oak.json")
+    with open(path) as f:
+        assert [transmitted["event"] for transmitted in json.load(f)] == ["Oak Space Night"]
+    assert not [name for name in os.listdir(sharing_protocol.SHARE_FOLDER) if name != "oak.json"]
+    with open(sharing_protocol.LOG_FILE) as f:
+        log = json.load(f)
+    assert sorted(entry["contributor"] for entry in log) == sorted(f"node-{i}" for i in range(16))
+    assert {(entry["file"], entry["theme"], entry["status"]) for entry in log} == {(path, "All", "Transmitted")}